@@ -0,0 +1,397 @@
+"""Annotate tabular and VCF files with normalized gene concepts in bulk."""
+
+import csv
+import gzip
+import logging
+import multiprocessing
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from enum import StrEnum
+from pathlib import Path
+from typing import IO, NamedTuple
+
+from gene.database import create_db
+from gene.query import QueryHandler
+from gene.schemas import MatchType
+
+_logger = logging.getLogger(__name__)
+
+
+class FileFormat(StrEnum):
+    """Define supported input/output file formats."""
+
+    TSV = "tsv"
+    CSV = "csv"
+    VCF = "vcf"
+
+
+_FORMAT_SUFFIXES = {
+    ".tsv": FileFormat.TSV,
+    ".txt": FileFormat.TSV,
+    ".csv": FileFormat.CSV,
+    ".vcf": FileFormat.VCF,
+}
+
+_GZIP_SUFFIXES = {".gz", ".bgz"}
+
+# names of columns appended to TSV/CSV output
+ANNOTATION_COLUMNS = ("gene_normalized_id", "gene_symbol", "gene_match_type")
+
+# IDs, types, and descriptions of INFO fields added to VCF output
+VCF_INFO_FIELDS = (
+    ("GENE_NORM_ID", "String", "Normalized gene concept ID"),
+    ("GENE_NORM_SYMBOL", "String", "Normalized gene symbol"),
+    ("GENE_NORM_MATCH", "Integer", "Gene Normalizer match type"),
+)
+
+
+class Annotation(NamedTuple):
+    """Describe the normalized concept matching a single input value."""
+
+    normalized_id: str | None
+    symbol: str | None
+    match_type: MatchType
+
+
+def infer_format(path: Path) -> FileFormat:
+    """Infer file format from a file name, ignoring any gzip suffix.
+
+    :param path: path to input or output file
+    :return: file format
+    :raise ValueError: if the file extension is not recognized
+    """
+    suffixes = [s.lower() for s in path.suffixes]
+    if suffixes and suffixes[-1] in _GZIP_SUFFIXES:
+        suffixes.pop()
+    if suffixes and suffixes[-1] in _FORMAT_SUFFIXES:
+        return _FORMAT_SUFFIXES[suffixes[-1]]
+    err_msg = f"Unable to infer file format from file name: {path.name}"
+    raise ValueError(err_msg)
+
+
+def _open(path: Path, mode: str) -> IO[str]:
+    """Open a text file, transparently (de)compressing it if it has a gzip suffix.
+
+    :param path: path to file
+    :param mode: ``"r"`` or ``"w"``
+    :return: text file object
+    """
+    if path.suffix.lower() in _GZIP_SUFFIXES:
+        return gzip.open(path, f"{mode}t", newline="")
+    return path.open(mode, newline="")
+
+
+def _get_delimiter(file_format: FileFormat) -> str:
+    return "," if file_format == FileFormat.CSV else "\t"
+
+
+def _get_column_index(header: list[str], column: str) -> int:
+    """Find the position of a named column.
+
+    :param header: header row
+    :param column: name of column to find
+    :return: index of column
+    :raise ValueError: if the column isn't present
+    """
+    try:
+        return header.index(column)
+    except ValueError:
+        err_msg = f"Column '{column}' not found in header: {header}"
+        raise ValueError(err_msg) from None
+
+
+def _parse_info(info: str) -> list[list[str]]:
+    """Split a VCF INFO field into ``[key]`` and ``[key, value]`` entries.
+
+    :param info: raw INFO column value
+    :return: list of entries
+    """
+    if info == ".":
+        return []
+    return [entry.split("=", 1) for entry in info.split(";")]
+
+
+def _get_info_values(info: str, key: str) -> list[str]:
+    """Get the (comma-separated) values of an INFO key.
+
+    :param info: raw INFO column value
+    :param key: INFO key to get values for
+    :return: list of values, which is empty if the key is absent or is a flag
+    """
+    for entry in _parse_info(info):
+        if entry[0] == key and len(entry) == 2:  # noqa: PLR2004
+            return entry[1].split(",")
+    return []
+
+
+def _read_rows(file: IO[str], file_format: FileFormat) -> Iterator[list[str]]:
+    """Iterate over rows of a delimited file.
+
+    :param file: open input file
+    :param file_format: TSV or CSV
+    :return: generator of rows, beginning with the header
+    """
+    return csv.reader(file, delimiter=_get_delimiter(file_format))
+
+
+def read_terms(path: Path, column: str, file_format: FileFormat) -> set[str]:
+    """Get the distinct values of a column (or VCF INFO key) in a file.
+
+    :param path: path to input file
+    :param column: name of a TSV/CSV column, or a VCF INFO key
+    :param file_format: input file format
+    :return: set of distinct, non-empty values
+    """
+    terms = set()
+    with _open(path, "r") as f:
+        if file_format == FileFormat.VCF:
+            for line in f:
+                if line.startswith("#"):
+                    continue
+                fields = line.rstrip("\r\n").split("\t")
+                if len(fields) > 7:  # noqa: PLR2004
+                    terms.update(
+                        value
+                        for value in _get_info_values(fields[7], column)
+                        if value not in {"", "."}
+                    )
+        else:
+            rows = _read_rows(f, file_format)
+            index = _get_column_index(next(rows, []), column)
+            terms.update(row[index] for row in rows if len(row) > index and row[index])
+    return terms
+
+
+def _annotate_terms(handler: QueryHandler, terms: list[str]) -> list[Annotation]:
+    """Normalize a list of terms.
+
+    :param handler: query handler to normalize with
+    :param terms: terms to normalize
+    :return: annotations, in the same order as the given terms
+    """
+    annotations = []
+    for response in handler.normalize_batch(terms):
+        if response.gene:
+            annotation = Annotation(
+                response.gene.primaryCoding.id, response.gene.name, response.match_type
+            )
+        else:
+            annotation = Annotation(None, None, response.match_type)
+        annotations.append(annotation)
+    return annotations
+
+
+_worker_state: dict[str, QueryHandler] = {}
+
+
+def _initialize_worker(db_url: str | None) -> None:
+    """Open a database connection for the current worker process.
+
+    :param db_url: URL to normalizer database
+    """
+    _worker_state["handler"] = QueryHandler(create_db(db_url))
+
+
+def _annotate_chunk(terms: list[str]) -> list[Annotation]:
+    """Normalize a chunk of terms using the current worker's query handler.
+
+    :param terms: terms to normalize
+    :return: annotations, in the same order as the given terms
+    """
+    return _annotate_terms(_worker_state["handler"], terms)
+
+
+def _chunk(terms: list[str], chunk_size: int) -> Iterator[list[str]]:
+    for i in range(0, len(terms), chunk_size):
+        yield terms[i : i + chunk_size]
+
+
+def normalize_terms(
+    terms: Iterable[str],
+    db_url: str | None = None,
+    processes: int = 1,
+    chunk_size: int = 1000,
+) -> dict[str, Annotation]:
+    """Normalize a collection of terms, optionally across a pool of worker processes.
+
+    Each worker opens its own database connection and normalizes chunks of terms with
+    :py:meth:`gene.query.QueryHandler.normalize_batch`. Worker processes are started
+    with the ``spawn`` method, so that they never inherit database client state from
+    the parent process.
+
+    :param terms: distinct terms to normalize
+    :param db_url: URL to normalizer database
+    :param processes: number of worker processes. If 1, normalize in the current
+        process.
+    :param chunk_size: number of terms sent to a worker at a time
+    :return: mapping from each term to its annotation
+    """
+    chunks = list(_chunk(sorted(terms), chunk_size))
+    annotations = {}
+    with ExitStack() as stack:
+        if processes == 1:
+            db = create_db(db_url)
+            stack.callback(db.close_connection)
+            handler = QueryHandler(db)
+            results = (_annotate_terms(handler, chunk) for chunk in chunks)
+        else:
+            executor = stack.enter_context(
+                ProcessPoolExecutor(
+                    max_workers=processes,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_initialize_worker,
+                    initargs=(db_url,),
+                )
+            )
+            results = executor.map(_annotate_chunk, chunks)
+        for chunk, chunk_annotations in zip(chunks, results, strict=True):
+            annotations.update(zip(chunk, chunk_annotations, strict=True))
+            _logger.debug("Normalized %i terms", len(annotations))
+    return annotations
+
+
+def _format_annotation(annotation: Annotation | None, missing: str) -> list[str]:
+    """Format an annotation as output column values.
+
+    :param annotation: annotation to format, or None if there isn't one
+    :param missing: placeholder for absent values
+    :return: normalized ID, symbol, and match type values
+    """
+    if annotation is None:
+        return [missing] * len(ANNOTATION_COLUMNS)
+    return [
+        annotation.normalized_id or missing,
+        annotation.symbol or missing,
+        str(int(annotation.match_type)),
+    ]
+
+
+def _format_vcf_info(info: str, column: str, annotations: dict[str, Annotation]) -> str:
+    """Add normalization fields to a VCF INFO column value.
+
+    :param info: raw INFO column value
+    :param column: INFO key containing gene terms
+    :param annotations: mapping from terms to annotations
+    :return: updated INFO column value
+    """
+    values = _get_info_values(info, column)
+    if not values:
+        return info
+    field_ids = [field_id for field_id, _, _ in VCF_INFO_FIELDS]
+    entries = [entry for entry in _parse_info(info) if entry[0] not in field_ids]
+    columns = zip(
+        *(_format_annotation(annotations.get(value), ".") for value in values),
+        strict=True,
+    )
+    entries += [
+        [field_id, ",".join(column_values)]
+        for field_id, column_values in zip(field_ids, columns, strict=True)
+    ]
+    return ";".join("=".join(entry) for entry in entries)
+
+
+def _write_vcf(
+    infile: IO[str],
+    outfile: IO[str],
+    column: str,
+    annotations: dict[str, Annotation],
+) -> None:
+    for line in infile:
+        if line.startswith("##"):
+            outfile.write(line)
+        elif line.startswith("#"):
+            for field_id, field_type, description in VCF_INFO_FIELDS:
+                outfile.write(
+                    f'##INFO=<ID={field_id},Number=.,Type={field_type},Description="{description}">\n'
+                )
+            outfile.write(line)
+        else:
+            fields = line.rstrip("\r\n").split("\t")
+            if len(fields) > 7:  # noqa: PLR2004
+                fields[7] = _format_vcf_info(fields[7], column, annotations)
+            outfile.write("\t".join(fields) + "\n")
+
+
+def _write_delimited(
+    infile: IO[str],
+    outfile: IO[str],
+    column: str,
+    annotations: dict[str, Annotation],
+    file_format: FileFormat,
+) -> None:
+    rows = _read_rows(infile, file_format)
+    header = next(rows, [])
+    index = _get_column_index(header, column)
+    writer = csv.writer(
+        outfile, delimiter=_get_delimiter(file_format), lineterminator="\n"
+    )
+    writer.writerow(header + list(ANNOTATION_COLUMNS))
+    for row in rows:
+        annotation = annotations.get(row[index]) if len(row) > index else None
+        writer.writerow(row + _format_annotation(annotation, ""))
+
+
+def write_annotated(
+    infile: Path,
+    outfile: Path,
+    column: str,
+    annotations: dict[str, Annotation],
+    file_format: FileFormat,
+) -> None:
+    """Stream a copy of an input file with normalization results added to each row.
+
+    TSV/CSV rows gain the columns named in :py:const:`ANNOTATION_COLUMNS`. VCF
+    records gain the INFO fields described in :py:const:`VCF_INFO_FIELDS`, with one
+    comma-separated value per value of the source INFO key (``.`` if unmatched).
+
+    :param infile: path to input file
+    :param outfile: path to output file. Written gzip-compressed if it has a gzip
+        suffix.
+    :param column: name of a TSV/CSV column, or a VCF INFO key
+    :param annotations: mapping from terms to annotations, as produced by
+        :py:func:`normalize_terms`
+    :param file_format: input file format
+    """
+    with _open(infile, "r") as in_f, _open(outfile, "w") as out_f:
+        if file_format == FileFormat.VCF:
+            _write_vcf(in_f, out_f, column, annotations)
+        else:
+            _write_delimited(in_f, out_f, column, annotations, file_format)
+
+
+def annotate_file(
+    infile: Path,
+    outfile: Path,
+    column: str,
+    file_format: FileFormat | None = None,
+    db_url: str | None = None,
+    processes: int = 1,
+    chunk_size: int = 1000,
+) -> int:
+    """Normalize the gene terms in one column of a file and write an annotated copy.
+
+    The input is read twice: once to collect the distinct terms, which are normalized
+    once each, and once to write the annotated output, one row at a time.
+
+    >>> from pathlib import Path
+    >>> from gene.annotate import annotate_file
+    >>> annotate_file(Path("variants.tsv"), Path("annotated.tsv"), "gene", processes=8)
+    1234
+
+    :param infile: path to input file
+    :param outfile: path to output file
+    :param column: name of a TSV/CSV column, or a VCF INFO key
+    :param file_format: input file format. Inferred from ``infile`` if not given.
+    :param db_url: URL to normalizer database
+    :param processes: number of worker processes
+    :param chunk_size: number of terms sent to a worker at a time
+    :return: number of distinct terms normalized
+    """
+    if file_format is None:
+        file_format = infer_format(infile)
+    terms = read_terms(infile, column, file_format)
+    _logger.info("Normalizing %i distinct terms from %s", len(terms), infile)
+    annotations = normalize_terms(terms, db_url, processes, chunk_size)
+    write_annotated(infile, outfile, column, annotations, file_format)
+    return len(terms)
@@ -0,0 +1,180 @@
+"""Provide a Bloom filter of every searchable gene term, used to skip database
+lookups for queries that can't match anything.
+"""
+
+import logging
+import math
+import struct
+from collections.abc import Iterable
+from hashlib import blake2b
+from timeit import default_timer as timer
+
+from gene import ITEM_TYPES
+from gene.database import AbstractDatabase
+from gene.schemas import RecordType
+
+_logger = logging.getLogger(__name__)
+
+
+# magic bytes, number of hash functions, number of bits, length of data version
+_HEADER = struct.Struct(">4sBQI")
+_MAGIC = b"GNBF"
+
+
+class BloomFilter:
+    """Probabilistic set of lowercased concept IDs and terms (symbols, previous
+    symbols, aliases, xrefs, and associated_with values).
+
+    Membership tests never return false negatives, so a query that isn't in the
+    filter is known not to match any record, and can skip the database entirely.
+    Queries that are in the filter may still not match (at roughly the configured
+    false positive rate):
+
+    >>> from gene.bloom import BloomFilter
+    >>> from gene.database import create_db
+    >>> term_filter = BloomFilter.from_database(create_db())
+    >>> "braf" in term_filter
+    True
+
+    Filters are tagged with the data version they were built from, so that callers
+    can ignore a filter that doesn't reflect the currently-loaded data.
+    """
+
+    def __init__(self, num_bits: int, num_hashes: int, data_version: str = "") -> None:
+        """Initialize empty filter.
+
+        :param num_bits: size of bit array
+        :param num_hashes: number of bit positions set per item
+        :param data_version: identifier for the data version that items are drawn from
+        :raise ValueError: if either size parameter is less than 1
+        """
+        if num_bits < 1 or num_hashes < 1:
+            err_msg = f"Filter must have at least 1 bit and 1 hash function, got {num_bits} and {num_hashes}"
+            raise ValueError(err_msg)
+        self.num_bits = num_bits
+        self.num_hashes = num_hashes
+        self.data_version = data_version
+        self._bits = bytearray((num_bits + 7) // 8)
+
+    @classmethod
+    def from_items(
+        cls,
+        items: Iterable[str],
+        data_version: str = "",
+        false_positive_rate: float = 0.01,
+    ) -> "BloomFilter":
+        """Build a filter sized for a collection of items.
+
+        :param items: items to add
+        :param data_version: identifier for the data version that items are drawn from
+        :param false_positive_rate: target probability that an absent item is reported
+            as present
+        :return: filter containing every item
+        """
+        items = set(items)
+        n = max(len(items), 1)
+        num_bits = math.ceil(-n * math.log(false_positive_rate) / math.log(2) ** 2)
+        num_hashes = max(round(num_bits / n * math.log(2)), 1)
+        bloom_filter = cls(num_bits, num_hashes, data_version)
+        for item in items:
+            bloom_filter.add(item)
+        return bloom_filter
+
+    @classmethod
+    def from_database(
+        cls, database: AbstractDatabase, false_positive_rate: float = 0.01
+    ) -> "BloomFilter":
+        """Build a filter of every term that queries are looked up by: all identity
+        and merged record concept IDs, plus every term field of identity records, all
+        lowercased.
+
+        :param database: database to read records from
+        :param false_positive_rate: target probability that an absent term is reported
+            as present
+        :return: constructed filter, tagged with the database's current data version
+        """
+        start = timer()
+        data_version = database.get_data_version()
+        terms = set()
+        for record in database.get_all_records(RecordType.IDENTITY):
+            terms.add(record["concept_id"].lower())
+            for field in ITEM_TYPES:
+                values = record.get(field) or []
+                if isinstance(values, str):
+                    values = [values]
+                terms.update(value.lower() for value in values)
+        for record in database.get_all_records(RecordType.MERGER):
+            terms.add(record["concept_id"].lower())
+        bloom_filter = cls.from_items(terms, data_version, false_positive_rate)
+        _logger.info(
+            "Built term filter of %i terms (%i bits) in %.2f seconds",
+            len(terms),
+            bloom_filter.num_bits,
+            timer() - start,
+        )
+        return bloom_filter
+
+    def _get_positions(self, item: str) -> list[int]:
+        """Get bit positions for an item, by double hashing.
+
+        :param item: item to hash
+        :return: ``num_hashes`` bit positions
+        """
+        digest = blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "big")
+        h2 = int.from_bytes(digest[8:], "big") | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    def add(self, item: str) -> None:
+        """Add an item to the filter.
+
+        :param item: item to add
+        """
+        for position in self._get_positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, item: str) -> bool:
+        """Check whether an item might have been added to the filter.
+
+        :param item: item to check
+        :return: False if the item was definitely not added, True otherwise
+        """
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._get_positions(item)
+        )
+
+    def to_bytes(self) -> bytes:
+        """Serialize filter for storage.
+
+        :return: filter parameters, data version, and bit array
+        """
+        version = self.data_version.encode()
+        header = _HEADER.pack(_MAGIC, self.num_hashes, self.num_bits, len(version))
+        return header + version + bytes(self._bits)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "BloomFilter":
+        """Deserialize a filter created by :py:meth:`to_bytes`.
+
+        :param data: serialized filter
+        :return: filter
+        :raise ValueError: if data isn't a complete serialized filter
+        """
+        try:
+            magic, num_hashes, num_bits, version_length = _HEADER.unpack_from(data)
+        except struct.error as e:
+            err_msg = "Serialized filter header is incomplete"
+            raise ValueError(err_msg) from e
+        if magic != _MAGIC:
+            err_msg = "Data isn't a serialized filter"
+            raise ValueError(err_msg)
+        bloom_filter = cls(num_bits, num_hashes)
+        start = _HEADER.size + version_length
+        bits = data[start:]
+        if len(bits) != len(bloom_filter._bits):
+            err_msg = f"Expected {len(bloom_filter._bits)} bytes of filter data, got {len(bits)}"
+            raise ValueError(err_msg)
+        bloom_filter.data_version = data[_HEADER.size : start].decode()
+        bloom_filter._bits = bytearray(bits)
+        return bloom_filter
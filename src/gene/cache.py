@@ -0,0 +1,319 @@
+"""Provide in-process caches for query responses and source metadata, and
+coalescing of concurrent identical queries.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, Generic, TypeVar
+
+from pydantic import BaseModel
+
+from gene.schemas import SourceMeta
+
+_logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class CacheStats(BaseModel):
+    """Describe usage counters for a response cache."""
+
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+    size: int
+    max_size: int
+
+
+class ResponseCache:
+    """Bounded least-recently-used cache with optional per-entry expiration.
+
+    Owners report the version of the currently-loaded data with :py:meth:`set_version`,
+    and the cache drops every entry whenever that version changes (e.g. after a source
+    is reloaded):
+
+    >>> from gene.cache import ResponseCache
+    >>> cache = ResponseCache(1024, ttl=3600)
+    >>> cache.set_version(db.get_data_version())
+
+    :py:class:`QueryHandler <gene.query.QueryHandler>` does this whenever it checks
+    the data version. The cache is safe to share between threads.
+    """
+
+    def __init__(self, max_size: int, ttl: float | None = None) -> None:
+        """Initialize cache.
+
+        :param max_size: maximum number of entries to retain
+        :param ttl: number of seconds after which an entry expires. Entries never
+            expire if None.
+        :raise ValueError: if ``max_size`` is less than 1
+        """
+        if max_size < 1:
+            err_msg = f"Cache size must be at least 1, got {max_size}"
+            raise ValueError(err_msg)
+        self.max_size = max_size
+        self.ttl = ttl
+        self._version: str | None = None
+        self._entries: OrderedDict[Hashable, tuple[Any, float | None]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    def set_version(self, version: str) -> None:
+        """Record the current data version, dropping all entries if it has changed.
+
+        :param version: identifier for the current data version
+        """
+        with self._lock:
+            if version == self._version:
+                return
+            if self._version is not None:
+                _logger.info(
+                    "Data version changed from %s to %s; clearing response cache",
+                    self._version,
+                    version,
+                )
+                self._invalidations += 1
+            self._entries.clear()
+            self._version = version
+
+    def get(self, key: Hashable) -> Any | None:  # noqa: ANN401
+        """Retrieve a cached value.
+
+        :param key: cache key
+        :return: cached value if present and unexpired, None otherwise
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires = entry
+                if expires is None or expires > now:
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return value
+                del self._entries[key]
+            self._misses += 1
+            return None
+
+    def set(self, key: Hashable, value: Any) -> None:  # noqa: ANN401
+        """Store a value, evicting the least recently used entry if the cache is full.
+
+        :param key: cache key
+        :param value: value to store
+        """
+        now = time.monotonic()
+        expires = now + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._entries[key] = (value, expires)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        """Remove all entries. Usage counters are retained."""
+        with self._lock:
+            self._entries.clear()
+
+    @property
+    def stats(self) -> CacheStats:
+        """Get current cache usage counters.
+
+        :return: hit, miss, eviction, and invalidation counts, plus current size
+        """
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                invalidations=self._invalidations,
+                size=len(self._entries),
+                max_size=self.max_size,
+            )
+
+
+class SourceMetadataSnapshot:
+    """Metadata for every loaded source, held as prebuilt ``SourceMeta`` objects and
+    tagged with the data version it was read at.
+
+    Owners are expected to periodically fetch the current data version, and to
+    reload metadata whenever it differs from the snapshot's:
+
+    >>> from gene.cache import SourceMetadataSnapshot
+    >>> snapshot = SourceMetadataSnapshot(version_check_interval=60)
+    >>> if snapshot.version_check_due():
+    ...     version = db.get_data_version()
+    ...     if not snapshot.is_current(version):
+    ...         snapshot.update(version, load_metadata())
+
+    Updates replace the whole mapping of sources at once, so readers in other threads
+    always see a complete snapshot.
+    """
+
+    def __init__(self, version_check_interval: float = 60.0) -> None:
+        """Initialize empty snapshot.
+
+        :param version_check_interval: minimum number of seconds between data version
+            checks
+        """
+        self.version_check_interval = version_check_interval
+        self.version: str | None = None
+        self.sources: dict[str, SourceMeta] = {}
+        self._last_version_check: float | None = None
+
+    def version_check_due(self) -> bool:
+        """Check whether the data version should be checked again.
+
+        :return: True if the snapshot is empty, or if the version check interval has
+            elapsed since the last check
+        """
+        return (
+            self.version is None
+            or self._last_version_check is None
+            or time.monotonic() - self._last_version_check
+            >= self.version_check_interval
+        )
+
+    def is_current(self, version: str) -> bool:
+        """Record a version check, and compare the checked version to the snapshot's.
+
+        :param version: identifier for the current data version
+        :return: True if the snapshot was read at the given version
+        """
+        self._last_version_check = time.monotonic()
+        return version == self.version
+
+    def update(self, version: str, sources: dict[str, SourceMeta]) -> None:
+        """Replace snapshot contents.
+
+        :param version: identifier for the data version that metadata was read at
+        :param sources: mapping from source names to their metadata
+        """
+        if self.version is not None:
+            _logger.info(
+                "Data version changed from %s to %s; reloaded source metadata",
+                self.version,
+                version,
+            )
+        self.sources = sources
+        self.version = version
+        self._last_version_check = time.monotonic()
+
+
+class _Call(Generic[T]):
+    """Track the outcome of an in-flight call shared by :py:class:`SingleFlight`."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.value: T | None = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight(Generic[T]):
+    """Coalesce concurrent calls that share a key into a single execution.
+
+    The first thread to call :py:meth:`do` with a given key runs the function, and
+    any other threads calling with the same key while it runs wait for, and share,
+    its result (or exception):
+
+    >>> from gene.cache import SingleFlight
+    >>> flight = SingleFlight()
+    >>> value, shared = flight.do(("normalize", "egfr"), lambda: q.normalize("EGFR"))
+
+    Results are not retained once the call completes; combine with
+    :py:class:`ResponseCache` to reuse them afterwards.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with no calls in flight."""
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call[T]] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> tuple[T, bool]:
+        """Run a function, unless a call with the same key is already in flight, in
+        which case wait for that call's result instead.
+
+        :param key: identifier for the call
+        :param fn: function to run
+        :return: function result, and whether it was shared from another thread's call
+        :raise: any exception raised by the function
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.value, True
+
+        try:
+            call.value = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.value, False
+
+
+class AsyncSingleFlight(Generic[T]):
+    """Coalesce concurrent coroutine calls that share a key into a single execution.
+
+    Asynchronous counterpart to :py:class:`SingleFlight`, for use within a single
+    event loop:
+
+    >>> from gene.cache import AsyncSingleFlight
+    >>> flight = AsyncSingleFlight()
+    >>> value, shared = await flight.do(
+    ...     ("normalize", "egfr"), lambda: q.normalize("EGFR")
+    ... )
+
+    The shared call runs as its own task, so cancelling any one caller doesn't cancel
+    it for the others.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with no calls in flight."""
+        self._tasks: dict[Hashable, asyncio.Task[T]] = {}
+
+    def _forget(self, key: Hashable, task: asyncio.Task[T]) -> None:
+        """Remove a completed call.
+
+        :param key: identifier for the call
+        :param task: completed task
+        """
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        if not task.cancelled():
+            # mark exception as retrieved, in case every caller was cancelled
+            task.exception()
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> tuple[T, bool]:
+        """Await a coroutine function, unless a call with the same key is already in
+        flight, in which case await that call's result instead.
+
+        :param key: identifier for the call
+        :param fn: coroutine function to call
+        :return: coroutine result, and whether it was shared from another caller
+        :raise: any exception raised by the coroutine
+        """
+        task = self._tasks.get(key)
+        shared = task is not None
+        if not shared:
+            task = asyncio.ensure_future(fn())
+            self._tasks[key] = task
+            task.add_done_callback(lambda t: self._forget(key, t))
+        return await asyncio.shield(task), shared
@@ -1,5 +1,6 @@
 """Provides a CLI util to make updates to normalizer database."""
 
+import contextlib
 import datetime
 import json
 import logging
@@ -9,6 +10,7 @@ from pathlib import Path
 import click
 
 from gene import __version__
+from gene.annotate import FileFormat, annotate_file, infer_format
 from gene.config import get_config
 from gene.database.database import DatabaseException, create_db
 from gene.schemas import RecordType, SourceName
@@ -171,6 +173,12 @@ def dump_database(output_directory: Path, db_url: str, silent: bool) -> None:
     default=False,
     help="Use most recent locally-available source data instead of fetching latest version",
 )
+@click.option(
+    "--staged",
+    is_flag=True,
+    default=False,
+    help="Load data into a staging copy of the database, and swap it in atomically once complete (PostgreSQL only)",
+)
 @click.option("--silent", is_flag=True, default=False, help=SILENT_MODE_DESCRIPTION)
 def update(
     sources: tuple[str, ...],
@@ -179,6 +187,7 @@ def update(
     all_: bool,
     normalize: bool,
     use_existing: bool,
+    staged: bool,
     silent: bool,
 ) -> None:
     """Update provided normalizer SOURCES in the gene database.
@@ -202,6 +211,12 @@ def update(
 
         $ gene-normalizer update --all --use_existing
 
+    With PostgreSQL, use the --staged flag to write data into a staging schema, and
+    replace the existing data in a single transaction once the update is complete,
+    so that the database can keep serving queries throughout:
+
+        $ gene-normalizer update --all --normalize --staged
+
     \f
     :param sources: tuple of raw names of sources to update
     :param aws_instance: if true, use cloud instance
@@ -209,6 +224,8 @@ def update(
     :param all_: if True, update all sources (ignore ``sources``)
     :param normalize: if True, update normalized records
     :param use_existing: if True, use most recent local data instead of fetching latest version
+    :param staged: if True, write to a staging copy of the database and swap it in
+        once complete
     :param silent: if True, suppress console output
     """  # noqa: D301
     _initialize_app()
@@ -220,6 +237,21 @@ def update(
         click.echo(ctx.get_help())
         ctx.exit(1)
 
+    parsed_sources = set()
+    if all_:
+        parsed_sources = set(SourceName)
+    elif sources:
+        failed_source_names = []
+        for source in sources:
+            try:
+                parsed_sources.add(SourceName[source.upper()])
+            except KeyError:
+                failed_source_names.append(source)
+        if len(failed_source_names) != 0:
+            click.echo(f"Error: unrecognized sources: {failed_source_names}")
+            click.echo(f"Valid source options are {list(SourceName)}")
+            click.get_current_context().exit(1)
+
     db = create_db(db_url, aws_instance)
 
     processed_ids = None
@@ -234,31 +266,31 @@ def update(
             f"Encountered ImportError: {e.msg}. Updating source data requires the optional [etl] dependency group. See the 'Full Installation' instructions in the documentation."
         )
         click.get_current_context().exit(1)
-    if all_:
-        processed_ids = update_all_sources(db, use_existing, silent=silent)
-    elif sources:
-        parsed_sources = set()
-        failed_source_names = []
-        for source in sources:
-            try:
-                parsed_sources.add(SourceName[source.upper()])
-            except KeyError:
-                failed_source_names.append(source)
-        if len(failed_source_names) != 0:
-            click.echo(f"Error: unrecognized sources: {failed_source_names}")
-            click.echo(f"Valid source options are {list(SourceName)}")
-            click.get_current_context().exit(1)
 
-        working_processed_ids = set()
-        for source_name in parsed_sources:
-            working_processed_ids |= update_source(
-                source_name, db, use_existing=use_existing, silent=silent
+    update_context = contextlib.nullcontext()
+    if staged:
+        try:
+            update_context = db.staged_update(parsed_sources)
+        except NotImplementedError:
+            click.echo(
+                f"Error: Staged updates not supported for {db.__class__.__name__}"
             )
-        if len(sources) == len(SourceName):
-            processed_ids = working_processed_ids
+            click.get_current_context().exit(1)
+
+    with update_context:
+        if all_:
+            processed_ids = update_all_sources(db, use_existing, silent=silent)
+        elif sources:
+            working_processed_ids = set()
+            for source_name in parsed_sources:
+                working_processed_ids |= update_source(
+                    source_name, db, use_existing=use_existing, silent=silent
+                )
+            if len(sources) == len(SourceName):
+                processed_ids = working_processed_ids
 
-    if normalize:
-        update_normalized(db, processed_ids, silent=silent)
+        if normalize:
+            update_normalized(db, processed_ids, silent=silent)
 
 
 @cli.command()
@@ -319,5 +351,99 @@ def dump_mappings(
             f.write("\n")
 
 
+@cli.command()
+@click.argument("infile", type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.argument("outfile", type=click.Path(dir_okay=False, path_type=Path))
+@click.option(
+    "--column",
+    "-c",
+    required=True,
+    help="Name of the TSV/CSV column, or the VCF INFO key, containing gene terms.",
+)
+@click.option(
+    "--format",
+    "file_format",
+    type=click.Choice(list(FileFormat), case_sensitive=False),
+    help="Input file format. Inferred from the INFILE extension if not given.",
+)
+@click.option("--db_url", help=URL_DESCRIPTION)
+@click.option(
+    "--processes",
+    "-p",
+    type=click.IntRange(min=1),
+    default=os.cpu_count() or 1,
+    show_default="number of CPUs",
+    help="Number of worker processes, each with its own database connection.",
+)
+@click.option(
+    "--chunk_size",
+    type=click.IntRange(min=1),
+    default=1000,
+    show_default=True,
+    help="Number of distinct terms normalized by a worker at a time.",
+)
+@click.option("--silent", is_flag=True, default=False, help=SILENT_MODE_DESCRIPTION)
+def normalize_file(
+    infile: Path,
+    outfile: Path,
+    column: str,
+    file_format: str | None,
+    db_url: str | None,
+    processes: int,
+    chunk_size: int,
+    silent: bool,
+) -> None:
+    """Annotate gene terms in one column of INFILE with normalized concepts, writing
+    the result to OUTFILE.
+
+    Each distinct term is normalized once, across a pool of worker processes. TSV and
+    CSV rows gain gene_normalized_id, gene_symbol, and gene_match_type columns:
+
+        $ gene-normalizer normalize-file variants.tsv annotated.tsv --column gene
+
+    For VCF input, --column names an INFO key, whose comma-separated values gain
+    GENE_NORM_ID, GENE_NORM_SYMBOL, and GENE_NORM_MATCH INFO fields:
+
+        $ gene-normalizer normalize-file calls.vcf.gz annotated.vcf.gz --column GENE
+
+    Files ending in .gz or .bgz are read and written with gzip compression.
+
+    \f
+    :param infile: path to input file
+    :param outfile: path to output file
+    :param column: name of column or INFO key containing gene terms
+    :param file_format: input file format
+    :param db_url: URL to normalizer database
+    :param processes: number of worker processes
+    :param chunk_size: number of terms normalized by a worker at a time
+    :param silent: if True, suppress console output
+    """  # noqa: D301
+    _initialize_app()
+    if file_format is None:
+        try:
+            file_format = infer_format(infile)
+        except ValueError as e:
+            raise click.BadParameter(str(e), param_hint="--format") from e
+    try:
+        n_terms = annotate_file(
+            infile,
+            outfile,
+            column,
+            FileFormat(file_format.lower()),
+            db_url,
+            processes,
+            chunk_size,
+        )
+    except ValueError as e:
+        if not silent:
+            click.echo(f"Error: {e!s}")
+        _logger.exception("Failed to annotate %s", infile)
+        click.get_current_context().exit(1)
+    msg = f"Normalized {n_terms} distinct terms from {infile} into {outfile}."
+    if not silent:
+        click.echo(msg)
+    _logger.info(msg)
+
+
 if __name__ == "__main__":
     cli()
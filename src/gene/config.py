@@ -25,6 +25,17 @@ class Settings(BaseSettings):
     debug: bool = False
     test: bool = False
     db_url: str = "http://localhost:8000"
+    db_pool_min_size: int = 1
+    db_pool_max_size: int = 10
+    db_unlogged_staging: bool = False
+    db_cursor_itersize: int = 500
+    cache_size: int = 0
+    cache_ttl: float | None = None
+    version_check_interval: float = 60.0
+    fuzzy_match: bool = False
+    fuzzy_max_distance: int = 1
+    metrics: bool = False
+    cache_control_max_age: int | None = None
 
 
 @cache
@@ -2,10 +2,12 @@
 
 from .database import (
     AWS_ENV_VAR_NAME,
+    AbstractAsyncDatabase,
     AbstractDatabase,
     DatabaseException,
     DatabaseInitializationException,
     DatabaseReadException,
     DatabaseWriteException,
+    create_async_db,
     create_db,
 )
@@ -2,7 +2,8 @@
 
 import abc
 import sys
-from collections.abc import Generator
+from collections.abc import Generator, Iterable
+from contextlib import AbstractContextManager
 from enum import Enum
 from os import environ
 from pathlib import Path
@@ -115,6 +116,17 @@ class AbstractDatabase(abc.ABC):
         :param src_name: name of the source to get data for
         """
 
+    @abc.abstractmethod
+    def get_data_version(self) -> str:
+        """Get an identifier for the currently-loaded data, built from the version of
+        each loaded source and the time that normalized records were last generated
+        (see :py:meth:`set_merge_timestamp`). Always reads directly from the DB, so
+        it changes as soon as a source is reloaded or records are merged.
+
+        :return: data version identifier
+        :raise DatabaseReadException: if DB client encounters a failure
+        """
+
     @abc.abstractmethod
     def get_record_by_id(
         self, concept_id: str, case_sensitive: bool = True, merge: bool = False
@@ -129,6 +141,25 @@ class AbstractDatabase(abc.ABC):
         :return: complete gene record, if match is found; None otherwise
         """
 
+    @abc.abstractmethod
+    def get_records_by_ids(
+        self,
+        concept_ids: Iterable[str],
+        case_sensitive: bool = True,
+        merge: bool = False,
+    ) -> list[dict]:
+        """Fetch records for many concept IDs at once. Bulk counterpart to
+        :py:meth:`get_record_by_id`.
+
+        :param concept_ids: concept IDs for gene records
+        :param case_sensitive: if true, performs exact lookup, which may be quicker.
+            Otherwise, performs filter operation, which doesn't require correct casing.
+        :param merge: if true, look for merged records; look for identity records
+            otherwise.
+        :return: complete gene records for each concept ID that could be found, in the
+            order requested
+        """
+
     @abc.abstractmethod
     def get_refs_by_type(self, search_term: str, ref_type: RefType) -> list[str]:
         """Retrieve concept IDs for records matching the user's query. Other methods
@@ -139,6 +170,52 @@ class AbstractDatabase(abc.ABC):
         :return: list of associated concept IDs. Empty if lookup fails.
         """
 
+    @abc.abstractmethod
+    def get_refs_by_terms(
+        self, search_terms: Iterable[str], ref_type: RefType
+    ) -> dict[str, list[str]]:
+        """Retrieve concept IDs for many search terms at once. Bulk counterpart to
+        :py:meth:`get_refs_by_type`.
+
+        :param search_terms: lowercase strings to match against
+        :param ref_type: type of match to look for.
+        :return: mapping from each search term with at least one match to its
+            associated concept IDs
+        """
+
+    @abc.abstractmethod
+    def get_match_tiers(self, search_term: str) -> dict | None:
+        """Look up every normalization match tier for a term at once, if the backend
+        supports it: merged and identity records with the term as their concept ID,
+        and concept IDs of records matching the term by each reference type.
+
+        :param search_term: string to match against
+        :return: object with the term's precomputed resolution, as from
+            :py:meth:`get_term_resolution` (``resolution``), the matching merged
+            record (``merged_record``) and identity record (``record``), or None for
+            each if there's no match, and a mapping from each ``RefType`` to matching
+            concept IDs (``refs``). None if the backend can't look up all tiers at
+            once (callers should fall back on :py:meth:`get_term_resolution`,
+            :py:meth:`get_record_by_id`, and :py:meth:`get_refs_by_type`).
+        :raise DatabaseReadException: if DB client encounters a failure
+        """
+
+    @abc.abstractmethod
+    def get_search_matches(
+        self, search_terms: Iterable[str], sources: Iterable[str]
+    ) -> list[tuple[str, str, dict]] | None:
+        """Retrieve identity records matching any of several search terms, by concept
+        ID or by any reference type, in a single lookup, if the backend supports it.
+
+        :param search_terms: lowercase strings to match against
+        :param sources: names of sources to retrieve records from
+        :return: (search term, match type, record) for every match, where match type
+            is ``"concept_id"`` or a ``RefType`` value, or None if the backend can't
+            perform the lookup at once (callers should fall back on
+            :py:meth:`get_refs_by_type`)
+        :raise DatabaseReadException: if DB client encounters a failure
+        """
+
     @abc.abstractmethod
     def get_all_concept_ids(self) -> set[str]:
         """Retrieve all available concept IDs for use in generating normalized records.
@@ -164,6 +241,54 @@ class AbstractDatabase(abc.ABC):
         :return: Generator that lazily provides records as they are retrieved
         """
 
+    @abc.abstractmethod
+    def get_term_filter(self) -> bytes | None:
+        """Get the stored filter of all searchable terms, as serialized by
+        :py:meth:`gene.bloom.BloomFilter.to_bytes`.
+
+        :return: serialized filter, or None if no filter has been stored
+        :raise DatabaseReadException: if DB client encounters a failure
+        """
+
+    @abc.abstractmethod
+    def set_term_filter(self, data: bytes) -> None:
+        """Store a filter of all searchable terms, replacing any existing filter.
+
+        :param data: serialized filter
+        :raise DatabaseWriteException: if write fails
+        """
+
+    @abc.abstractmethod
+    def set_merge_timestamp(self, timestamp: str) -> None:
+        """Record when normalized records were last generated, replacing any
+        existing timestamp.
+
+        :param timestamp: ISO 8601 time of merged record generation
+        :raise DatabaseWriteException: if write fails
+        """
+
+    @abc.abstractmethod
+    def get_term_resolution(self, term: str) -> dict | None:
+        """Get the precomputed normalized concept for a term, if the backend stores
+        them (see :py:meth:`update_term_resolutions`).
+
+        :param term: lowercased concept ID or term
+        :return: object with the match type (e.g. ``"alias"``), the normalized concept
+            ID, whether it's a merged record, the normalized record itself (or None if
+            it's missing), and the normalized concept IDs of other possible matches,
+            or None if the term has no stored resolution
+        :raise DatabaseReadException: if DB client encounters a failure
+        """
+
+    @abc.abstractmethod
+    def update_term_resolutions(self) -> None:
+        """Precompute the normalized concept that each concept ID and term resolves
+        to, for backends that support it. Should be called after normalized records
+        are generated.
+
+        :raise DatabaseWriteException: if write fails
+        """
+
     @abc.abstractmethod
     def add_source_metadata(self, src_name: SourceName, data: SourceMeta) -> None:
         """Add new source metadata entry.
@@ -225,6 +350,26 @@ class AbstractDatabase(abc.ABC):
     def close_connection(self) -> None:
         """Perform any manual connection closure procedures if necessary."""
 
+    @abc.abstractmethod
+    def staged_update(
+        self, sources: Iterable[SourceName]
+    ) -> AbstractContextManager[None]:
+        """Perform writes against a copy of the data, and replace the existing data
+        with it atomically once complete, so that readers never see a partial
+        update. If the update fails, the existing data is left in place.
+
+        >>> from gene.database import create_db
+        >>> from gene.schemas import SourceName
+        >>> db = create_db()
+        >>> with db.staged_update([SourceName.HGNC]):
+        ...     pass  # delete and reload HGNC records
+
+        :param sources: sources that will be reloaded. Their data isn't carried over
+            into the copy.
+        :return: context manager that encloses the update
+        :raise: NotImplementedError if not supported by DB
+        """
+
     @abc.abstractmethod
     def load_from_remote(self, url: str | None = None) -> None:
         """Load DB from remote dump. Warning: Deletes all existing data.
@@ -242,6 +387,152 @@ class AbstractDatabase(abc.ABC):
         """
 
 
+class AbstractAsyncDatabase(abc.ABC):
+    """Define the asynchronous, read-only database interface used to serve queries.
+    This class should never be called directly by a user, but should be used as the
+    parent class for all concrete async database implementations.
+
+    Unlike :py:class:`AbstractDatabase`, instances must be opened with
+    :py:meth:`open_connection` before use. The :py:func:`create_async_db` factory
+    handles this automatically.
+    """
+
+    @abc.abstractmethod
+    def __init__(self, db_url: str | None = None, **db_args) -> None:
+        """Initialize database instance.
+
+        :param db_url: address/connection description for database
+        :param db_args: any DB implementation-specific parameters
+        :raise DatabaseInitializationException: if initial setup fails
+        """
+
+    @abc.abstractmethod
+    async def open_connection(self) -> None:
+        """Perform any connection setup procedures that must be awaited.
+
+        :raise DatabaseInitializationException: if connection fails
+        """
+
+    @abc.abstractmethod
+    async def close_connection(self) -> None:
+        """Perform any manual connection closure procedures if necessary."""
+
+    @abc.abstractmethod
+    async def get_source_metadata(self, src_name: str | SourceName) -> dict:
+        """Get license, versioning, data lookup, etc information for a source.
+
+        :param src_name: name of the source to get data for
+        :raise DatabaseReadException: if lookup fails
+        """
+
+    @abc.abstractmethod
+    async def get_data_version(self) -> str:
+        """Get an identifier for the currently-loaded data. See
+        :py:meth:`AbstractDatabase.get_data_version`.
+
+        :return: data version identifier
+        :raise DatabaseReadException: if DB client encounters a failure
+        """
+
+    @abc.abstractmethod
+    async def get_term_filter(self) -> bytes | None:
+        """Get the stored filter of all searchable terms. See
+        :py:meth:`AbstractDatabase.get_term_filter`.
+
+        :return: serialized filter, or None if no filter has been stored
+        :raise DatabaseReadException: if DB client encounters a failure
+        """
+
+    @abc.abstractmethod
+    async def get_term_resolution(self, term: str) -> dict | None:
+        """Get the precomputed normalized concept for a term. See
+        :py:meth:`AbstractDatabase.get_term_resolution`.
+
+        :param term: lowercased concept ID or term
+        :return: resolution object, or None if the term has no stored resolution
+        :raise DatabaseReadException: if DB client encounters a failure
+        """
+
+    @abc.abstractmethod
+    async def get_match_tiers(self, search_term: str) -> dict | None:
+        """Look up every normalization match tier for a term at once. See
+        :py:meth:`AbstractDatabase.get_match_tiers`.
+
+        :param search_term: string to match against
+        :return: term resolution, matching merged record, identity record, and concept
+            IDs for each reference type, or None if the backend can't look up all
+            tiers at once
+        :raise DatabaseReadException: if DB client encounters a failure
+        """
+
+    @abc.abstractmethod
+    async def get_search_matches(
+        self, search_terms: Iterable[str], sources: Iterable[str]
+    ) -> list[tuple[str, str, dict]] | None:
+        """Retrieve identity records matching any of several search terms in a single
+        lookup. See :py:meth:`AbstractDatabase.get_search_matches`.
+
+        :param search_terms: lowercase strings to match against
+        :param sources: names of sources to retrieve records from
+        :return: (search term, match type, record) for every match, or None if the
+            backend can't perform the lookup at once
+        :raise DatabaseReadException: if DB client encounters a failure
+        """
+
+    @abc.abstractmethod
+    async def get_record_by_id(
+        self, concept_id: str, case_sensitive: bool = True, merge: bool = False
+    ) -> dict | None:
+        """Fetch record corresponding to provided concept ID
+
+        :param concept_id: concept ID for gene record
+        :param case_sensitive: if true, performs exact lookup, which may be quicker.
+            Otherwise, performs filter operation, which doesn't require correct casing.
+        :param merge: if true, look for merged record; look for identity
+            record otherwise.
+        :return: complete gene record, if match is found; None otherwise
+        """
+
+    @abc.abstractmethod
+    async def get_records_by_ids(
+        self,
+        concept_ids: Iterable[str],
+        case_sensitive: bool = True,
+        merge: bool = False,
+    ) -> list[dict]:
+        """Fetch records for many concept IDs at once.
+
+        :param concept_ids: concept IDs for gene records
+        :param case_sensitive: if true, performs exact lookup, which may be quicker.
+            Otherwise, performs filter operation, which doesn't require correct casing.
+        :param merge: if true, look for merged records; look for identity records
+            otherwise.
+        :return: complete gene records for each concept ID that could be found, in the
+            order requested
+        """
+
+    @abc.abstractmethod
+    async def get_refs_by_type(self, search_term: str, ref_type: RefType) -> list[str]:
+        """Retrieve concept IDs for records matching the user's query.
+
+        :param search_term: string to match against
+        :param ref_type: type of match to look for.
+        :return: list of associated concept IDs. Empty if lookup fails.
+        """
+
+    @abc.abstractmethod
+    async def get_refs_by_terms(
+        self, search_terms: Iterable[str], ref_type: RefType
+    ) -> dict[str, list[str]]:
+        """Retrieve concept IDs for many search terms at once.
+
+        :param search_terms: lowercase strings to match against
+        :param ref_type: type of match to look for.
+        :return: mapping from each search term with at least one match to its
+            associated concept IDs
+        """
+
+
 # can be set to either `Dev`, `Staging`, or `Prod`
 # ONLY set when wanting to access aws instance
 AWS_ENV_VAR_NAME = "GENE_NORM_ENV"
@@ -308,10 +599,12 @@ def create_db(
        connection
     2) if the ``db_url`` method argument is given a non-None value, try to create a DB
        connection to that address (if it looks like a PostgreSQL URL, create a
-       PostgreSQL connection, but otherwise try DynamoDB)
+       PostgreSQL connection; if it starts with ``memory``, create an in-memory DB;
+       but otherwise try DynamoDB)
     3) if the ``GENE_NORM_DB_URL`` environment variable is set, try to create a DB
        connection to that address (if it looks like a PostgreSQL URL, create a
-       PostgreSQL connection, but otherwise try DynamoDB)
+       PostgreSQL connection; if it starts with ``memory``, create an in-memory DB;
+       but otherwise try DynamoDB)
     4) otherwise, attempt a DynamoDB connection to the default URL,
        ``http://localhost:8000``
 
@@ -329,7 +622,11 @@ def create_db(
         endpoint_url = db_url if db_url else get_config().db_url
 
         # prefer DynamoDB unless connection explicitly reads like a libpq URI
-        if endpoint_url.startswith("postgres"):
+        if endpoint_url.startswith("memory"):
+            from gene.database.memory import MemoryDatabase  # noqa: PLC0415
+
+            db = MemoryDatabase(endpoint_url)
+        elif endpoint_url.startswith("postgres"):
             from gene.database.postgresql import PostgresDatabase  # noqa: PLC0415
 
             db = PostgresDatabase(endpoint_url)
@@ -338,3 +635,42 @@ def create_db(
 
             db = DynamoDbDatabase(endpoint_url)
     return db
+
+
+async def create_async_db(
+    db_url: str | None = None, aws_instance: bool = False
+) -> AbstractAsyncDatabase:
+    """Async database factory method. Resolves connection settings with the same
+    precedence as :py:func:`create_db`, and opens the connection before returning it.
+
+    >>> from gene.database import create_async_db
+    >>> db = await create_async_db()
+
+    :param db_url: address to database instance
+    :param aws_instance: use hosted DynamoDB instance, not local DB
+    :return: constructed and opened async Database instance
+    """
+    aws_env_var_set = AWS_ENV_VAR_NAME in environ
+
+    if aws_env_var_set or aws_instance:
+        from gene.database.dynamodb import AsyncDynamoDbDatabase  # noqa: PLC0415
+
+        db = AsyncDynamoDbDatabase()
+    else:
+        endpoint_url = db_url if db_url else get_config().db_url
+
+        # prefer DynamoDB unless connection explicitly reads like a libpq URI
+        if endpoint_url.startswith("memory"):
+            from gene.database.memory import AsyncMemoryDatabase  # noqa: PLC0415
+
+            db = AsyncMemoryDatabase(endpoint_url)
+        elif endpoint_url.startswith("postgres"):
+            from gene.database.postgresql import AsyncPostgresDatabase  # noqa: PLC0415
+
+            db = AsyncPostgresDatabase(endpoint_url)
+        else:
+            from gene.database.dynamodb import AsyncDynamoDbDatabase  # noqa: PLC0415
+
+            db = AsyncDynamoDbDatabase(endpoint_url)
+    await db.open_connection()
+    return db
@@ -1,16 +1,18 @@
 """Provide DynamoDB client."""
 
+import asyncio
 import atexit
 import datetime
 import gzip
 import json
 import logging
 import sys
-from collections.abc import Generator
+from collections.abc import Generator, Iterable
+from contextlib import AbstractContextManager
 from os import environ
 from pathlib import Path
 from timeit import default_timer as timer
-from typing import Any
+from typing import Any, ClassVar
 
 import boto3
 import click
@@ -23,6 +25,7 @@ from gene.database.database import (
     AWS_ENV_VAR_NAME,
     SKIP_AWS_DB_ENV_NAME,
     VALID_AWS_ENV_NAMES,
+    AbstractAsyncDatabase,
     AbstractDatabase,
     AwsEnvName,
     DatabaseInitializationException,
@@ -86,7 +89,6 @@ class DynamoDbDatabase(AbstractDatabase):
 
         self.genes = self.dynamodb.Table(self.gene_table)
         self.batch = self.genes.batch_writer()
-        self._cached_sources = {}
         atexit.register(self.close_connection)
 
     def list_tables(self) -> list[str]:
@@ -208,8 +210,6 @@ class DynamoDbDatabase(AbstractDatabase):
         """
         if isinstance(src_name, SourceName):
             src_name = src_name.value
-        if src_name in self._cached_sources:
-            return self._cached_sources[src_name]
 
         pk = f"{src_name.lower()}##source"
         concept_id = f"source:{src_name.lower()}"
@@ -219,9 +219,51 @@ class DynamoDbDatabase(AbstractDatabase):
         if not metadata:
             err_msg = f"Unable to retrieve data for source {src_name}"
             raise DatabaseReadException(err_msg)
-        self._cached_sources[src_name] = metadata
         return metadata
 
+    def get_data_version(self) -> str:
+        """Get an identifier for the currently-loaded data, built from the version of
+        each loaded source and the time that normalized records were last generated.
+        Always reads directly from the DB, so it changes as soon as a source is
+        reloaded or records are merged.
+
+        :return: data version identifier
+        :raise DatabaseReadException: if DB client encounters a failure
+        """
+        keys = [
+            {
+                "label_and_type": f"{src.value.lower()}##source",
+                "concept_id": f"source:{src.value.lower()}",
+            }
+            for src in SourceName
+        ]
+        keys.append(self._merge_timestamp_key)
+        request = {
+            self.gene_table: {
+                "Keys": keys,
+                "ProjectionExpression": "concept_id, #v",
+                "ExpressionAttributeNames": {"#v": "version"},
+            }
+        }
+        versions = {}
+        try:
+            while request:
+                response = self.dynamodb.batch_get_item(RequestItems=request)
+                for item in response["Responses"].get(self.gene_table, []):
+                    versions[item["concept_id"]] = item["version"]
+                request = response.get("UnprocessedKeys")
+        except ClientError as e:
+            raise DatabaseReadException(e) from e
+        version = ";".join(
+            f"{src.value}:{versions[f'source:{src.value.lower()}']}"
+            for src in sorted(SourceName, key=lambda s: s.value)
+            if f"source:{src.value.lower()}" in versions
+        )
+        merge_timestamp = versions.get(self._merge_timestamp_key["concept_id"])
+        if merge_timestamp:
+            version += f";merge_timestamp:{merge_timestamp}"
+        return version
+
     def get_record_by_id(
         self, concept_id: str, case_sensitive: bool = True, merge: bool = False
     ) -> dict | None:
@@ -261,6 +303,62 @@ class DynamoDbDatabase(AbstractDatabase):
         except (KeyError, IndexError):  # record doesn't exist
             return None
 
+    # maximum number of keys permitted in a single BatchGetItem request
+    _batch_get_size = 100
+
+    def get_records_by_ids(
+        self,
+        concept_ids: Iterable[str],
+        case_sensitive: bool = True,
+        merge: bool = False,
+    ) -> list[dict]:
+        """Fetch records for many concept IDs at once.
+
+        Items are retrieved with ``BatchGetItem``, which requires exact keys. If
+        ``case_sensitive`` is false, any concept ID that isn't found that way (e.g.
+        because it was provided in lowercase) falls back to an individual query.
+
+        :param concept_ids: concept IDs for gene records
+        :param case_sensitive: if true, only perform exact lookups. Otherwise, also
+            perform filter operations for concept IDs without an exact match.
+        :param merge: if true, look for merged records; look for identity records
+            otherwise.
+        :return: complete gene records for each concept ID that could be found, in the
+            order requested
+        """
+        item_type = RecordType.MERGER.value if merge else RecordType.IDENTITY.value
+        concept_ids = list(dict.fromkeys(concept_ids))
+        keys = [
+            {"label_and_type": f"{c.lower()}##{item_type}", "concept_id": c}
+            for c in concept_ids
+        ]
+        records = {}
+        try:
+            for i in range(0, len(keys), self._batch_get_size):
+                request = {
+                    self.gene_table: {"Keys": keys[i : i + self._batch_get_size]}
+                }
+                while request:
+                    response = self.dynamodb.batch_get_item(RequestItems=request)
+                    for item in response["Responses"].get(self.gene_table, []):
+                        del item["label_and_type"]
+                        records[item["concept_id"]] = item
+                    request = response.get("UnprocessedKeys")
+        except ClientError as e:
+            _logger.exception(
+                "boto3 client error on get_records_by_ids for concept IDs %s: %s",
+                concept_ids,
+                e.response["Error"]["Message"],
+            )
+
+        if not case_sensitive:
+            for concept_id in concept_ids:
+                if concept_id not in records:
+                    record = self.get_record_by_id(concept_id, False, merge)
+                    if record:
+                        records[concept_id] = record
+        return [records[c] for c in concept_ids if c in records]
+
     def get_refs_by_type(self, search_term: str, ref_type: RefType) -> list[str]:
         """Retrieve concept IDs for records matching the user's query. Other methods
         are responsible for actually retrieving full records.
@@ -282,6 +380,50 @@ class DynamoDbDatabase(AbstractDatabase):
             )
             return []
 
+    def get_refs_by_terms(
+        self, search_terms: Iterable[str], ref_type: RefType
+    ) -> dict[str, list[str]]:
+        """Retrieve concept IDs for many search terms at once.
+
+        Reference items share a partition key across all of their concept IDs, so
+        they can't be fetched with ``BatchGetItem``; this issues one query per term.
+
+        :param search_terms: lowercase strings to match against
+        :param ref_type: type of match to look for.
+        :return: mapping from each search term with at least one match to its
+            associated concept IDs
+        """
+        refs = {}
+        for search_term in search_terms:
+            concept_ids = self.get_refs_by_type(search_term, ref_type)
+            if concept_ids:
+                refs[search_term] = concept_ids
+        return refs
+
+    def get_match_tiers(self, search_term: str) -> dict | None:  # noqa: ARG002
+        """Look up every normalization match tier for a term at once. Not supported by
+        the DynamoDB backend, where each tier is looked up individually.
+
+        :param search_term: string to match against
+        :return: None
+        """
+        return None
+
+    def get_search_matches(
+        self,
+        search_terms: Iterable[str],  # noqa: ARG002
+        sources: Iterable[str],  # noqa: ARG002
+    ) -> list[tuple[str, str, dict]] | None:
+        """Retrieve records matching several search terms in a single lookup. Not
+        supported by the DynamoDB backend, where each match type is looked up
+        individually.
+
+        :param search_terms: lowercase strings to match against
+        :param sources: names of sources to retrieve records from
+        :return: None
+        """
+        return None
+
     def get_all_concept_ids(self) -> set[str]:
         """Retrieve concept IDs for use in generating normalized records.
 
@@ -345,6 +487,113 @@ class DynamoDbDatabase(AbstractDatabase):
             if not last_evaluated_key:
                 break
 
+    # filters are split across items to stay within the DynamoDB item size limit
+    _term_filter_key = "term_filter##filter"
+    _term_filter_chunk_size = 350_000
+
+    def _get_term_filter_items(self) -> list[dict]:
+        """Get all stored term filter chunks, in order.
+
+        :return: term filter items
+        :raise DatabaseReadException: if DB client encounters a failure
+        """
+        items = []
+        params = {
+            "KeyConditionExpression": Key("label_and_type").eq(self._term_filter_key)
+        }
+        try:
+            while True:
+                response = self.genes.query(**params)
+                items.extend(response.get("Items", []))
+                last_evaluated_key = response.get("LastEvaluatedKey")
+                if not last_evaluated_key:
+                    break
+                params["ExclusiveStartKey"] = last_evaluated_key
+        except ClientError as e:
+            raise DatabaseReadException(e) from e
+        return items
+
+    def get_term_filter(self) -> bytes | None:
+        """Get the stored filter of all searchable terms, reassembled from its chunks.
+
+        :return: serialized filter, or None if no filter has been stored
+        :raise DatabaseReadException: if DB client encounters a failure
+        """
+        items = self._get_term_filter_items()
+        if not items:
+            return None
+        return b"".join(item["data"].value for item in items)
+
+    def set_term_filter(self, data: bytes) -> None:
+        """Store a filter of all searchable terms, replacing any existing filter.
+
+        :param data: serialized filter
+        :raise DatabaseWriteException: if write fails
+        """
+        try:
+            stale_items = self._get_term_filter_items()
+        except DatabaseReadException as e:
+            raise DatabaseWriteException(e) from e
+        try:
+            with self.genes.batch_writer() as batch:
+                for item in stale_items:
+                    batch.delete_item(
+                        Key={
+                            "label_and_type": item["label_and_type"],
+                            "concept_id": item["concept_id"],
+                        }
+                    )
+            with self.genes.batch_writer() as batch:
+                for i in range(0, len(data), self._term_filter_chunk_size):
+                    batch.put_item(
+                        Item={
+                            "label_and_type": self._term_filter_key,
+                            "concept_id": f"filter:{i:012d}",
+                            "item_type": "filter",
+                            "data": data[i : i + self._term_filter_chunk_size],
+                        }
+                    )
+        except ClientError as e:
+            raise DatabaseWriteException(e) from e
+
+    # stored as a version, so that it's retrieved along with source versions
+    _merge_timestamp_key: ClassVar[dict[str, str]] = {
+        "label_and_type": "merge_timestamp##metadata",
+        "concept_id": "metadata:merge_timestamp",
+    }
+
+    def set_merge_timestamp(self, timestamp: str) -> None:
+        """Record when normalized records were last generated, replacing any
+        existing timestamp.
+
+        :param timestamp: ISO 8601 time of merged record generation
+        :raise DatabaseWriteException: if write fails
+        """
+        try:
+            self.genes.put_item(
+                Item={
+                    **self._merge_timestamp_key,
+                    "item_type": "metadata",
+                    "version": timestamp,
+                }
+            )
+        except ClientError as e:
+            raise DatabaseWriteException(e) from e
+
+    def get_term_resolution(self, term: str) -> dict | None:  # noqa: ARG002
+        """Get the precomputed normalized concept for a term. Not stored by the
+        DynamoDB backend, where each query is resolved from its records.
+
+        :param term: lowercased concept ID or term
+        :return: None
+        """
+        return None
+
+    def update_term_resolutions(self) -> None:
+        """Precompute the normalized concept that each term resolves to. Not supported
+        by the DynamoDB backend, so this does nothing.
+        """
+
     def add_source_metadata(self, src_name: SourceName, metadata: SourceMeta) -> None:
         """Add new source metadata entry.
 
@@ -551,6 +800,17 @@ class DynamoDbDatabase(AbstractDatabase):
         """Perform any manual connection closure procedures if necessary."""
         self.batch.__exit__(*sys.exc_info())
 
+    def staged_update(
+        self, sources: Iterable[SourceName]
+    ) -> AbstractContextManager[None]:
+        """Perform writes against a copy of the data. Not available for
+        the DynamoDB database backend.
+
+        :param sources: sources that will be reloaded
+        :raise NotImplementedError: always
+        """
+        raise NotImplementedError
+
     def load_from_remote(self, url: str | None = None) -> None:
         """Load DB from remote dump. Not available for DynamoDB database backend.
 
@@ -604,3 +864,151 @@ class DynamoDbDatabase(AbstractDatabase):
             "Exported %i items in %.2f seconds to %s", n_items, end - start, f.name
         )
         _logger.info("Export to DynamoDB successful.")
+
+
+class AsyncDynamoDbDatabase(AbstractAsyncDatabase):
+    """Asynchronous, read-only database class employing DynamoDB.
+
+    boto3 only provides blocking clients, so each lookup is delegated to a
+    :py:class:`DynamoDbDatabase` instance and run in a worker thread. This keeps the
+    event loop free while requests are in flight.
+    """
+
+    def __init__(self, db_url: str | None = None, **db_args) -> None:
+        """Initialize Database class.
+
+        :param str db_url: URL endpoint for DynamoDB source
+        :Keyword Arguments:
+            * region_name: AWS region (defaults to "us-east-2")
+        :raise DatabaseInitializationException: if initial setup fails
+        """
+        self.db = DynamoDbDatabase(db_url, **db_args)
+
+    async def open_connection(self) -> None:
+        """Perform any connection setup procedures. Not needed for DynamoDB."""
+
+    async def close_connection(self) -> None:
+        """Perform any manual connection closure procedures if necessary."""
+        await asyncio.to_thread(self.db.close_connection)
+
+    async def get_source_metadata(self, src_name: str | SourceName) -> dict:
+        """Get license, versioning, data lookup, etc information for a source.
+
+        :param src_name: name of the source to get data for
+        :raise DatabaseReadException: if lookup fails
+        """
+        return await asyncio.to_thread(self.db.get_source_metadata, src_name)
+
+    async def get_data_version(self) -> str:
+        """Get an identifier for the currently-loaded data, built from the version of
+        each loaded source and the time that normalized records were last generated.
+
+        :return: data version identifier
+        :raise DatabaseReadException: if DB client encounters a failure
+        """
+        return await asyncio.to_thread(self.db.get_data_version)
+
+    async def get_term_filter(self) -> bytes | None:
+        """Get the stored filter of all searchable terms.
+
+        :return: serialized filter, or None if no filter has been stored
+        :raise DatabaseReadException: if DB client encounters a failure
+        """
+        return await asyncio.to_thread(self.db.get_term_filter)
+
+    async def get_term_resolution(self, term: str) -> dict | None:  # noqa: ARG002
+        """Get the precomputed normalized concept for a term. Not stored by the
+        DynamoDB backend.
+
+        :param term: lowercased concept ID or term
+        :return: None
+        """
+        return None
+
+    async def get_record_by_id(
+        self, concept_id: str, case_sensitive: bool = True, merge: bool = False
+    ) -> dict | None:
+        """Fetch record corresponding to provided concept ID
+
+        :param concept_id: concept ID for gene record
+        :param case_sensitive: if true, performs exact lookup, which is more
+            efficient. Otherwise, performs filter operation, which doesn't require
+            correct casing.
+        :param merge: if true, look for merged record; look for identity record
+            otherwise.
+        :return: complete gene record, if match is found; None otherwise
+        """
+        return await asyncio.to_thread(
+            self.db.get_record_by_id, concept_id, case_sensitive, merge
+        )
+
+    async def get_records_by_ids(
+        self,
+        concept_ids: Iterable[str],
+        case_sensitive: bool = True,
+        merge: bool = False,
+    ) -> list[dict]:
+        """Fetch records for many concept IDs at once.
+
+        :param concept_ids: concept IDs for gene records
+        :param case_sensitive: if true, only perform exact lookups. Otherwise, also
+            perform filter operations for concept IDs without an exact match.
+        :param merge: if true, look for merged records; look for identity records
+            otherwise.
+        :return: complete gene records for each concept ID that could be found, in the
+            order requested
+        """
+        return await asyncio.to_thread(
+            self.db.get_records_by_ids, list(concept_ids), case_sensitive, merge
+        )
+
+    async def get_refs_by_type(self, search_term: str, ref_type: RefType) -> list[str]:
+        """Retrieve concept IDs for records matching the user's query.
+
+        :param search_term: string to match against
+        :param ref_type: type of match to look for.
+        :return: list of associated concept IDs. Empty if lookup fails.
+        """
+        return await asyncio.to_thread(self.db.get_refs_by_type, search_term, ref_type)
+
+    async def get_refs_by_terms(
+        self, search_terms: Iterable[str], ref_type: RefType
+    ) -> dict[str, list[str]]:
+        """Retrieve concept IDs for many search terms at once. Each term requires its
+        own query, so all of them are issued concurrently.
+
+        :param search_terms: lowercase strings to match against
+        :param ref_type: type of match to look for.
+        :return: mapping from each search term with at least one match to its
+            associated concept IDs
+        """
+        search_terms = list(dict.fromkeys(search_terms))
+        results = await asyncio.gather(
+            *(self.get_refs_by_type(term, ref_type) for term in search_terms)
+        )
+        return {
+            term: refs for term, refs in zip(search_terms, results, strict=True) if refs
+        }
+
+    async def get_match_tiers(self, search_term: str) -> dict | None:  # noqa: ARG002
+        """Look up every normalization match tier for a term at once. Not supported by
+        the DynamoDB backend.
+
+        :param search_term: string to match against
+        :return: None
+        """
+        return None
+
+    async def get_search_matches(
+        self,
+        search_terms: Iterable[str],  # noqa: ARG002
+        sources: Iterable[str],  # noqa: ARG002
+    ) -> list[tuple[str, str, dict]] | None:
+        """Retrieve records matching several search terms in a single lookup. Not
+        supported by the DynamoDB backend.
+
+        :param search_terms: lowercase strings to match against
+        :param sources: names of sources to retrieve records from
+        :return: None
+        """
+        return None
@@ -0,0 +1,649 @@
+"""Provide in-memory, read-only database client."""
+
+import datetime
+import gzip
+import json
+import logging
+from collections.abc import Generator, Iterable
+from contextlib import AbstractContextManager
+from decimal import Decimal
+from pathlib import Path
+from timeit import default_timer as timer
+from typing import Any
+
+from pydantic import BaseModel
+
+from gene import ITEM_TYPES
+from gene.database.database import (
+    AbstractAsyncDatabase,
+    AbstractDatabase,
+    DatabaseInitializationException,
+    DatabaseReadException,
+    create_db,
+)
+from gene.schemas import RecordType, RefType, SourceMeta, SourceName
+
+_logger = logging.getLogger(__name__)
+
+
+MEMORY_URL_SCHEME = "memory"
+
+
+def _to_builtin(value: Any) -> Any:  # noqa: ANN401
+    """Convert values retrieved from other backends to plain, JSON-serializable
+    Python objects.
+
+    :param value: value from a record or source metadata object
+    :return: equivalent value built only from dicts, lists, strings, and numbers
+    """
+    if isinstance(value, dict):
+        return {k: _to_builtin(v) for k, v in value.items()}
+    if isinstance(value, list | set | tuple):
+        return [_to_builtin(v) for v in value]
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    return value
+
+
+class MemoryDatabase(AbstractDatabase):
+    """Read-only database class that holds all data in process memory.
+
+    Data is loaded once, at initialization, either from another database instance or
+    from a dump file created by :py:meth:`export_db`. Lookups are then performed
+    against in-memory indexes, with no network or disk access. This is intended for
+    serving queries, e.g. in API replicas; use another backend to load or update data.
+    """
+
+    def __init__(self, db_url: str | None = None, **db_args) -> None:
+        """Initialize database by loading all data into memory.
+
+        Data can be copied from another backend by providing that backend's address
+        following a ``memory+`` prefix, or by passing an existing instance:
+
+        >>> from gene.database.memory import MemoryDatabase
+        >>> db = MemoryDatabase(
+        ...     "memory+postgresql://postgres@localhost/gene_normalizer"
+        ... )
+        >>> db = MemoryDatabase("memory+http://localhost:8000")
+        >>> from gene.database import create_db
+        >>> db = MemoryDatabase(database=create_db())
+
+        Or it can be loaded from a dump file:
+
+        >>> db = MemoryDatabase("memory:///data/gene_norm_20240101000000.ndjson.gz")
+
+        :param db_url: ``memory://`` URL containing path to dump file, or ``memory+``
+            prefixed address of another database to copy data from
+        :Keyword Arguments:
+            * database: existing database instance to copy data from
+        :raise DatabaseInitializationException: if no data source is given, or if
+            loading data fails
+        """
+        self._sources: dict[str, dict] = {}
+        # data version of the database that data was copied from, if known
+        self._data_version: str | None = None
+        self._records: dict[str, dict] = {}
+        self._merged_records: dict[str, dict] = {}
+        self._refs: dict[RefType, dict[str, list[str]]] = {
+            ref_type: {} for ref_type in RefType
+        }
+
+        start = timer()
+        if "database" in db_args:
+            self._load_from_database(db_args["database"])
+        elif db_url and db_url.startswith(f"{MEMORY_URL_SCHEME}+"):
+            source_db = create_db(db_url.removeprefix(f"{MEMORY_URL_SCHEME}+"))
+            self._load_from_database(source_db)
+            source_db.close_connection()
+        elif db_url:
+            path = Path(db_url.removeprefix(f"{MEMORY_URL_SCHEME}://"))
+            if not path.is_file():
+                err_msg = f"Unable to find dump file at {path}"
+                raise DatabaseInitializationException(err_msg)
+            self._load_from_file(path)
+        else:
+            err_msg = "In-memory database requires a dump file or a database to copy"
+            raise DatabaseInitializationException(err_msg)
+        _logger.info(
+            "Loaded %i records into memory in %.2f seconds",
+            len(self._records) + len(self._merged_records),
+            timer() - start,
+        )
+
+    def _add_source(self, src_name: str, metadata: dict) -> None:
+        """Store metadata for a source.
+
+        :param src_name: name of source
+        :param metadata: source metadata
+        """
+        self._sources[src_name] = SourceMeta(**_to_builtin(metadata)).model_dump()
+
+    def _add_record(self, record: dict) -> None:
+        """Store a record, and index its terms if it's an identity record.
+
+        :param record: identity or merged record
+        """
+        record = _to_builtin(record)
+        record.pop("label_and_type", None)
+        concept_id = record["concept_id"]
+        if record["item_type"] == RecordType.MERGER:
+            self._merged_records[concept_id.lower()] = record
+            return
+
+        self._records[concept_id.lower()] = record
+        for attr_type, item_type in ITEM_TYPES.items():
+            value = record.get(attr_type)
+            if not value:
+                continue
+            terms = (
+                {value.lower()}
+                if isinstance(value, str)
+                else {v.lower() for v in value}
+            )
+            for term in terms:
+                self._refs[RefType(item_type)].setdefault(term, []).append(concept_id)
+
+    def _load_from_database(self, database: AbstractDatabase) -> None:
+        """Copy all data from another database instance.
+
+        :param database: database to copy from
+        :raise DatabaseInitializationException: if source metadata is missing
+        """
+        for src_name in SourceName:
+            try:
+                metadata = database.get_source_metadata(src_name.value)
+            except DatabaseReadException as e:
+                err_msg = f"Unable to load metadata for {src_name.value}"
+                raise DatabaseInitializationException(err_msg) from e
+            self._add_source(src_name.value, metadata)
+        self._data_version = database.get_data_version()
+        for record in database.get_all_records(RecordType.IDENTITY):
+            self._add_record(record)
+        for record in database.get_all_records(RecordType.MERGER):
+            if record["item_type"] == RecordType.MERGER:
+                self._add_record(record)
+
+    def _load_from_file(self, path: Path) -> None:
+        """Load all data from a dump file.
+
+        :param path: path to gzipped NDJSON file created by :py:meth:`export_db`
+        """
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            for line in f:
+                item = json.loads(line)
+                if item["item_type"] == "source":
+                    self._add_source(item.pop("src_name"), item)
+                elif item["item_type"] == "data_version":
+                    self._data_version = item["version"]
+                else:
+                    self._add_record(item)
+
+    def list_tables(self) -> list[str]:
+        """Return names of tables in database. The in-memory database has no tables.
+
+        :return: empty list
+        """
+        return []
+
+    def drop_db(self) -> None:
+        """Remove all data from memory. Doesn't affect any database or file that data
+        was loaded from.
+        """
+        self._sources.clear()
+        self._data_version = None
+        self._records.clear()
+        self._merged_records.clear()
+        for refs in self._refs.values():
+            refs.clear()
+
+    def check_schema_initialized(self) -> bool:
+        """Check if database schema is properly initialized. Always true for the
+        in-memory database.
+
+        :return: True
+        """
+        return True
+
+    def check_tables_populated(self) -> bool:
+        """Check that source metadata, identity records, and merged records are
+        loaded.
+
+        :return: True if all are present, False otherwise
+        """
+        return bool(self._sources and self._records and self._merged_records)
+
+    def initialize_db(self) -> None:
+        """Perform database setup. Not needed for the in-memory database."""
+
+    def get_source_metadata(self, src_name: str | SourceName) -> dict:
+        """Get license, versioning, data lookup, etc information for a source.
+
+        :param src_name: name of the source to get data for
+        :raise DatabaseReadException: if source metadata isn't loaded
+        """
+        if isinstance(src_name, SourceName):
+            src_name = src_name.value
+        try:
+            return self._sources[src_name]
+        except KeyError as e:
+            err_msg = f"{src_name} metadata lookup failed"
+            raise DatabaseReadException(err_msg) from e
+
+    def get_data_version(self) -> str:
+        """Get an identifier for the loaded data: the data version of the database
+        it was copied from, or, for dumps that don't record one, a version built from
+        the version of each loaded source.
+
+        :return: data version identifier
+        """
+        if self._data_version is not None:
+            return self._data_version
+        return ";".join(
+            f"{name}:{self._sources[name]['version']}" for name in sorted(self._sources)
+        )
+
+    def get_record_by_id(
+        self,
+        concept_id: str,
+        case_sensitive: bool = True,  # noqa: ARG002
+        merge: bool = False,
+    ) -> dict | None:
+        """Fetch record corresponding to provided concept ID.
+
+        Returned records are shallow copies, so nested values must not be modified.
+
+        :param concept_id: concept ID for gene record
+        :param case_sensitive: Not used by in-memory instance.
+        :param merge: if true, look for merged record; look for identity record
+            otherwise.
+        :return: complete gene record, if match is found; None otherwise
+        """
+        records = self._merged_records if merge else self._records
+        record = records.get(concept_id.lower())
+        return dict(record) if record else None
+
+    def get_records_by_ids(
+        self,
+        concept_ids: Iterable[str],
+        case_sensitive: bool = True,  # noqa: ARG002
+        merge: bool = False,
+    ) -> list[dict]:
+        """Fetch records for many concept IDs at once.
+
+        Returned records are shallow copies, so nested values must not be modified.
+
+        :param concept_ids: concept IDs for gene records
+        :param case_sensitive: Not used by in-memory instance.
+        :param merge: if true, look for merged records; look for identity records
+            otherwise.
+        :return: complete gene records for each concept ID that could be found, in the
+            order requested
+        """
+        records = self._merged_records if merge else self._records
+        concept_ids = dict.fromkeys(c.lower() for c in concept_ids)
+        return [dict(records[c]) for c in concept_ids if c in records]
+
+    def get_refs_by_type(self, search_term: str, ref_type: RefType) -> list[str]:
+        """Retrieve concept IDs for records matching the user's query.
+
+        :param search_term: string to match against
+        :param ref_type: type of match to look for.
+        :return: list of associated concept IDs. Empty if lookup fails.
+        """
+        return list(self._refs[ref_type].get(search_term.lower(), []))
+
+    def get_refs_by_terms(
+        self, search_terms: Iterable[str], ref_type: RefType
+    ) -> dict[str, list[str]]:
+        """Retrieve concept IDs for many search terms at once.
+
+        :param search_terms: lowercase strings to match against
+        :param ref_type: type of match to look for.
+        :return: mapping from each search term with at least one match to its
+            associated concept IDs
+        """
+        refs = self._refs[ref_type]
+        return {
+            term: list(refs[term.lower()])
+            for term in search_terms
+            if term.lower() in refs
+        }
+
+    def get_match_tiers(self, search_term: str) -> dict | None:  # noqa: ARG002
+        """Look up every normalization match tier for a term at once. Not supported by
+        the in-memory database, where each tier is looked up individually.
+
+        :param search_term: string to match against
+        :return: None
+        """
+        return None
+
+    def get_search_matches(
+        self,
+        search_terms: Iterable[str],  # noqa: ARG002
+        sources: Iterable[str],  # noqa: ARG002
+    ) -> list[tuple[str, str, dict]] | None:
+        """Retrieve records matching several search terms in a single lookup. Not
+        supported by the in-memory database, where each match type is looked up
+        individually.
+
+        :param search_terms: lowercase strings to match against
+        :param sources: names of sources to retrieve records from
+        :return: None
+        """
+        return None
+
+    def get_all_concept_ids(self) -> set[str]:
+        """Retrieve concept IDs for use in generating normalized records.
+
+        :return: Set of concept IDs as strings.
+        """
+        return {record["concept_id"] for record in self._records.values()}
+
+    def get_all_records(self, record_type: RecordType) -> Generator[dict, None, None]:
+        """Retrieve all source or normalized records. Either return all source records,
+        or all records that qualify as "normalized" (i.e., merged groups + source
+        records that are otherwise ungrouped).
+
+        :param record_type: type of result to return
+        :return: Generator that lazily provides records
+        """
+        if record_type == RecordType.IDENTITY:
+            yield from (dict(r) for r in self._records.values())
+        else:
+            yield from (dict(r) for r in self._merged_records.values())
+            yield from (
+                dict(r) for r in self._records.values() if not r.get("merge_ref")
+            )
+
+    def get_term_filter(self) -> bytes | None:
+        """Get the stored filter of all searchable terms. Every lookup in the
+        in-memory database is already a dictionary access, so no filter is kept.
+
+        :return: None
+        """
+        return None
+
+    def set_term_filter(self, data: bytes) -> None:
+        """Store a filter of all searchable terms. Not supported by the read-only
+        in-memory database.
+
+        :param data: serialized filter
+        :raise NotImplementedError: always
+        """
+        raise NotImplementedError
+
+    def set_merge_timestamp(self, timestamp: str) -> None:
+        """Record when normalized records were last generated. Not supported by the
+        read-only in-memory database.
+
+        :param timestamp: ISO 8601 time of merged record generation
+        :raise NotImplementedError: always
+        """
+        raise NotImplementedError
+
+    def get_term_resolution(self, term: str) -> dict | None:  # noqa: ARG002
+        """Get the precomputed normalized concept for a term. Not stored by the
+        in-memory database, where each query is resolved from its records.
+
+        :param term: lowercased concept ID or term
+        :return: None
+        """
+        return None
+
+    def update_term_resolutions(self) -> None:
+        """Precompute the normalized concept that each term resolves to. Not supported
+        by the read-only in-memory database.
+
+        :raise NotImplementedError: always
+        """
+        raise NotImplementedError
+
+    def add_source_metadata(self, src_name: SourceName, data: SourceMeta) -> None:
+        """Add new source metadata entry. Not supported by the read-only in-memory
+        database.
+
+        :param src_name: name of source
+        :param data: known source attributes
+        :raise NotImplementedError: always
+        """
+        raise NotImplementedError
+
+    def add_record(self, record: dict, src_name: SourceName) -> None:
+        """Add new record to database. Not supported by the read-only in-memory
+        database.
+
+        :param record: record to upload
+        :param src_name: name of source for record.
+        :raise NotImplementedError: always
+        """
+        raise NotImplementedError
+
+    def add_merged_record(self, record: dict) -> None:
+        """Add merged record to database. Not supported by the read-only in-memory
+        database.
+
+        :param record: merged record to add
+        :raise NotImplementedError: always
+        """
+        raise NotImplementedError
+
+    def update_merge_ref(self, concept_id: str, merge_ref: Any) -> None:  # noqa: ANN401
+        """Update the merged record reference of an individual record. Not supported
+        by the read-only in-memory database.
+
+        :param concept_id: record to update
+        :param merge_ref: new ref value
+        :raise NotImplementedError: always
+        """
+        raise NotImplementedError
+
+    def delete_normalized_concepts(self) -> None:
+        """Remove merged records from the database. Not supported by the read-only
+        in-memory database.
+
+        :raise NotImplementedError: always
+        """
+        raise NotImplementedError
+
+    def delete_source(self, src_name: SourceName) -> None:
+        """Delete all data for a source. Not supported by the read-only in-memory
+        database.
+
+        :param src_name: name of source to delete
+        :raise NotImplementedError: always
+        """
+        raise NotImplementedError
+
+    def complete_write_transaction(self) -> None:
+        """Conclude transaction or batch writing if relevant. Not needed for the
+        in-memory database.
+        """
+
+    def close_connection(self) -> None:
+        """Perform any manual connection closure procedures. Not needed for the
+        in-memory database.
+        """
+
+    def staged_update(
+        self, sources: Iterable[SourceName]
+    ) -> AbstractContextManager[None]:
+        """Perform writes against a copy of the data. Not available for
+        the in-memory database.
+
+        :param sources: sources that will be reloaded
+        :raise NotImplementedError: always
+        """
+        raise NotImplementedError
+
+    def load_from_remote(self, url: str | None = None) -> None:
+        """Load DB from remote dump. Not available for the in-memory database.
+
+        :param url: remote location to retrieve gzipped dump file from
+        :raise NotImplementedError: always
+        """
+        raise NotImplementedError
+
+    def export_db(self, output_directory: Path) -> None:
+        """Dump all loaded data to a file that can be loaded by another
+        ``MemoryDatabase`` instance.
+
+        :param output_directory: path to directory to save DB dump in
+        :return: Nothing, but saves dump to gzip file named
+            `gene_norm_<date and time>.ndjson.gz`
+        :raise ValueError: if output directory isn't a directory or doesn't exist
+        """
+        if not output_directory.is_dir() or not output_directory.exists():
+            err_msg = (
+                f"Output location {output_directory} isn't a directory or doesn't exist"
+            )
+            raise ValueError(err_msg)
+
+        now = datetime.datetime.now(tz=datetime.UTC).strftime("%Y%m%d%H%M%S")
+        output_location = output_directory / f"gene_norm_{now}.ndjson.gz"
+        with gzip.open(output_location, "wt", encoding="utf-8") as f:
+            for src_name, metadata in self._sources.items():
+                item = {"item_type": "source", "src_name": src_name, **metadata}
+                f.write(json.dumps(item) + "\n")
+            item = {"item_type": "data_version", "version": self.get_data_version()}
+            f.write(json.dumps(item) + "\n")
+            for record in self._records.values():
+                f.write(json.dumps(record) + "\n")
+            for record in self._merged_records.values():
+                f.write(json.dumps(record) + "\n")
+        _logger.info("Exported in-memory database to %s", output_location)
+
+
+class AsyncMemoryDatabase(AbstractAsyncDatabase):
+    """Asynchronous interface to :py:class:`MemoryDatabase`. Lookups never block, so
+    they're performed directly on the event loop.
+    """
+
+    def __init__(self, db_url: str | None = None, **db_args) -> None:
+        """Initialize database by loading all data into memory.
+
+        :param db_url: ``memory://`` URL containing path to dump file, or ``memory+``
+            prefixed address of another database to copy data from
+        :Keyword Arguments:
+            * database: existing database instance to copy data from
+        :raise DatabaseInitializationException: if no data source is given, or if
+            loading data fails
+        """
+        self.db = MemoryDatabase(db_url, **db_args)
+
+    async def open_connection(self) -> None:
+        """Perform any connection setup procedures. Not needed for the in-memory
+        database.
+        """
+
+    async def close_connection(self) -> None:
+        """Perform any manual connection closure procedures. Not needed for the
+        in-memory database.
+        """
+
+    async def get_source_metadata(self, src_name: str | SourceName) -> dict:
+        """Get license, versioning, data lookup, etc information for a source.
+
+        :param src_name: name of the source to get data for
+        :raise DatabaseReadException: if source metadata isn't loaded
+        """
+        return self.db.get_source_metadata(src_name)
+
+    async def get_data_version(self) -> str:
+        """Get an identifier for the loaded data.
+
+        :return: data version identifier
+        """
+        return self.db.get_data_version()
+
+    async def get_term_filter(self) -> bytes | None:
+        """Get the stored filter of all searchable terms.
+
+        :return: None
+        """
+        return self.db.get_term_filter()
+
+    async def get_term_resolution(self, term: str) -> dict | None:  # noqa: ARG002
+        """Get the precomputed normalized concept for a term. Not stored by the
+        in-memory database.
+
+        :param term: lowercased concept ID or term
+        :return: None
+        """
+        return None
+
+    async def get_record_by_id(
+        self, concept_id: str, case_sensitive: bool = True, merge: bool = False
+    ) -> dict | None:
+        """Fetch record corresponding to provided concept ID
+
+        :param concept_id: concept ID for gene record
+        :param case_sensitive: Not used by in-memory instance.
+        :param merge: if true, look for merged record; look for identity record
+            otherwise.
+        :return: complete gene record, if match is found; None otherwise
+        """
+        return self.db.get_record_by_id(concept_id, case_sensitive, merge)
+
+    async def get_records_by_ids(
+        self,
+        concept_ids: Iterable[str],
+        case_sensitive: bool = True,
+        merge: bool = False,
+    ) -> list[dict]:
+        """Fetch records for many concept IDs at once.
+
+        :param concept_ids: concept IDs for gene records
+        :param case_sensitive: Not used by in-memory instance.
+        :param merge: if true, look for merged records; look for identity records
+            otherwise.
+        :return: complete gene records for each concept ID that could be found, in the
+            order requested
+        """
+        return self.db.get_records_by_ids(concept_ids, case_sensitive, merge)
+
+    async def get_refs_by_type(self, search_term: str, ref_type: RefType) -> list[str]:
+        """Retrieve concept IDs for records matching the user's query.
+
+        :param search_term: string to match against
+        :param ref_type: type of match to look for.
+        :return: list of associated concept IDs. Empty if lookup fails.
+        """
+        return self.db.get_refs_by_type(search_term, ref_type)
+
+    async def get_refs_by_terms(
+        self, search_terms: Iterable[str], ref_type: RefType
+    ) -> dict[str, list[str]]:
+        """Retrieve concept IDs for many search terms at once.
+
+        :param search_terms: lowercase strings to match against
+        :param ref_type: type of match to look for.
+        :return: mapping from each search term with at least one match to its
+            associated concept IDs
+        """
+        return self.db.get_refs_by_terms(search_terms, ref_type)
+
+    async def get_match_tiers(self, search_term: str) -> dict | None:  # noqa: ARG002
+        """Look up every normalization match tier for a term at once. Not supported by
+        the in-memory database.
+
+        :param search_term: string to match against
+        :return: None
+        """
+        return None
+
+    async def get_search_matches(
+        self,
+        search_terms: Iterable[str],  # noqa: ARG002
+        sources: Iterable[str],  # noqa: ARG002
+    ) -> list[tuple[str, str, dict]] | None:
+        """Retrieve records matching several search terms in a single lookup. Not
+        supported by the in-memory database.
+
+        :param search_terms: lowercase strings to match against
+        :param sources: names of sources to retrieve records from
+        :return: None
+        """
+        return None
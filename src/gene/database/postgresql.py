@@ -1,29 +1,36 @@
 """Provide PostgreSQL client."""
 
 import atexit
+import contextlib
 import datetime
+import gzip
 import json
 import logging
 import os
 import tarfile
 import tempfile
-from collections.abc import Generator
+from collections.abc import Generator, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, ClassVar
 
 import psycopg
 import requests
+from psycopg import sql
 from psycopg.errors import (
     DuplicateObject,
     DuplicateTable,
     UndefinedTable,
-    UniqueViolation,
 )
+from psycopg.types.json import Jsonb
+from psycopg_pool import AsyncConnectionPool, ConnectionPool, PoolTimeout
 
 from gene.config import get_config
 from gene.database import (
+    AbstractAsyncDatabase,
     AbstractDatabase,
     DatabaseException,
+    DatabaseInitializationException,
     DatabaseReadException,
     DatabaseWriteException,
 )
@@ -33,6 +40,7 @@ from gene.schemas import (
     RefType,
     SourceMeta,
     SourceName,
+    SourcePriority,
 )
 
 _logger = logging.getLogger(__name__)
@@ -41,11 +49,63 @@ _logger = logging.getLogger(__name__)
 SCRIPTS_DIR = Path(__file__).parent / "postgresql"
 
 
+def _get_conninfo(db_url: str | None = None, **db_args) -> str:
+    """Construct connection description from provided arguments and configuration.
+
+    :param db_url: libpq compliant database connection URI
+    :param db_args: ``user``, ``password``, and ``db_name`` connection parameters,
+        used if no URI is given or configured
+    :return: libpq compliant database connection URI
+    """
+    if db_url:
+        return db_url
+    if "db_url" in get_config().model_fields_set:
+        return get_config().db_url
+    user = db_args.get("user", "postgres")
+    password = db_args.get("password", "")
+    db_name = db_args.get("db_name", "gene_normalizer")
+    if password:
+        return f"postgresql://{user}:{password}@/{db_name}"
+    return f"postgresql://{user}@/{db_name}"
+
+
+def _create_pool(
+    pool_class: type[ConnectionPool] | type[AsyncConnectionPool],
+    conninfo: str,
+    connection_kwargs: dict | None = None,
+    **db_args,
+) -> ConnectionPool | AsyncConnectionPool:
+    """Create an unopened connection pool, sized from provided arguments or
+    configuration.
+
+    Connections are checked before they're handed out, and replaced if they've been
+    broken (e.g. by a database restart), so callers don't see stale connections.
+
+    :param pool_class: sync or async pool class
+    :param conninfo: libpq compliant database connection URI
+    :param connection_kwargs: additional keyword arguments for each connection
+    :param db_args: ``min_size`` and ``max_size`` pool parameters
+    :return: connection pool
+    """
+    config = get_config()
+    return pool_class(
+        conninfo,
+        min_size=db_args.get("min_size", config.db_pool_min_size),
+        max_size=db_args.get("max_size", config.db_pool_max_size),
+        kwargs=connection_kwargs,
+        check=pool_class.check_connection,
+        open=False,
+    )
+
+
 class PostgresDatabase(AbstractDatabase):
-    """Database class employing PostgreSQL."""
+    """Database class employing PostgreSQL. Each method call checks out its own
+    connection from a pool, so that the instance can be shared between threads, and
+    a failed call can't leave a broken connection behind for later calls.
+    """
 
     def __init__(self, db_url: str | None = None, **db_args) -> None:
-        """Initialize Postgres connection.
+        """Initialize Postgres connection pool.
 
         >>> from gene.database.postgresql import PostgresDatabase
         >>> db = PostgresDatabase(
@@ -58,28 +118,44 @@ class PostgresDatabase(AbstractDatabase):
             * user: Postgres username
             * password: Postgres password (optional or blank if unneeded)
             * db_name: name of database to connect to
+            * min_size: minimum number of pooled connections (default from
+              ``GENE_NORM_DB_POOL_MIN_SIZE``, or 1)
+            * max_size: maximum number of pooled connections (default from
+              ``GENE_NORM_DB_POOL_MAX_SIZE``, or 10)
 
         :raise DatabaseInitializationException: if initial setup fails
         """
-        if db_url:
-            self.conninfo = db_url
-        elif "db_url" in get_config().model_fields_set:
-            self.conninfo = get_config().db_url
-        else:
-            user = db_args.get("user", "postgres")
-            password = db_args.get("password", "")
-            db_name = db_args.get("db_name", "gene_normalizer")
-            if password:
-                self.conninfo = f"postgresql://{user}:{password}@/{db_name}"
-            else:
-                self.conninfo = f"postgresql://{user}@/{db_name}"
-
-        self.conn = psycopg.connect(self.conninfo)
+        self.conninfo = _get_conninfo(db_url, **db_args)
+        self._db_args = db_args
+        self._pending_records: dict[str, dict] = {}
+        self._in_staged_update = False
+        self._has_term_resolutions = True
+        self._open_pool()
         self.initialize_db()
-        self._cached_sources = {}
 
         atexit.register(self.close_connection)
 
+    def _open_pool(self, search_path: str | None = None) -> None:
+        """Create and open the connection pool.
+
+        :param search_path: schema search path for pooled connections, if not the
+            default
+        :raise DatabaseInitializationException: if unable to connect
+        """
+        connection_kwargs = (
+            {"options": f"-c search_path={search_path}"} if search_path else None
+        )
+        self._connection_kwargs = connection_kwargs or {}
+        self.pool = _create_pool(
+            ConnectionPool, self.conninfo, connection_kwargs, **self._db_args
+        )
+        try:
+            self.pool.open(wait=True)
+        except PoolTimeout as e:
+            self.pool.close()
+            err_msg = f"Unable to connect to PostgreSQL database at {self.conninfo}"
+            raise DatabaseInitializationException(err_msg) from e
+
     _list_tables_query = b"""
     SELECT table_name FROM information_schema.tables
     WHERE table_schema = 'public'
@@ -91,12 +167,13 @@ class PostgresDatabase(AbstractDatabase):
 
         :return: Table names in database
         """
-        with self.conn.cursor() as cur:
+        with self.pool.connection() as conn, conn.cursor() as cur:
             cur.execute(self._list_tables_query)
             tables = cur.fetchall()
         return [t[0] for t in tables]
 
     _drop_db_query = b"""
+    -- replaced by gene_documents, but may remain in older databases
     DROP MATERIALIZED VIEW IF EXISTS record_lookup_view;
     DROP TABLE IF EXISTS
         gene_associations,
@@ -106,7 +183,19 @@ class PostgresDatabase(AbstractDatabase):
         gene_xrefs,
         gene_concepts,
         gene_merged,
-        gene_sources;
+        gene_sources,
+        gene_filters,
+        gene_metadata,
+        gene_term_resolution,
+        gene_terms,
+        gene_concepts_staging,
+        gene_symbols_staging,
+        gene_previous_symbols_staging,
+        gene_aliases_staging,
+        gene_xrefs_staging,
+        gene_associations_staging,
+        gene_documents,
+        gene_documents_staging;
     """
 
     def drop_db(self) -> None:
@@ -123,9 +212,8 @@ class PostgresDatabase(AbstractDatabase):
         except DatabaseWriteException:  # noqa: TRY203
             raise
 
-        with self.conn.cursor() as cur:
+        with self.pool.connection() as conn, conn.cursor() as cur:
             cur.execute(self._drop_db_query)
-            self.conn.commit()
         _logger.info("Dropped all existing gene normalizer tables.")
 
     def check_schema_initialized(self) -> bool:
@@ -133,44 +221,31 @@ class PostgresDatabase(AbstractDatabase):
 
         :return: True if DB appears to be fully initialized, False otherwise
         """
-        try:
-            with self.conn.cursor() as cur:
-                cur.execute((SCRIPTS_DIR / "create_tables.sql").read_bytes())
-        except DuplicateTable:
-            self.conn.rollback()
-        else:
-            _logger.info("Gene table existence check failed.")
-            self.conn.rollback()
-            return False
-        try:
-            with self.conn.cursor() as cur:
-                cur.execute((SCRIPTS_DIR / "add_fkeys.sql").read_bytes())
-        except DuplicateObject:
-            self.conn.rollback()
-        else:
-            _logger.info("Gene foreign key existence check failed.")
-            self.conn.rollback()
-            return False
-        try:
-            with self.conn.cursor() as cur:
-                cur.execute(
-                    (SCRIPTS_DIR / "create_record_lookup_view.sql").read_bytes()
-                )
-        except DuplicateTable:
-            self.conn.rollback()
-        else:
-            _logger.info("Gene normalized view lookup failed.")
-            self.conn.rollback()
-            return False
-        try:
-            with self.conn.cursor() as cur:
-                cur.execute((SCRIPTS_DIR / "add_indexes.sql").read_bytes())
-        except DuplicateTable:
-            self.conn.rollback()
-        else:
-            _logger.info("Gene indexes check failed.")
-            self.conn.rollback()
-            return False
+        checks = [
+            ("create_tables.sql", DuplicateTable, "Gene table existence check failed."),
+            (
+                "add_fkeys.sql",
+                DuplicateObject,
+                "Gene foreign key existence check failed.",
+            ),
+            (
+                "create_documents_table.sql",
+                DuplicateTable,
+                "Gene document table existence check failed.",
+            ),
+            ("add_indexes.sql", DuplicateTable, "Gene indexes check failed."),
+        ]
+        with self.pool.connection() as conn:
+            for script, expected_error, failure_msg in checks:
+                try:
+                    with conn.cursor() as cur:
+                        cur.execute((SCRIPTS_DIR / script).read_bytes())
+                except expected_error:
+                    conn.rollback()
+                else:
+                    _logger.info(failure_msg)
+                    conn.rollback()
+                    return False
 
         return True
 
@@ -187,21 +262,21 @@ class PostgresDatabase(AbstractDatabase):
 
         :return: True if queries successful, false if DB appears empty
         """
-        with self.conn.cursor() as cur:
+        with self.pool.connection() as conn, conn.cursor() as cur:
             cur.execute(self._check_sources_query)
             results = cur.fetchall()
         if len(results) < len(SourceName):
             _logger.info("Gene sources table is missing expected sources.")
             return False
 
-        with self.conn.cursor() as cur:
+        with self.pool.connection() as conn, conn.cursor() as cur:
             cur.execute(self._check_concepts_query)
             result = cur.fetchone()
         if not result or result[0] < 1:
             _logger.info("Gene records table is empty.")
             return False
 
-        with self.conn.cursor() as cur:
+        with self.pool.connection() as conn, conn.cursor() as cur:
             cur.execute(self._check_merged_query)
             result = cur.fetchone()
         if not result or result[0] < 1:
@@ -211,68 +286,123 @@ class PostgresDatabase(AbstractDatabase):
         return True
 
     def initialize_db(self) -> None:
-        """Check if DB is set up. If not, create tables/indexes/views."""
+        """Check if DB is set up. If not, create tables/indexes. Databases created
+        before source records were stored as documents are migrated in place.
+        """
+        if self._has_legacy_schema():
+            self._migrate_legacy_schema()
         if not self.check_schema_initialized():
             self.drop_db()
             self._create_tables()
-            self._create_views()
+            self._create_documents_table()
             self._add_indexes()
+        self._create_derived_tables()
 
-    def _create_views(self) -> None:
-        """Create materialized views."""
-        create_view_query = (SCRIPTS_DIR / "create_record_lookup_view.sql").read_bytes()
-        with self.conn.cursor() as cur:
-            cur.execute(create_view_query)
-            self.conn.commit()
-
-    _refresh_views_query = b"REFRESH MATERIALIZED VIEW record_lookup_view;"
+    def _has_legacy_schema(self) -> bool:
+        """Check whether the DB holds records without source record documents, i.e.
+        was created (or loaded from a ``pg_dump`` archive) by an earlier version.
 
-    def _refresh_views(self) -> None:
-        """Update materialized views.
+        :return: True if the DB needs to be migrated
+        """
+        tables = self.list_tables()
+        return "gene_concepts" in tables and "gene_documents" not in tables
 
-        Not responsible for ensuring existence of views. Calling functions should
-        either check beforehand or catch psycopg.UndefinedTable.
+    def _migrate_legacy_schema(self) -> None:
+        """Build the source record document table, and other derived tables, from the
+        records of a DB created by an earlier version, keeping its data.
+        """
+        _logger.info("Migrating existing gene records to source record documents.")
+        with self.pool.connection() as conn, conn.cursor() as cur:
+            cur.execute((SCRIPTS_DIR / "create_documents_table.sql").read_bytes())
+            cur.execute((SCRIPTS_DIR / "migrate_to_documents.sql").read_bytes())
+        self._refresh_terms()
+        self.update_term_resolutions()
+
+    def _create_derived_tables(self) -> None:
+        """Create the (initially empty) tables of precomputed term resolutions and of
+        data version metadata, if needed, so that lookups don't have to detect their
+        absence.
+        """
+        with self.pool.connection() as conn, conn.cursor() as cur:
+            cur.execute((SCRIPTS_DIR / "create_term_resolution_table.sql").read_bytes())
+            cur.execute(self._create_metadata_table_query)
+        self._has_term_resolutions = True
+
+    def _create_documents_table(self) -> None:
+        """Create table of source record documents."""
+        create_table_query = (SCRIPTS_DIR / "create_documents_table.sql").read_bytes()
+        with self.pool.connection() as conn, conn.cursor() as cur:
+            cur.execute(create_table_query)
+
+    _clear_gene_terms_query = b"DELETE FROM gene_terms;"
+
+    def _refresh_terms(self) -> None:
+        """Rebuild the search term table (creating it if needed, so that existing
+        databases don't need to be rebuilt). Readers continue to see the previous
+        terms until the rebuild is committed.
+
+        Not responsible for ensuring existence of source tables. Calling functions
+        should either check beforehand or catch psycopg.UndefinedTable.
         """
-        with self.conn.cursor() as cur:
-            cur.execute(self._refresh_views_query)
-            self.conn.commit()
+        with self.pool.connection() as conn, conn.cursor() as cur:
+            cur.execute((SCRIPTS_DIR / "create_gene_terms_table.sql").read_bytes())
+            cur.execute(self._clear_gene_terms_query)
+            cur.execute((SCRIPTS_DIR / "update_gene_terms.sql").read_bytes())
 
     def _add_fkeys(self) -> None:
         """Add fkey relationships."""
         add_fkey_query = (SCRIPTS_DIR / "add_fkeys.sql").read_bytes()
-        with self.conn.cursor() as cur:
+        with self.pool.connection() as conn, conn.cursor() as cur:
             cur.execute(add_fkey_query)
-            self.conn.commit()
 
     def _drop_fkeys(self) -> None:
         """Drop fkey relationships."""
         drop_fkey_query = (SCRIPTS_DIR / "drop_fkeys.sql").read_bytes()
-        with self.conn.cursor() as cur:
+        with self.pool.connection() as conn, conn.cursor() as cur:
             cur.execute(drop_fkey_query)
-            self.conn.commit()
 
     def _add_indexes(self) -> None:
         """Create core search indexes."""
         add_indexes_query = (SCRIPTS_DIR / "add_indexes.sql").read_bytes()
-        with self.conn.cursor() as cur:
+        with self.pool.connection() as conn, conn.cursor() as cur:
             cur.execute(add_indexes_query)
-            self.conn.commit()
 
     def _drop_indexes(self) -> None:
         """Drop all custom indexes."""
         drop_indexes_query = (SCRIPTS_DIR / "drop_indexes.sql").read_bytes()
-        with self.conn.cursor() as cur:
+        with self.pool.connection() as conn, conn.cursor() as cur:
             cur.execute(drop_indexes_query)
-            self.conn.commit()
 
     def _create_tables(self) -> None:
-        """Create all tables, indexes, and views."""
+        """Create all tables."""
         _logger.debug("Creating new gene normalizer tables.")
         tables_query = (SCRIPTS_DIR / "create_tables.sql").read_bytes()
 
-        with self.conn.cursor() as cur:
+        with self.pool.connection() as conn, conn.cursor() as cur:
             cur.execute(tables_query)
-            self.conn.commit()
+
+    _get_source_metadata_query = b"SELECT * FROM gene_sources WHERE name = %s;"
+
+    @staticmethod
+    def _format_source_metadata(metadata_row: tuple) -> dict:
+        """Restructure row from gene_sources table as source metadata object.
+
+        :param metadata_row: result tuple from psycopg
+        :return: reformatted dictionary keying metadata properties to row values
+        """
+        return {
+            "data_license": metadata_row[1],
+            "data_license_url": metadata_row[2],
+            "version": metadata_row[3],
+            "data_url": metadata_row[4],
+            "rdp_url": metadata_row[5],
+            "data_license_attributes": DataLicenseAttributes(
+                non_commercial=metadata_row[6],
+                attribution=metadata_row[7],
+                share_alike=metadata_row[8],
+            ),
+            "genome_assemblies": metadata_row[9],
+        }
 
     def get_source_metadata(self, src_name: SourceName) -> dict:
         """Get license, versioning, data lookup, etc information for a source.
@@ -282,58 +412,57 @@ class PostgresDatabase(AbstractDatabase):
         if isinstance(src_name, SourceName):
             src_name = src_name.value
 
-        if src_name in self._cached_sources:
-            return self._cached_sources[src_name]
-
-        metadata_query = "SELECT * FROM gene_sources WHERE name = %s;"
-        with self.conn.cursor() as cur:
-            cur.execute(metadata_query, [src_name])
+        with self.pool.connection() as conn, conn.cursor() as cur:
+            cur.execute(self._get_source_metadata_query, [src_name])
             metadata_result = cur.fetchone()
             if not metadata_result:
                 err_msg = f"{src_name} metadata lookup failed"
                 raise DatabaseReadException(err_msg)
-            metadata = {
-                "data_license": metadata_result[1],
-                "data_license_url": metadata_result[2],
-                "version": metadata_result[3],
-                "data_url": metadata_result[4],
-                "rdp_url": metadata_result[5],
-                "data_license_attributes": DataLicenseAttributes(
-                    non_commercial=metadata_result[6],
-                    attribution=metadata_result[7],
-                    share_alike=metadata_result[8],
-                ),
-                "genome_assemblies": metadata_result[9],
-            }
-            self._cached_sources[src_name] = metadata
-            return metadata
-
-    _get_record_query = (
-        b"SELECT * FROM record_lookup_view WHERE lower(concept_id) = %s;"
+            return self._format_source_metadata(metadata_result)
+
+    _get_data_version_query = b"""
+        SELECT name, version FROM (
+            SELECT 0 AS rank, name, version FROM gene_sources
+            UNION ALL
+            SELECT 1, name, value FROM gene_metadata WHERE name = 'merge_timestamp'
+        ) AS versions
+        ORDER BY rank, name;
+    """
+    # for databases created before merge timestamps were recorded
+    _get_source_versions_query = (
+        b"SELECT name, version FROM gene_sources ORDER BY name;"
     )
 
-    def _format_source_record(self, source_row: tuple) -> dict:
-        """Restructure row from gene_concepts table as source record result object.
+    def get_data_version(self) -> str:
+        """Get an identifier for the currently-loaded data, built from the version of
+        each loaded source and the time that normalized records were last generated.
+        Always reads directly from the DB, so it changes as soon as a source is
+        reloaded or records are merged.
 
-        :param source_row: result tuple from psycopg
+        :return: data version identifier
+        """
+        try:
+            with self.pool.connection() as conn, conn.cursor() as cur:
+                cur.execute(self._get_data_version_query)
+                results = cur.fetchall()
+        except UndefinedTable:
+            with self.pool.connection() as conn, conn.cursor() as cur:
+                cur.execute(self._get_source_versions_query)
+                results = cur.fetchall()
+        return ";".join(f"{name}:{version}" for name, version in results)
+
+    _get_record_query = b"SELECT document, merge_ref FROM gene_documents WHERE concept_id_lowercase = %s;"
+
+    @staticmethod
+    def _format_source_record(source_row: tuple) -> dict:
+        """Restructure row from gene_documents table as source record result object.
+
+        :param source_row: document and merge_ref tuple from psycopg
         :return: reformatted dictionary keying gene properties to row values
         """
         gene_record = {
-            "concept_id": source_row[0],
-            "symbol_status": source_row[1],
-            "label": source_row[2],
-            "strand": source_row[3],
-            "location_annotations": source_row[4],
-            "locations": source_row[5],
-            "gene_type": source_row[6],
-            "aliases": source_row[7],
-            "associated_with": source_row[8],
-            "previous_symbols": source_row[9],
-            "symbol": source_row[10],
-            "xrefs": source_row[11],
-            "gene_description": source_row[12],
-            "src_name": source_row[13],
-            "merge_ref": source_row[14],
+            **source_row[0],
+            "merge_ref": source_row[1],
             "item_type": RecordType.IDENTITY.value,
         }
         return {k: v for k, v in gene_record.items() if v}
@@ -347,14 +476,15 @@ class PostgresDatabase(AbstractDatabase):
         """
         concept_id_param = concept_id.lower()
 
-        with self.conn.cursor() as cur:
+        with self.pool.connection() as conn, conn.cursor() as cur:
             cur.execute(self._get_record_query, [concept_id_param])
             result = cur.fetchone()
         if not result:
             return None
         return self._format_source_record(result)
 
-    def _format_merged_record(self, merged_row: tuple) -> dict:
+    @staticmethod
+    def _format_merged_record(merged_row: tuple) -> dict:
         """Restructure row from gene_merged table as normalized result object.
 
         :param merged_row: result tuple from psycopg
@@ -393,7 +523,7 @@ class PostgresDatabase(AbstractDatabase):
         :return: normalized record if successful
         """
         concept_id = concept_id.lower()
-        with self.conn.cursor() as cur:
+        with self.pool.connection() as conn, conn.cursor() as cur:
             cur.execute(self._get_merged_record_query, [concept_id])
             result = cur.fetchone()
         if not result:
@@ -418,6 +548,45 @@ class PostgresDatabase(AbstractDatabase):
 
         return self._get_record(concept_id)
 
+    _get_records_query = b"SELECT document, merge_ref FROM gene_documents WHERE concept_id_lowercase = ANY(%s);"
+    _get_merged_records_query = (
+        b"SELECT * FROM gene_merged WHERE lower(concept_id) = ANY(%s);"
+    )
+
+    def get_records_by_ids(
+        self,
+        concept_ids: Iterable[str],
+        case_sensitive: bool = True,  # noqa: ARG002
+        merge: bool = False,
+    ) -> list[dict]:
+        """Fetch records for many concept IDs at once, using a single query.
+
+        :param concept_ids: concept IDs for gene records
+        :param case_sensitive: Not used by PostgreSQL instance.
+        :param merge: if true, look for merged records; look for identity records
+            otherwise.
+        :return: complete gene records for each concept ID that could be found, in the
+            order requested
+        """
+        concept_ids = list(dict.fromkeys(c.lower() for c in concept_ids))
+        if not concept_ids:
+            return []
+        if merge:
+            query = self._get_merged_records_query
+            format_record = self._format_merged_record
+        else:
+            query = self._get_records_query
+            format_record = self._format_source_record
+
+        with self.pool.connection() as conn, conn.cursor() as cur:
+            cur.execute(query, [concept_ids])
+            results = cur.fetchall()
+        records = {}
+        for result in results:
+            record = format_record(result)
+            records[record["concept_id"].lower()] = record
+        return [records[c] for c in concept_ids if c in records]
+
     _ref_types_query: ClassVar[dict] = {
         RefType.SYMBOL: b"SELECT concept_id FROM gene_symbols WHERE lower(symbol) = %s;",
         RefType.PREVIOUS_SYMBOLS: b"SELECT concept_id FROM gene_previous_symbols WHERE lower(prev_symbol) = %s;",
@@ -426,6 +595,13 @@ class PostgresDatabase(AbstractDatabase):
         RefType.ASSOCIATED_WITH: b"SELECT concept_id FROM gene_associations WHERE lower(associated_with) = %s;",
     }
 
+    # queries for each normalization match tier, in order of precedence
+    _match_tier_queries: ClassVar[list[bytes]] = [
+        _get_merged_record_query,
+        _get_record_query,
+        *map(_ref_types_query.get, RefType),
+    ]
+
     def get_refs_by_type(self, search_term: str, ref_type: RefType) -> list[str]:
         """Retrieve concept IDs for records matching the user's query. Other methods
         are responsible for actually retrieving full records.
@@ -439,7 +615,7 @@ class PostgresDatabase(AbstractDatabase):
             err_msg = "invalid reference type"
             raise ValueError(err_msg)
 
-        with self.conn.cursor() as cur:
+        with self.pool.connection() as conn, conn.cursor() as cur:
             cur.execute(query, (search_term.lower(),))
             concept_ids = cur.fetchall()
         if concept_ids:
@@ -447,6 +623,134 @@ class PostgresDatabase(AbstractDatabase):
 
         return []
 
+    _ref_types_batch_query: ClassVar[dict] = {
+        RefType.SYMBOL: b"SELECT lower(symbol), concept_id FROM gene_symbols WHERE lower(symbol) = ANY(%s);",
+        RefType.PREVIOUS_SYMBOLS: b"SELECT lower(prev_symbol), concept_id FROM gene_previous_symbols WHERE lower(prev_symbol) = ANY(%s);",
+        RefType.ALIASES: b"SELECT lower(alias), concept_id FROM gene_aliases WHERE lower(alias) = ANY(%s);",
+        RefType.XREFS: b"SELECT lower(xref), concept_id FROM gene_xrefs WHERE lower(xref) = ANY(%s);",
+        RefType.ASSOCIATED_WITH: b"SELECT lower(associated_with), concept_id FROM gene_associations WHERE lower(associated_with) = ANY(%s);",
+    }
+
+    def get_refs_by_terms(
+        self, search_terms: Iterable[str], ref_type: RefType
+    ) -> dict[str, list[str]]:
+        """Retrieve concept IDs for many search terms at once, using a single query.
+
+        :param search_terms: lowercase strings to match against
+        :param ref_type: type of match to look for.
+        :return: mapping from each search term with at least one match to its
+            associated concept IDs
+        """
+        query = self._ref_types_batch_query.get(ref_type)
+        if not query:
+            err_msg = "invalid reference type"
+            raise ValueError(err_msg)
+
+        refs = {}
+        with self.pool.connection() as conn, conn.cursor() as cur:
+            cur.execute(query, ([term.lower() for term in search_terms],))
+            for term, concept_id in cur.fetchall():
+                refs.setdefault(term, []).append(concept_id)
+        return refs
+
+    def _fetch_match_tiers(self, search_term: str, queries: list[bytes]) -> list:
+        """Send queries as prepared statements in pipeline mode, in a single network
+        exchange.
+
+        :param search_term: lowercased string to match against
+        :param queries: SQL queries, each taking the search term as its parameter
+        :return: result rows for each query
+        """
+        with self.pool.connection() as conn:
+            cursors = [conn.cursor() for _ in queries]
+            with conn.pipeline():
+                for cur, query in zip(cursors, queries, strict=True):
+                    cur.execute(query, [search_term], prepare=True)
+            return [cur.fetchall() for cur in cursors]
+
+    def get_match_tiers(self, search_term: str) -> dict | None:
+        """Look up the precomputed resolution and every normalization match tier for a
+        term in a single network exchange, by sending each query as a prepared
+        statement in pipeline mode.
+
+        :param search_term: string to match against
+        :return: term resolution, matching merged record, identity record, and concept
+            IDs for each reference type
+        """
+        search_term = search_term.lower()
+        if self._has_term_resolutions:
+            try:
+                results = self._fetch_match_tiers(
+                    search_term, self._resolved_match_tier_queries
+                )
+            except UndefinedTable:
+                # remember, so that later lookups don't repeat the failing query
+                _logger.warning("Term resolution table not found")
+                self._has_term_resolutions = False
+            else:
+                return self._format_match_tiers(results)
+        results = [[], *self._fetch_match_tiers(search_term, self._match_tier_queries)]
+        return self._format_match_tiers(results)
+
+    @classmethod
+    def _format_match_tiers(cls, results: list[list[tuple]]) -> dict:
+        """Restructure results of match tier queries.
+
+        :param results: result rows for each query in
+            ``_resolved_match_tier_queries``
+        :return: term resolution, matching merged record, identity record, and concept
+            IDs for each reference type
+        """
+        resolution_rows, merged_rows, record_rows, *ref_rows = results
+        return {
+            "resolution": cls._format_term_resolution(resolution_rows[0])
+            if resolution_rows
+            else None,
+            "merged_record": cls._format_merged_record(merged_rows[0])
+            if merged_rows
+            else None,
+            "record": cls._format_source_record(record_rows[0])
+            if record_rows
+            else None,
+            "refs": {
+                ref_type: [row[0] for row in rows]
+                for ref_type, rows in zip(RefType, ref_rows, strict=True)
+            },
+        }
+
+    _get_search_matches_query = b"""
+        SELECT gt.term, gt.ref_type, gd.document, gd.merge_ref
+        FROM gene_terms AS gt
+        INNER JOIN gene_documents AS gd
+            ON gd.concept_id_lowercase = lower(gt.concept_id)
+        WHERE gt.term = ANY(%s) AND gt.source = ANY(%s);
+    """
+
+    def get_search_matches(
+        self, search_terms: Iterable[str], sources: Iterable[str]
+    ) -> list[tuple[str, str, dict]] | None:
+        """Retrieve identity records matching any of several search terms, by concept
+        ID or by any reference type, with a single query against the ``gene_terms``
+        table.
+
+        :param search_terms: lowercase strings to match against
+        :param sources: names of sources to retrieve records from
+        :return: (search term, match type, record) for every match, or None if the
+            term table hasn't been created yet
+        """
+        try:
+            with self.pool.connection() as conn, conn.cursor() as cur:
+                cur.execute(
+                    self._get_search_matches_query,
+                    [list(search_terms), list(sources)],
+                )
+                results = cur.fetchall()
+        except UndefinedTable:
+            return None
+        return [
+            (row[0], row[1], self._format_source_record(row[2:])) for row in results
+        ]
+
     _ids_query = b"SELECT concept_id FROM gene_concepts;"
 
     def get_all_concept_ids(self) -> set[str]:
@@ -454,16 +758,36 @@ class PostgresDatabase(AbstractDatabase):
 
         :return: Set of concept IDs as strings.
         """
-        with self.conn.cursor() as cur:
+        with self.pool.connection() as conn, conn.cursor() as cur:
             cur.execute(self._ids_query)
             ids_tuple = cur.fetchall()
         return {i[0] for i in ids_tuple}
 
     _get_all_normalized_records_query = b"SELECT * FROM gene_merged;"
     _get_all_unmerged_source_records_query = (
-        b"SELECT * FROM record_lookup_view WHERE merge_ref IS NULL;"
+        b"SELECT document, merge_ref FROM gene_documents WHERE merge_ref IS NULL;"
     )
-    _get_all_source_records_query = b"SELECT * FROM record_lookup_view;"
+    _get_all_source_records_query = b"SELECT document, merge_ref FROM gene_documents;"
+
+    def _stream_rows(self, query: bytes) -> Generator[tuple, None, None]:
+        """Stream the result rows of a query with a named, server-side cursor, so that
+        only a bounded number of rows (``GENE_NORM_DB_CURSOR_ITERSIZE``, 500 by
+        default) is held in memory at once.
+
+        The cursor uses its own connection rather than a pooled one, since it stays
+        open for as long as the caller keeps iterating. Otherwise, callers that query
+        the database while iterating could wait forever on an exhausted pool.
+
+        :param query: SQL query
+        :return: Generator that lazily provides rows as they are retrieved
+        """
+        with (
+            psycopg.connect(self.conninfo, **self._connection_kwargs) as conn,
+            conn.cursor(name="gene_normalizer_stream") as cur,
+        ):
+            cur.itersize = get_config().db_cursor_itersize
+            cur.execute(query)
+            yield from cur
 
     def get_all_records(self, record_type: RecordType) -> Generator[dict, None, None]:
         """Retrieve all source or normalized records. Either return all source records,
@@ -483,34 +807,157 @@ class PostgresDatabase(AbstractDatabase):
         return first, and iteration continues with all source records that don't
         belong to a normalized concept group.
 
+        Rows are streamed from server-side cursors, so memory use doesn't grow with
+        table size. Each cursor has a dedicated connection, so other methods can still
+        be called during iteration, even with a single-connection pool.
+
         :param record_type: type of result to return
         :return: Generator that lazily provides records as they are retrieved
         """
-        batch_size = 500
-
         if record_type == RecordType.MERGER:
-            with self.conn.cursor() as cur:
-                results = cur.execute(self._get_all_normalized_records_query)
-                fetched = results.fetchmany(batch_size)
-                while fetched:
-                    for row in fetched:
-                        yield self._format_merged_record(row)
-                    fetched = results.fetchmany(batch_size)
-            with self.conn.cursor() as cur:
-                results = cur.execute(self._get_all_unmerged_source_records_query)
-                fetched = results.fetchmany(batch_size)
-                while fetched:
-                    for result in fetched:
-                        yield self._format_source_record(result)
-                    fetched = results.fetchmany(batch_size)
+            for row in self._stream_rows(self._get_all_normalized_records_query):
+                yield self._format_merged_record(row)
+            for row in self._stream_rows(self._get_all_unmerged_source_records_query):
+                yield self._format_source_record(row)
         else:
-            with self.conn.cursor() as cur:
-                results = cur.execute(self._get_all_source_records_query)
-                fetched = results.fetchmany(batch_size)
-                while fetched:
-                    for result in fetched:
-                        yield self._format_source_record(result)
-                    fetched = results.fetchmany(batch_size)
+            for row in self._stream_rows(self._get_all_source_records_query):
+                yield self._format_source_record(row)
+
+    _get_term_filter_query = b"SELECT data FROM gene_filters WHERE name = 'terms';"
+
+    def get_term_filter(self) -> bytes | None:
+        """Get the stored filter of all searchable terms.
+
+        :return: serialized filter, or None if no filter has been stored
+        """
+        try:
+            with self.pool.connection() as conn, conn.cursor() as cur:
+                cur.execute(self._get_term_filter_query)
+                result = cur.fetchone()
+        except UndefinedTable:
+            return None
+        return bytes(result[0]) if result else None
+
+    # created on demand, so that existing databases don't need to be rebuilt
+    _create_filters_table_query = b"""
+        CREATE TABLE IF NOT EXISTS gene_filters (
+            name VARCHAR(127) PRIMARY KEY,
+            data BYTEA NOT NULL
+        );
+    """
+    _set_term_filter_query = b"""
+        INSERT INTO gene_filters (name, data) VALUES ('terms', %s)
+        ON CONFLICT (name) DO UPDATE SET data = EXCLUDED.data;
+    """
+
+    def set_term_filter(self, data: bytes) -> None:
+        """Store a filter of all searchable terms, replacing any existing filter.
+
+        :param data: serialized filter
+        """
+        with self.pool.connection() as conn, conn.cursor() as cur:
+            cur.execute(self._create_filters_table_query)
+            cur.execute(self._set_term_filter_query, [data])
+
+    # created on demand, so that existing databases don't need to be rebuilt
+    _create_metadata_table_query = b"""
+        CREATE TABLE IF NOT EXISTS gene_metadata (
+            name VARCHAR(127) PRIMARY KEY,
+            value TEXT NOT NULL
+        );
+    """
+    _set_merge_timestamp_query = b"""
+        INSERT INTO gene_metadata (name, value) VALUES ('merge_timestamp', %s)
+        ON CONFLICT (name) DO UPDATE SET value = EXCLUDED.value;
+    """
+
+    def set_merge_timestamp(self, timestamp: str) -> None:
+        """Record when normalized records were last generated, replacing any
+        existing timestamp.
+
+        :param timestamp: ISO 8601 time of merged record generation
+        """
+        with self.pool.connection() as conn, conn.cursor() as cur:
+            cur.execute(self._create_metadata_table_query)
+            cur.execute(self._set_merge_timestamp_query, [timestamp])
+
+    _get_term_resolution_query = b"""
+        SELECT
+            gtr.match_type, gtr.concept_id, gtr.merged, gtr.alt_concepts,
+            gd.document, gd.merge_ref, gm.*
+        FROM gene_term_resolution AS gtr
+        LEFT JOIN gene_documents AS gd
+            ON NOT gtr.merged AND gd.concept_id_lowercase = lower(gtr.concept_id)
+        LEFT JOIN gene_merged AS gm
+            ON gtr.merged AND lower(gm.concept_id) = lower(gtr.concept_id)
+        WHERE gtr.term = %s;
+    """
+    _resolved_match_tier_queries: ClassVar[list[bytes]] = [
+        _get_term_resolution_query,
+        *_match_tier_queries,
+    ]
+
+    @classmethod
+    def _format_term_resolution(cls, row: tuple) -> dict:
+        """Restructure row from gene_term_resolution table, joined to the normalized
+        record, as a resolution object.
+
+        :param row: result tuple from psycopg
+        :return: resolution object
+        """
+        if row[2]:
+            record = cls._format_merged_record(row[6:]) if row[6] else None
+        else:
+            record = cls._format_source_record(row[4:6]) if row[4] else None
+        return {
+            "match_type": row[0],
+            "concept_id": row[1],
+            "merged": row[2],
+            "alt_concepts": row[3],
+            "record": record,
+        }
+
+    def get_term_resolution(self, term: str) -> dict | None:
+        """Get the precomputed normalized concept for a term, along with its record,
+        in a single query.
+
+        :param term: lowercased concept ID or term
+        :return: resolution object, or None if the term has no stored resolution
+        """
+        try:
+            with self.pool.connection() as conn, conn.cursor() as cur:
+                cur.execute(self._get_term_resolution_query, [term])
+                result = cur.fetchone()
+        except UndefinedTable:
+            return None
+        return self._format_term_resolution(result) if result else None
+
+    _clear_term_resolution_query = b"DELETE FROM gene_term_resolution;"
+
+    def _clear_term_resolutions(self, cur: psycopg.Cursor) -> None:
+        """Remove all precomputed term resolutions, creating their table if needed.
+        Does not commit.
+
+        :param cur: cursor to execute statements with
+        """
+        cur.execute((SCRIPTS_DIR / "create_term_resolution_table.sql").read_bytes())
+        cur.execute(self._clear_term_resolution_query)
+
+    def update_term_resolutions(self) -> None:
+        """Precompute the normalized concept that each concept ID and term resolves
+        to, replacing any existing resolutions. Readers continue to see the previous
+        resolutions until the update is committed.
+        """
+        with self.pool.connection() as conn, conn.cursor() as cur:
+            self._clear_term_resolutions(cur)
+            cur.execute(
+                (SCRIPTS_DIR / "update_term_resolution.sql").read_bytes(),
+                {
+                    "sources": [src.name for src in SourcePriority],
+                    "priorities": [src.value for src in SourcePriority],
+                },
+            )
+        self._has_term_resolutions = True
 
     _add_source_metadata_query = b"""
         INSERT INTO gene_sources(
@@ -528,7 +975,7 @@ class PostgresDatabase(AbstractDatabase):
         :param meta: known source attributes
         :raise DatabaseWriteException: if write fails
         """
-        with self.conn.cursor() as cur:
+        with self.pool.connection() as conn, conn.cursor() as cur:
             cur.execute(
                 self._add_source_metadata_query,
                 [
@@ -544,68 +991,145 @@ class PostgresDatabase(AbstractDatabase):
                     meta.genome_assemblies,
                 ],
             )
-        self.conn.commit()
 
-    _add_record_query = b"""
-    INSERT INTO gene_concepts (
-        concept_id, source, symbol_status, label,
-        strand, location_annotations, locations, gene_type,
-        gene_description
-    )
-    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s);
-    """
-    _ins_symbol_query = (
-        b"INSERT INTO gene_symbols (symbol, concept_id) VALUES (%s, %s);"
-    )
-    _ins_prev_symbol_query = (
-        b"INSERT INTO gene_previous_symbols (prev_symbol, concept_id) VALUES (%s, %s);"
-    )
-    _ins_alias_query = b"INSERT INTO gene_aliases (alias, concept_id) VALUES (%s, %s);"
-    _ins_xref_query = b"INSERT INTO gene_xrefs (xref, concept_id) VALUES (%s, %s);"
-    _ins_assoc_query = (
-        b"INSERT INTO gene_associations (associated_with, concept_id) VALUES (%s, %s);"
+    # columns written by COPY for each source record table
+    _copy_columns: ClassVar[dict[str, tuple[str, ...]]] = {
+        "gene_concepts": (
+            "concept_id",
+            "source",
+            "symbol_status",
+            "label",
+            "strand",
+            "location_annotations",
+            "locations",
+            "gene_type",
+            "gene_description",
+        ),
+        "gene_symbols": ("symbol", "concept_id"),
+        "gene_previous_symbols": ("prev_symbol", "concept_id"),
+        "gene_aliases": ("alias", "concept_id"),
+        "gene_xrefs": ("xref", "concept_id"),
+        "gene_associations": ("associated_with", "concept_id"),
+        "gene_documents": ("concept_id_lowercase", "source", "document"),
+    }
+    # record fields stored in each reference table
+    _ref_tables: ClassVar[dict[str, str]] = {
+        "previous_symbols": "gene_previous_symbols",
+        "aliases": "gene_aliases",
+        "xrefs": "gene_xrefs",
+        "associated_with": "gene_associations",
+    }
+    # record fields stored in each source record document
+    _document_fields: ClassVar[tuple[str, ...]] = (
+        "concept_id",
+        "symbol_status",
+        "label",
+        "strand",
+        "location_annotations",
+        "locations",
+        "gene_type",
+        "aliases",
+        "associated_with",
+        "previous_symbols",
+        "symbol",
+        "xrefs",
+        "gene_description",
+        "src_name",
     )
+    # number of buffered source records written at once
+    _copy_batch_size = 10000
 
     def add_record(self, record: dict, src_name: SourceName) -> None:  # noqa: ARG002
         """Add new record to database.
 
+        Records are buffered, and written in batches with ``COPY``. Call
+        :py:meth:`complete_write_transaction` to write any remaining records.
+
         :param record: record to upload
         :param src_name: name of source for record. Not used by PostgreSQL instance.
         """
         concept_id = record["concept_id"]
-        locations = [json.dumps(loc) for loc in record.get("locations", [])]
-        if not locations:
-            locations = None
-        with self.conn.cursor() as cur:
-            try:
-                cur.execute(
-                    self._add_record_query,
-                    [
-                        concept_id,
-                        record["src_name"],
-                        record.get("symbol_status"),
-                        record.get("label"),
-                        record.get("strand"),
-                        record.get("location_annotations"),
-                        locations,
-                        record.get("gene_type"),
-                        record.get("gene_description"),
-                    ],
+        if concept_id in self._pending_records:
+            _logger.error("Record with ID %s already exists", concept_id)
+            return
+        self._pending_records[concept_id] = record
+        if len(self._pending_records) >= self._copy_batch_size:
+            self._write_pending_records()
+
+    def _get_copy_rows(self, records: Iterable[dict]) -> dict[str, list[tuple]]:
+        """Construct table rows for source records.
+
+        :param records: source records
+        :return: rows to write to each source record table
+        """
+        rows = {table: [] for table in self._copy_columns}
+        for record in records:
+            concept_id = record["concept_id"]
+            locations = record.get("locations")
+            rows["gene_concepts"].append(
+                (
+                    concept_id,
+                    record["src_name"],
+                    record.get("symbol_status"),
+                    record.get("label"),
+                    record.get("strand"),
+                    record.get("location_annotations"),
+                    Jsonb(locations) if locations else None,
+                    record.get("gene_type"),
+                    record.get("gene_description"),
                 )
-                for a in record.get("aliases", []):
-                    cur.execute(self._ins_alias_query, [a, concept_id])
-                for x in record.get("xrefs", []):
-                    cur.execute(self._ins_xref_query, [x, concept_id])
-                for a in record.get("associated_with", []):
-                    cur.execute(self._ins_assoc_query, [a, concept_id])
-                for p in record.get("previous_symbols", []):
-                    cur.execute(self._ins_prev_symbol_query, [p, concept_id])
-                if record.get("symbol"):
-                    cur.execute(self._ins_symbol_query, [record["symbol"], concept_id])
-                self.conn.commit()
-            except UniqueViolation:
-                _logger.exception("Record with ID %s already exists", concept_id)
-                self.conn.rollback()
+            )
+            if record.get("symbol"):
+                rows["gene_symbols"].append((record["symbol"], concept_id))
+            for field, table in self._ref_tables.items():
+                rows[table].extend((term, concept_id) for term in record.get(field, []))
+            document = {
+                field: record[field]
+                for field in self._document_fields
+                if record.get(field)
+            }
+            rows["gene_documents"].append(
+                (concept_id.lower(), record["src_name"], Jsonb(document))
+            )
+        return rows
+
+    _get_existing_ids_query = (
+        b"SELECT concept_id FROM gene_concepts WHERE concept_id = ANY(%s);"
+    )
+    _copy_query = sql.SQL("COPY {} ({}) FROM STDIN")
+
+    def _write_pending_records(self) -> None:
+        """Write buffered source records with ``COPY``, in a single transaction.
+
+        Records that already exist in the database are skipped. If the
+        ``GENE_NORM_DB_UNLOGGED_STAGING`` setting is enabled, rows are copied into
+        UNLOGGED staging tables, and then moved into the main tables.
+        """
+        records = self._pending_records
+        self._pending_records = {}
+        if not records:
+            return
+        staging = get_config().db_unlogged_staging
+        with self.pool.connection() as conn, conn.cursor() as cur:
+            cur.execute(self._get_existing_ids_query, [list(records)])
+            for (concept_id,) in cur.fetchall():
+                _logger.error("Record with ID %s already exists", concept_id)
+                del records[concept_id]
+            if staging:
+                cur.execute((SCRIPTS_DIR / "create_staging_tables.sql").read_bytes())
+            for table, rows in self._get_copy_rows(records.values()).items():
+                if not rows:
+                    continue
+                query = self._copy_query.format(
+                    sql.Identifier(f"{table}_staging" if staging else table),
+                    sql.SQL(", ").join(map(sql.Identifier, self._copy_columns[table])),
+                )
+                with cur.copy(query) as copy:
+                    for row in rows:
+                        copy.write_row(row)
+            if staging:
+                cur.execute((SCRIPTS_DIR / "load_staging_tables.sql").read_bytes())
+        _logger.debug("Wrote %i records", len(records))
 
     _add_merged_record_query = b"""
     INSERT INTO gene_merged (
@@ -624,17 +1148,17 @@ class PostgresDatabase(AbstractDatabase):
         """
         ensembl_locations = record.get("ensembl_locations")
         if ensembl_locations:
-            ensembl_locations = [json.dumps(i) for i in ensembl_locations]
+            ensembl_locations = Jsonb(ensembl_locations)
         ncbi_locations = record.get("ncbi_locations")
         if ncbi_locations:
-            ncbi_locations = [json.dumps(i) for i in ncbi_locations]
+            ncbi_locations = Jsonb(ncbi_locations)
         hgnc_locations = record.get("hgnc_locations")
         if hgnc_locations:
-            hgnc_locations = [json.dumps(i) for i in hgnc_locations]
+            hgnc_locations = Jsonb(hgnc_locations)
         gene_description = record.get("gene_description")
         if gene_description:
             gene_description = json.dumps(gene_description)
-        with self.conn.cursor() as cur:
+        with self.pool.connection() as conn, conn.cursor() as cur:
             cur.execute(
                 self._add_merged_record_query,
                 [
@@ -657,13 +1181,17 @@ class PostgresDatabase(AbstractDatabase):
                     gene_description,
                 ],
             )
-            self.conn.commit()
 
     _update_merge_ref_query = b"""
     UPDATE gene_concepts
     SET merge_ref = %(merge_ref)s
     WHERE concept_id = %(concept_id)s;
     """
+    _update_document_merge_ref_query = b"""
+    UPDATE gene_documents
+    SET merge_ref = %(merge_ref)s
+    WHERE concept_id_lowercase = lower(%(concept_id)s);
+    """
 
     def update_merge_ref(self, concept_id: str, merge_ref: Any) -> None:  # noqa: ANN401
         """Update the merged record reference of an individual record to a new value.
@@ -672,13 +1200,11 @@ class PostgresDatabase(AbstractDatabase):
         :param merge_ref: new ref value
         :raise DatabaseWriteException: if attempting to update non-existent record
         """
-        with self.conn.cursor() as cur:
-            cur.execute(
-                self._update_merge_ref_query,
-                {"merge_ref": merge_ref, "concept_id": concept_id},
-            )
+        params = {"merge_ref": merge_ref, "concept_id": concept_id}
+        with self.pool.connection() as conn, conn.cursor() as cur:
+            cur.execute(self._update_merge_ref_query, params)
             row_count = cur.rowcount
-            self.conn.commit()
+            cur.execute(self._update_document_merge_ref_query, params)
 
         # UPDATE will fail silently unless we check the # of affected rows
         if row_count < 1:
@@ -699,9 +1225,9 @@ class PostgresDatabase(AbstractDatabase):
             encounters a failure in the process
         :raise DatabaseWriteException: if deletion call fails
         """
-        with self.conn.cursor() as cur:
+        with self.pool.connection() as conn, conn.cursor() as cur:
+            self._clear_term_resolutions(cur)
             cur.execute((SCRIPTS_DIR / "delete_normalized_concepts.sql").read_bytes())
-        self.conn.commit()
 
     _drop_aliases_query = b"""
     DELETE FROM gene_aliases WHERE id IN (
@@ -738,6 +1264,7 @@ class PostgresDatabase(AbstractDatabase):
         WHERE gc.source = %s
     );
     """
+    _drop_documents_query = b"DELETE FROM gene_documents WHERE source = %s;"
     _drop_concepts_query = b"DELETE FROM gene_concepts WHERE source = %s;"
     _drop_source_query = b"DELETE FROM gene_sources gs WHERE gs.name = %s;"
 
@@ -749,52 +1276,431 @@ class PostgresDatabase(AbstractDatabase):
         brittle, and it'd be nice to revisit in the future to perform as a single
         atomic transaction.
 
-        Refreshing the materialized view at the end might be redundant, because
+        Rebuilding the search term table at the end might be redundant, because
         this method will almost always be called right before more data is written,
         but it's probably necessary just in case that doesn't happen.
 
         :param src_name: name of source to delete
         :raise DatabaseWriteException: if deletion call fails
         """
-        with self.conn.cursor() as cur:
+        with self.pool.connection() as conn, conn.cursor() as cur:
+            self._clear_term_resolutions(cur)
             cur.execute(self._drop_aliases_query, [src_name.value])
             cur.execute(self._drop_associations_query, [src_name.value])
             cur.execute(self._drop_prev_symbols_query, [src_name.value])
             cur.execute(self._drop_symbols_query, [src_name.value])
             cur.execute(self._drop_xrefs_query, [src_name.value])
-        self._drop_fkeys()
-        self._drop_indexes()
+            cur.execute(self._drop_documents_query, [src_name.value])
+        # staged update tables don't have foreign keys or indexes until completion
+        if not self._in_staged_update:
+            self._drop_fkeys()
+            self._drop_indexes()
 
-        with self.conn.cursor() as cur:
+        with self.pool.connection() as conn, conn.cursor() as cur:
             cur.execute(self._drop_concepts_query, [src_name.value])
             cur.execute(self._drop_source_query, [src_name.value])
-            self.conn.commit()
 
-        self._add_fkeys()
-        self._add_indexes()
-        self._refresh_views()
+        if not self._in_staged_update:
+            self._add_fkeys()
+            self._add_indexes()
+            self._refresh_terms()
 
     def complete_write_transaction(self) -> None:
-        """Conclude transaction or batch writing if relevant."""
-        if not self.conn.closed:
-            try:
-                self._refresh_views()
-            except UndefinedTable:
-                self.conn.rollback()
+        """Write any buffered records, and rebuild the search term table (unless in
+        a staged update, which rebuilds it once on completion).
+        """
+        if not self.pool.closed:
+            self._write_pending_records()
+            if not self._in_staged_update:
+                with contextlib.suppress(UndefinedTable):
+                    self._refresh_terms()
 
     def close_connection(self) -> None:
         """Perform any manual connection closure procedures if necessary."""
-        if not self.conn.closed:
-            self.conn.commit()
-            self.conn.close()
+        if not self.pool.closed:
+            self._write_pending_records()
+            self.pool.close()
+
+    _staging_schema = "gene_staging"
+    _previous_schema = "gene_previous"
+    # tables holding normalizer data, which are replaced by a staged update and
+    # written to snapshots
+    _data_tables: ClassVar[tuple[str, ...]] = (
+        "gene_sources",
+        "gene_merged",
+        "gene_concepts",
+        "gene_symbols",
+        "gene_previous_symbols",
+        "gene_aliases",
+        "gene_xrefs",
+        "gene_associations",
+        "gene_documents",
+        "gene_terms",
+        "gene_term_resolution",
+        "gene_filters",
+        "gene_metadata",
+    )
+    _create_staging_schema_query = b"""
+        DROP SCHEMA IF EXISTS gene_staging CASCADE;
+        CREATE SCHEMA gene_staging;
+        SET LOCAL search_path TO gene_staging;
+    """
+    # carry over data for sources that aren't being reloaded. Reference table IDs
+    # are left to the new tables' sequences.
+    _copy_to_staging_queries: ClassVar[list[bytes]] = [
+        b"INSERT INTO gene_sources SELECT * FROM public.gene_sources WHERE name != ALL(%(sources)s);",
+        b"INSERT INTO gene_merged SELECT * FROM public.gene_merged;",
+        b"INSERT INTO gene_concepts SELECT * FROM public.gene_concepts WHERE source != ALL(%(sources)s);",
+        b"INSERT INTO gene_documents SELECT * FROM public.gene_documents WHERE source != ALL(%(sources)s);",
+        b"INSERT INTO gene_symbols (symbol, concept_id) SELECT symbol, concept_id FROM public.gene_symbols WHERE concept_id IN (SELECT concept_id FROM gene_concepts);",
+        b"INSERT INTO gene_previous_symbols (prev_symbol, concept_id) SELECT prev_symbol, concept_id FROM public.gene_previous_symbols WHERE concept_id IN (SELECT concept_id FROM gene_concepts);",
+        b"INSERT INTO gene_aliases (alias, concept_id) SELECT alias, concept_id FROM public.gene_aliases WHERE concept_id IN (SELECT concept_id FROM gene_concepts);",
+        b"INSERT INTO gene_xrefs (xref, concept_id) SELECT xref, concept_id FROM public.gene_xrefs WHERE concept_id IN (SELECT concept_id FROM gene_concepts);",
+        b"INSERT INTO gene_associations (associated_with, concept_id) SELECT associated_with, concept_id FROM public.gene_associations WHERE concept_id IN (SELECT concept_id FROM gene_concepts);",
+    ]
+    _check_filters_query = b"SELECT to_regclass('public.gene_filters') IS NOT NULL;"
+    _copy_filters_to_staging_query = (
+        b"INSERT INTO gene_filters SELECT * FROM public.gene_filters;"
+    )
+    _check_metadata_query = b"SELECT to_regclass('public.gene_metadata') IS NOT NULL;"
+    _copy_metadata_to_staging_query = (
+        b"INSERT INTO gene_metadata SELECT * FROM public.gene_metadata;"
+    )
+
+    def _create_staging_schema(self, sources: list[str]) -> None:
+        """Create the staging schema, with copies of all tables, and the data for
+        every source not being reloaded. Foreign keys on reference tables and
+        indexes are left out until the update is complete.
+
+        :param sources: names of sources that will be reloaded
+        """
+        with self.pool.connection() as conn, conn.cursor() as cur:
+            cur.execute(self._create_staging_schema_query)
+            cur.execute((SCRIPTS_DIR / "create_tables.sql").read_bytes())
+            cur.execute((SCRIPTS_DIR / "create_documents_table.sql").read_bytes())
+            cur.execute((SCRIPTS_DIR / "drop_fkeys.sql").read_bytes())
+            for query in self._copy_to_staging_queries:
+                cur.execute(query, {"sources": sources})
+            cur.execute(self._check_filters_query)
+            if cur.fetchone()[0]:
+                cur.execute(self._create_filters_table_query)
+                cur.execute(self._copy_filters_to_staging_query)
+            cur.execute(self._create_metadata_table_query)
+            cur.execute(self._check_metadata_query)
+            if cur.fetchone()[0]:
+                cur.execute(self._copy_metadata_to_staging_query)
+
+    def _finalize_staging_schema(self) -> None:
+        """Write any buffered records to the staging schema, and then add foreign
+        keys and indexes, and build the search term table. Must be called while
+        pooled connections use the staging schema.
+        """
+        self._write_pending_records()
+        self._add_fkeys()
+        # regenerating normalized records recreates some indexes
+        self._drop_indexes()
+        self._add_indexes()
+        self._refresh_terms()
+
+    _drop_staging_schema_query = b"DROP SCHEMA IF EXISTS gene_staging CASCADE;"
+    _create_previous_schema_query = b"""
+        DROP SCHEMA IF EXISTS gene_previous CASCADE;
+        CREATE SCHEMA gene_previous;
+    """
+    _move_table_query = sql.SQL("ALTER TABLE IF EXISTS {} SET SCHEMA {};")
+    _drop_swapped_schemas_query = b"""
+        DROP SCHEMA gene_staging CASCADE;
+        DROP SCHEMA gene_previous CASCADE;
+    """
+
+    def _swap_staging_schema(self) -> None:
+        """Replace the existing tables with the staged tables, in a single
+        transaction, and drop the old tables.
+
+        Tables are moved between schemas rather than copied, so the swap only holds
+        locks briefly. Derived tables that weren't staged (e.g. term resolutions,
+        after sources are reloaded without regenerating normalized records) are
+        dropped rather than left out of date.
+        """
+        with self.pool.connection() as conn, conn.cursor() as cur:
+            cur.execute(self._create_previous_schema_query)
+            for table in self._data_tables:
+                cur.execute(
+                    self._move_table_query.format(
+                        sql.Identifier("public", table),
+                        sql.Identifier(self._previous_schema),
+                    )
+                )
+                cur.execute(
+                    self._move_table_query.format(
+                        sql.Identifier(self._staging_schema, table),
+                        sql.Identifier("public"),
+                    )
+                )
+            cur.execute(self._drop_swapped_schemas_query)
+
+    @contextlib.contextmanager
+    def staged_update(
+        self, sources: Iterable[SourceName]
+    ) -> Generator[None, None, None]:
+        """Perform writes against a copy of the data, and replace the existing data
+        with it atomically once complete, so that readers never see a partial
+        update, and the update doesn't need a maintenance window.
+
+        >>> from gene.database.postgresql import PostgresDatabase
+        >>> from gene.schemas import SourceName
+        >>> db = PostgresDatabase()
+        >>> with db.staged_update([SourceName.HGNC]):
+        ...     pass  # delete and reload HGNC records
+
+        Tables are created in a ``gene_staging`` schema, and filled with the data for
+        every source that isn't being reloaded. Within the context, all reads and
+        writes by this instance use the staging schema. On completion, indexes and
+        foreign keys are built on the filled tables, and the staged tables replace
+        the existing ones in a single transaction. If the update raises an
+        exception, the staging schema is dropped, and the existing data is left in
+        place.
+
+        :param sources: sources that will be reloaded. Their data isn't carried over
+            into the staging schema.
+        :return: context manager that encloses the update
+        """
+        self._write_pending_records()
+        self._create_staging_schema([src.value for src in sources])
+        self.pool.close()
+        self._open_pool(self._staging_schema)
+        self._in_staged_update = True
+        try:
+            yield
+            self._finalize_staging_schema()
+        except BaseException:
+            self._pending_records = {}
+            self._in_staged_update = False
+            self.pool.close()
+            self._open_pool()
+            with self.pool.connection() as conn:
+                conn.execute(self._drop_staging_schema_query)
+            _logger.warning("Staged update failed; existing data left in place")
+            raise
+        self._in_staged_update = False
+        self.pool.close()
+        self._open_pool()
+        self._swap_staging_schema()
+        _logger.info("Replaced existing data with staged update")
+
+    _snapshot_format_version = 1
+    _snapshot_manifest = "manifest.json"
+    # tables loaded before the rest of a snapshot, because gene_concepts references
+    # them
+    _snapshot_parent_tables: ClassVar[tuple[str, ...]] = ("gene_sources", "gene_merged")
+    # tables with SERIAL IDs, whose sequences are reset after loading
+    _serial_tables: ClassVar[tuple[str, ...]] = (
+        "gene_symbols",
+        "gene_previous_symbols",
+        "gene_aliases",
+        "gene_xrefs",
+        "gene_associations",
+    )
+    # size of chunks read from snapshot files
+    _snapshot_chunk_size = 1 << 20
+    _export_snapshot_query = b"SELECT pg_export_snapshot();"
+    _get_columns_query = b"""
+        SELECT column_name FROM information_schema.columns
+        WHERE table_schema = 'public' AND table_name = %s
+        ORDER BY ordinal_position;
+    """
+    _set_snapshot_query = sql.SQL("SET TRANSACTION SNAPSHOT {};")
+    _copy_to_binary_query = sql.SQL("COPY {} ({}) TO STDOUT (FORMAT binary)")
+    _copy_from_binary_query = sql.SQL("COPY {} ({}) FROM STDIN (FORMAT binary)")
+    _drop_gene_terms_index_query = b"DROP INDEX idx_gt_term;"
+    _reset_sequence_query = sql.SQL(
+        "SELECT setval(pg_get_serial_sequence({}, 'id'), max(id)) FROM {};"
+    )
+
+    @staticmethod
+    def _get_snapshot_workers(num_tables: int) -> int:
+        """Get the number of connections to copy snapshot tables over in parallel.
+
+        :param num_tables: number of tables to copy
+        :return: number of worker threads, each with its own connection
+        """
+        return max(min(num_tables, os.cpu_count() or 1), 1)
+
+    def _export_table(self, snapshot_id: str, table: dict, path: Path) -> None:
+        """Write a table to a compressed file of binary ``COPY`` data, reading from an
+        exported snapshot so that all tables are consistent with each other.
+
+        :param snapshot_id: ID of snapshot exported by another transaction
+        :param table: table name and columns, from the snapshot manifest
+        :param path: location of file to write
+        """
+        query = self._copy_to_binary_query.format(
+            sql.Identifier(table["name"]),
+            sql.SQL(", ").join(map(sql.Identifier, table["columns"])),
+        )
+        with psycopg.connect(self.conninfo) as conn:
+            conn.isolation_level = psycopg.IsolationLevel.REPEATABLE_READ
+            with conn.cursor() as cur, gzip.open(path, "wb") as f:
+                cur.execute(self._set_snapshot_query.format(sql.Literal(snapshot_id)))
+                with cur.copy(query) as copy:
+                    for data in copy:
+                        f.write(data)
+
+    def _export_snapshot(self, directory: Path) -> None:
+        """Write every table to a compressed file in a directory, in parallel, along
+        with a manifest describing the files.
+
+        :param directory: directory to write files to
+        """
+        with psycopg.connect(self.conninfo) as conn:
+            conn.isolation_level = psycopg.IsolationLevel.REPEATABLE_READ
+            with conn.cursor() as cur:
+                cur.execute(self._export_snapshot_query)
+                snapshot_id = cur.fetchone()[0]
+                tables = []
+                for table in self._data_tables:
+                    cur.execute(self._get_columns_query, [table])
+                    columns = [row[0] for row in cur.fetchall()]
+                    if columns:
+                        tables.append(
+                            {
+                                "name": table,
+                                "columns": columns,
+                                "file": f"{table}.copy.gz",
+                            }
+                        )
+            # the snapshot stays available until this transaction ends
+            with ThreadPoolExecutor(
+                self._get_snapshot_workers(len(tables))
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        self._export_table,
+                        snapshot_id,
+                        table,
+                        directory / table["file"],
+                    )
+                    for table in tables
+                ]
+                for future in futures:
+                    future.result()
+        manifest = {"format_version": self._snapshot_format_version, "tables": tables}
+        (directory / self._snapshot_manifest).write_text(json.dumps(manifest))
+
+    def _import_table(self, table: dict, directory: Path) -> None:
+        """Load a table from a compressed file of binary ``COPY`` data.
+
+        :param table: table name, columns, and file name, from the snapshot manifest
+        :param directory: directory containing snapshot files
+        """
+        query = self._copy_from_binary_query.format(
+            sql.Identifier(table["name"]),
+            sql.SQL(", ").join(map(sql.Identifier, table["columns"])),
+        )
+        with (
+            psycopg.connect(self.conninfo) as conn,
+            conn.cursor() as cur,
+            gzip.open(directory / table["file"], "rb") as f,
+            cur.copy(query) as copy,
+        ):
+            while data := f.read(self._snapshot_chunk_size):
+                copy.write(data)
+
+    def _import_tables(self, tables: list[dict], directory: Path) -> None:
+        """Load tables from snapshot files in parallel, each over its own connection.
+
+        :param tables: table descriptions from the snapshot manifest
+        :param directory: directory containing snapshot files
+        """
+        if not tables:
+            return
+        with ThreadPoolExecutor(self._get_snapshot_workers(len(tables))) as executor:
+            futures = [
+                executor.submit(self._import_table, table, directory)
+                for table in tables
+            ]
+            for future in futures:
+                future.result()
+
+    def _load_snapshot(self, directory: Path) -> None:
+        """Load a snapshot written by :py:meth:`export_db` into an empty database.
+
+        Tables are created without foreign keys or secondary indexes, and filled in
+        parallel, and then keys and indexes are built.
+
+        :param directory: directory containing extracted snapshot files
+        :raise DatabaseException: if the snapshot format isn't supported, or if the
+            manifest names a file outside of the snapshot directory
+        """
+        manifest = json.loads((directory / self._snapshot_manifest).read_text())
+        if manifest.get("format_version") != self._snapshot_format_version:
+            err_msg = (
+                f"Unsupported snapshot format version: {manifest.get('format_version')}"
+            )
+            raise DatabaseException(err_msg)
+        tables = {table["name"]: table for table in manifest["tables"]}
+        for table in tables.values():
+            file_name = table["file"]
+            if file_name in {"", ".", ".."} or Path(file_name).name != file_name:
+                err_msg = f"Invalid snapshot file name in manifest: {file_name}"
+                raise DatabaseException(err_msg)
+
+        with self.pool.connection() as conn, conn.cursor() as cur:
+            cur.execute((SCRIPTS_DIR / "create_tables.sql").read_bytes())
+            cur.execute((SCRIPTS_DIR / "create_documents_table.sql").read_bytes())
+            cur.execute((SCRIPTS_DIR / "drop_fkeys.sql").read_bytes())
+            if "gene_terms" in tables:
+                cur.execute((SCRIPTS_DIR / "create_gene_terms_table.sql").read_bytes())
+                cur.execute(self._drop_gene_terms_index_query)
+            if "gene_term_resolution" in tables:
+                cur.execute(
+                    (SCRIPTS_DIR / "create_term_resolution_table.sql").read_bytes()
+                )
+            if "gene_filters" in tables:
+                cur.execute(self._create_filters_table_query)
+            if "gene_metadata" in tables:
+                cur.execute(self._create_metadata_table_query)
+
+        self._import_tables(
+            [tables[t] for t in self._snapshot_parent_tables if t in tables], directory
+        )
+        self._import_tables(
+            [
+                t
+                for name, t in tables.items()
+                if name not in self._snapshot_parent_tables
+            ],
+            directory,
+        )
+
+        with self.pool.connection() as conn, conn.cursor() as cur:
+            cur.execute((SCRIPTS_DIR / "add_fkeys.sql").read_bytes())
+            cur.execute((SCRIPTS_DIR / "add_indexes.sql").read_bytes())
+            if "gene_terms" in tables:
+                cur.execute((SCRIPTS_DIR / "create_gene_terms_table.sql").read_bytes())
+            for table in self._serial_tables:
+                cur.execute(
+                    self._reset_sequence_query.format(
+                        sql.Literal(table), sql.Identifier(table)
+                    )
+                )
+        _logger.info("Loaded %i tables from snapshot", len(tables))
 
     def load_from_remote(self, url: str | None) -> None:
         """Load DB from remote dump. Warning: Deletes all existing data. If not
         passed as an argument, will try to grab latest release from VICC S3 bucket.
 
-        :param url: location of .tar.gz file created from output of pg_dump
-        :raise DatabaseException: if unable to retrieve file from URL or if psql
-            command fails
+        Dumps can either be snapshots created by :py:meth:`export_db`, which are
+        loaded natively with parallel ``COPY``, or (older) gzipped tarfiles of SQL
+        dumps created by ``pg_dump``, which are loaded with ``psql``. SQL dumps of
+        databases created by earlier versions, including the default, are migrated
+        after loading (see :py:meth:`initialize_db`).
+
+        :param url: location of .tar file created by :py:meth:`export_db`, or
+            .tar.gz file created from output of pg_dump
+        :raise DatabaseException: if unable to retrieve file from URL, if the dump
+            can't be loaded, if psql command fails, or if the loaded dump doesn't
+            contain gene normalizer tables
         """
         if not url:
             url = "https://vicc-normalizers.s3.us-east-2.amazonaws.com/gene_normalization/postgresql/gene_norm_latest.sql.tar.gz"
@@ -811,11 +1717,24 @@ class PostgresDatabase(AbstractDatabase):
                     for chunk in r.iter_content(chunk_size=8192):
                         if chunk:
                             h.write(chunk)
-            with tarfile.open(temp_tarfile, "r:gz") as tar:
+            with tarfile.open(temp_tarfile, "r:*") as tar:
+                if self._snapshot_manifest in tar.getnames():
+                    snapshot_dir = tempdir_path / "snapshot"
+                    tar.extractall(path=snapshot_dir, filter="data")
+                    self.drop_db()
+                    try:
+                        self._load_snapshot(snapshot_dir)
+                    except psycopg.Error as e:
+                        err_msg = f"Unable to load snapshot from {url}"
+                        raise DatabaseException(err_msg) from e
+                    self._create_derived_tables()
+                    return
                 tar_dump_file = next(
                     f for f in tar.getmembers() if f.name.startswith("gene_norm_")
                 )
-                tar.extractall(path=tempdir_path, members=[tar_dump_file])  # noqa: S202
+                tar.extractall(
+                    path=tempdir_path, members=[tar_dump_file], filter="data"
+                )
                 dump_file = tempdir_path / tar_dump_file.name
 
             self.drop_db()
@@ -826,15 +1745,26 @@ class PostgresDatabase(AbstractDatabase):
                 f"System call '{system_call}' returned failing exit code {result}."
             )
             raise DatabaseException(err_msg)
+        if self._has_legacy_schema():
+            self._migrate_legacy_schema()
+        elif not self.check_schema_initialized():
+            err_msg = f"Dump file from {url} doesn't contain gene normalizer tables"
+            raise DatabaseException(err_msg)
+        self._create_derived_tables()
 
     def export_db(self, output_directory: Path) -> None:
-        """Dump DB to specified location.
+        """Write a snapshot of the DB to specified location.
+
+        Each table is written with ``COPY ... TO STDOUT (FORMAT binary)`` to its own
+        gzipped file, in parallel across connections that share a consistent view of
+        the data. Files are collected, with a manifest, into an uncompressed tarfile
+        that can be loaded with :py:meth:`load_from_remote`.
 
-        :param output_directory: path to directory to save DB dump in
-        :return: Nothing, but saves results of pg_dump to file named
-            `gene_norm_<date and time>.sql`
+        :param output_directory: path to directory to save DB snapshot in
+        :return: Nothing, but saves snapshot to file named
+            `gene_norm_<date and time>.tar`
         :raise ValueError: if output directory isn't a directory or doesn't exist
-        :raise DatabaseException: if psql call fails
+        :raise DatabaseException: if export fails
         """
         if not output_directory.is_dir() or not output_directory.exists():
             err_msg = (
@@ -842,11 +1772,300 @@ class PostgresDatabase(AbstractDatabase):
             )
             raise ValueError(err_msg)
         now = datetime.datetime.now(tz=datetime.UTC).strftime("%Y%m%d%H%M%S")
-        output_location = output_directory / f"gene_norm_{now}.sql"
-        system_call = f"pg_dump {self.conninfo} -E UTF8 -f {output_location}"
-        result = os.system(system_call)  # noqa: S605
-        if result != 0:
-            err_msg = (
-                f"System call '{system_call}' returned failing exit code {result}."
+        output_location = output_directory / f"gene_norm_{now}.tar"
+        with tempfile.TemporaryDirectory() as tempdir:
+            tempdir_path = Path(tempdir)
+            try:
+                self._export_snapshot(tempdir_path)
+            except psycopg.Error as e:
+                err_msg = "Unable to export database snapshot"
+                raise DatabaseException(err_msg) from e
+            with tarfile.open(output_location, "w") as tar:
+                for path in sorted(tempdir_path.iterdir()):
+                    tar.add(path, arcname=path.name)
+        _logger.info("Exported database snapshot to %s", output_location)
+
+
+class AsyncPostgresDatabase(AbstractAsyncDatabase):
+    """Asynchronous, read-only database class employing PostgreSQL. Queries are
+    spread across a pool of connections, so that many lookups can be in flight at
+    once.
+    """
+
+    def __init__(self, db_url: str | None = None, **db_args) -> None:
+        """Initialize Postgres connection pool. The pool isn't opened until
+        :py:meth:`open_connection` is called.
+
+        >>> from gene.database.postgresql import AsyncPostgresDatabase
+        >>> db = AsyncPostgresDatabase(
+        ...     user="postgres", password="matthew_cannon2", db_name="gene_normalizer"
+        ... )
+        >>> await db.open_connection()
+
+        :param db_url: libpq compliant database connection URI
+
+        :Keyword Arguments:
+            * user: Postgres username
+            * password: Postgres password (optional or blank if unneeded)
+            * db_name: name of database to connect to
+            * min_size: minimum number of pooled connections (default from
+              ``GENE_NORM_DB_POOL_MIN_SIZE``, or 1)
+            * max_size: maximum number of pooled connections (default from
+              ``GENE_NORM_DB_POOL_MAX_SIZE``, or 10)
+        """
+        self.conninfo = _get_conninfo(db_url, **db_args)
+        self.pool = _create_pool(
+            AsyncConnectionPool,
+            self.conninfo,
+            connection_kwargs={"autocommit": True},
+            **db_args,
+        )
+        self._has_term_resolutions = True
+
+    async def open_connection(self) -> None:
+        """Open connection pool and wait for the minimum number of connections.
+
+        :raise DatabaseInitializationException: if connections can't be established
+        """
+        try:
+            await self.pool.open(wait=True)
+        except PoolTimeout as e:
+            err_msg = f"Unable to connect to PostgreSQL database at {self.conninfo}"
+            raise DatabaseInitializationException(err_msg) from e
+
+    async def close_connection(self) -> None:
+        """Close all pooled connections."""
+        await self.pool.close()
+
+    async def _fetchall(self, query: bytes, params: list | tuple) -> list[tuple]:
+        """Execute a query on a pooled connection and fetch all result rows.
+
+        :param query: SQL query
+        :param params: query parameters
+        :return: result rows
+        """
+        async with self.pool.connection() as conn, conn.cursor() as cur:
+            await cur.execute(query, params)
+            return await cur.fetchall()
+
+    async def get_source_metadata(self, src_name: str | SourceName) -> dict:
+        """Get license, versioning, data lookup, etc information for a source.
+
+        :param src_name: name of the source to get data for
+        :raise DatabaseReadException: if lookup fails
+        """
+        if isinstance(src_name, SourceName):
+            src_name = src_name.value
+
+        results = await self._fetchall(
+            PostgresDatabase._get_source_metadata_query,  # noqa: SLF001
+            [src_name],
+        )
+        if not results:
+            err_msg = f"{src_name} metadata lookup failed"
+            raise DatabaseReadException(err_msg)
+        return PostgresDatabase._format_source_metadata(results[0])  # noqa: SLF001
+
+    async def get_data_version(self) -> str:
+        """Get an identifier for the currently-loaded data, built from the version of
+        each loaded source and the time that normalized records were last generated.
+
+        :return: data version identifier
+        """
+        try:
+            results = await self._fetchall(
+                PostgresDatabase._get_data_version_query,  # noqa: SLF001
+                [],
             )
-            raise DatabaseException(err_msg)
+        except UndefinedTable:
+            results = await self._fetchall(
+                PostgresDatabase._get_source_versions_query,  # noqa: SLF001
+                [],
+            )
+        return ";".join(f"{name}:{version}" for name, version in results)
+
+    async def get_term_filter(self) -> bytes | None:
+        """Get the stored filter of all searchable terms.
+
+        :return: serialized filter, or None if no filter has been stored
+        """
+        try:
+            results = await self._fetchall(
+                PostgresDatabase._get_term_filter_query,  # noqa: SLF001
+                [],
+            )
+        except UndefinedTable:
+            return None
+        return bytes(results[0][0]) if results else None
+
+    async def get_term_resolution(self, term: str) -> dict | None:
+        """Get the precomputed normalized concept for a term.
+
+        :param term: lowercased concept ID or term
+        :return: resolution object, or None if the term has no stored resolution
+        """
+        try:
+            results = await self._fetchall(
+                PostgresDatabase._get_term_resolution_query,  # noqa: SLF001
+                [term],
+            )
+        except UndefinedTable:
+            return None
+        return (
+            PostgresDatabase._format_term_resolution(results[0])  # noqa: SLF001
+            if results
+            else None
+        )
+
+    async def get_match_tiers(self, search_term: str) -> dict | None:
+        """Look up the precomputed resolution and every normalization match tier for a
+        term in a single network exchange, by sending each query as a prepared
+        statement in pipeline mode.
+
+        :param search_term: string to match against
+        :return: term resolution, matching merged record, identity record, and concept
+            IDs for each reference type
+        """
+        search_term = search_term.lower()
+        if self._has_term_resolutions:
+            try:
+                results = await self._fetch_match_tiers(
+                    search_term,
+                    PostgresDatabase._resolved_match_tier_queries,  # noqa: SLF001
+                )
+            except UndefinedTable:
+                # remember, so that later lookups don't repeat the failing query
+                _logger.warning("Term resolution table not found")
+                self._has_term_resolutions = False
+            else:
+                return PostgresDatabase._format_match_tiers(results)  # noqa: SLF001
+        results = [
+            [],
+            *await self._fetch_match_tiers(
+                search_term,
+                PostgresDatabase._match_tier_queries,  # noqa: SLF001
+            ),
+        ]
+        return PostgresDatabase._format_match_tiers(results)  # noqa: SLF001
+
+    async def _fetch_match_tiers(self, search_term: str, queries: list[bytes]) -> list:
+        """Send queries as prepared statements in pipeline mode, in a single network
+        exchange.
+
+        :param search_term: lowercased string to match against
+        :param queries: SQL queries, each taking the search term as its parameter
+        :return: result rows for each query
+        """
+        async with self.pool.connection() as conn:
+            cursors = [conn.cursor() for _ in queries]
+            async with conn.pipeline():
+                for cur, query in zip(cursors, queries, strict=True):
+                    await cur.execute(query, [search_term], prepare=True)
+            return [await cur.fetchall() for cur in cursors]
+
+    async def get_search_matches(
+        self, search_terms: Iterable[str], sources: Iterable[str]
+    ) -> list[tuple[str, str, dict]] | None:
+        """Retrieve identity records matching any of several search terms, by concept
+        ID or by any reference type, with a single query.
+
+        :param search_terms: lowercase strings to match against
+        :param sources: names of sources to retrieve records from
+        :return: (search term, match type, record) for every match, or None if the
+            term table hasn't been created yet
+        """
+        try:
+            results = await self._fetchall(
+                PostgresDatabase._get_search_matches_query,  # noqa: SLF001
+                [list(search_terms), list(sources)],
+            )
+        except UndefinedTable:
+            return None
+        return [
+            (row[0], row[1], PostgresDatabase._format_source_record(row[2:]))  # noqa: SLF001
+            for row in results
+        ]
+
+    async def get_record_by_id(
+        self,
+        concept_id: str,
+        case_sensitive: bool = True,
+        merge: bool = False,
+    ) -> dict | None:
+        """Fetch record corresponding to provided concept ID
+
+        :param concept_id: concept ID for gene record
+        :param case_sensitive: Not used by PostgreSQL instance.
+        :param merge: if true, look for merged record; look for identity record
+            otherwise.
+        :return: complete gene record, if match is found; None otherwise
+        """
+        records = await self.get_records_by_ids([concept_id], case_sensitive, merge)
+        return records[0] if records else None
+
+    async def get_records_by_ids(
+        self,
+        concept_ids: Iterable[str],
+        case_sensitive: bool = True,  # noqa: ARG002
+        merge: bool = False,
+    ) -> list[dict]:
+        """Fetch records for many concept IDs at once, using a single query.
+
+        :param concept_ids: concept IDs for gene records
+        :param case_sensitive: Not used by PostgreSQL instance.
+        :param merge: if true, look for merged records; look for identity records
+            otherwise.
+        :return: complete gene records for each concept ID that could be found, in the
+            order requested
+        """
+        concept_ids = list(dict.fromkeys(c.lower() for c in concept_ids))
+        if not concept_ids:
+            return []
+        if merge:
+            query = PostgresDatabase._get_merged_records_query  # noqa: SLF001
+            format_record = PostgresDatabase._format_merged_record  # noqa: SLF001
+        else:
+            query = PostgresDatabase._get_records_query  # noqa: SLF001
+            format_record = PostgresDatabase._format_source_record  # noqa: SLF001
+
+        records = {}
+        for result in await self._fetchall(query, [concept_ids]):
+            record = format_record(result)
+            records[record["concept_id"].lower()] = record
+        return [records[c] for c in concept_ids if c in records]
+
+    async def get_refs_by_type(self, search_term: str, ref_type: RefType) -> list[str]:
+        """Retrieve concept IDs for records matching the user's query.
+
+        :param search_term: string to match against
+        :param ref_type: type of match to look for.
+        :return: list of associated concept IDs. Empty if lookup fails.
+        """
+        query = PostgresDatabase._ref_types_query.get(ref_type)  # noqa: SLF001
+        if not query:
+            err_msg = "invalid reference type"
+            raise ValueError(err_msg)
+
+        results = await self._fetchall(query, (search_term.lower(),))
+        return [r[0] for r in results]
+
+    async def get_refs_by_terms(
+        self, search_terms: Iterable[str], ref_type: RefType
+    ) -> dict[str, list[str]]:
+        """Retrieve concept IDs for many search terms at once, using a single query.
+
+        :param search_terms: lowercase strings to match against
+        :param ref_type: type of match to look for.
+        :return: mapping from each search term with at least one match to its
+            associated concept IDs
+        """
+        query = PostgresDatabase._ref_types_batch_query.get(ref_type)  # noqa: SLF001
+        if not query:
+            err_msg = "invalid reference type"
+            raise ValueError(err_msg)
+
+        refs = {}
+        results = await self._fetchall(query, ([t.lower() for t in search_terms],))
+        for term, concept_id in results:
+            refs.setdefault(term, []).append(concept_id)
+        return refs
@@ -9,5 +9,3 @@ CREATE INDEX idx_ga_alias_low ON gene_aliases (lower(alias));
 CREATE INDEX idx_gx_xref_low ON gene_xrefs (lower(xref));
 CREATE INDEX idx_g_as_association_low
     ON gene_associations (lower(associated_with));
-CREATE INDEX idx_rlv_concept_id_low
-    ON record_lookup_view (lower(concept_id));
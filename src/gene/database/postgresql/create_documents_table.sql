@@ -0,0 +1,10 @@
+-- one pre-aggregated JSONB document per source record, written when records are
+-- loaded, so that records can be fetched by a single primary key lookup. Documents
+-- hold every record field except merge_ref, which is kept in sync with
+-- gene_concepts by update_merge_ref and delete_normalized_concepts.sql.
+CREATE TABLE gene_documents (
+    concept_id_lowercase VARCHAR(127) PRIMARY KEY,
+    source VARCHAR(127) NOT NULL,
+    merge_ref VARCHAR(127),
+    document JSONB NOT NULL
+);
@@ -0,0 +1,11 @@
+-- every lowercased concept ID and term that search queries are looked up by, with
+-- the identity record each one refers to. Rebuilt whenever source records are
+-- loaded or deleted. See also: update_gene_terms.sql
+CREATE TABLE IF NOT EXISTS gene_terms (
+    term TEXT NOT NULL,
+    ref_type VARCHAR(127) NOT NULL,
+    concept_id VARCHAR(127) NOT NULL,
+    source VARCHAR(127) NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_gt_term
+    ON gene_terms (term) INCLUDE (ref_type, concept_id, source);
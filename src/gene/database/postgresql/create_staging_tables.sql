@@ -0,0 +1,38 @@
+-- UNLOGGED tables that source records are bulk loaded into with COPY, before being
+-- moved into the main tables. See also: load_staging_tables.sql
+CREATE UNLOGGED TABLE IF NOT EXISTS gene_concepts_staging (
+    concept_id VARCHAR(127) NOT NULL,
+    source VARCHAR(127) NOT NULL,
+    symbol_status VARCHAR(127),
+    label TEXT,
+    strand VARCHAR(1),
+    location_annotations TEXT [],
+    locations JSONB,
+    gene_type TEXT,
+    gene_description TEXT
+);
+CREATE UNLOGGED TABLE IF NOT EXISTS gene_symbols_staging (
+    symbol TEXT NOT NULL,
+    concept_id VARCHAR(127) NOT NULL
+);
+CREATE UNLOGGED TABLE IF NOT EXISTS gene_previous_symbols_staging (
+    prev_symbol TEXT NOT NULL,
+    concept_id VARCHAR(127) NOT NULL
+);
+CREATE UNLOGGED TABLE IF NOT EXISTS gene_aliases_staging (
+    alias TEXT NOT NULL,
+    concept_id VARCHAR(127) NOT NULL
+);
+CREATE UNLOGGED TABLE IF NOT EXISTS gene_xrefs_staging (
+    xref TEXT NOT NULL,
+    concept_id VARCHAR(127) NOT NULL
+);
+CREATE UNLOGGED TABLE IF NOT EXISTS gene_associations_staging (
+    associated_with TEXT NOT NULL,
+    concept_id VARCHAR(127) NOT NULL
+);
+CREATE UNLOGGED TABLE IF NOT EXISTS gene_documents_staging (
+    concept_id_lowercase VARCHAR(127) NOT NULL,
+    source VARCHAR(127) NOT NULL,
+    document JSONB NOT NULL
+);
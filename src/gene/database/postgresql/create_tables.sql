@@ -18,9 +18,9 @@ CREATE TABLE gene_merged (
     previous_symbols TEXT [],
     label TEXT,
     strand VARCHAR(1),
-    ensembl_locations JSON [],
-    hgnc_locations JSON [],
-    ncbi_locations JSON [],
+    ensembl_locations JSONB,
+    hgnc_locations JSONB,
+    ncbi_locations JSONB,
     location_annotations TEXT [],
     ensembl_biotype TEXT [],
     hgnc_locus_type TEXT [],
@@ -37,7 +37,7 @@ CREATE TABLE gene_concepts (
     label TEXT,
     strand VARCHAR(1),
     location_annotations TEXT [],
-    locations JSON [],
+    locations JSONB,
     gene_type TEXT,
     gene_description TEXT,
     merge_ref VARCHAR(127) REFERENCES gene_merged (concept_id)
@@ -0,0 +1,9 @@
+-- precomputed best match for every term, written after normalized records are
+-- generated. See also: update_term_resolution.sql
+CREATE TABLE IF NOT EXISTS gene_term_resolution (
+    term TEXT PRIMARY KEY,
+    match_type VARCHAR(127) NOT NULL,
+    concept_id VARCHAR(127) NOT NULL,
+    merged BOOLEAN NOT NULL,
+    alt_concepts TEXT [] NOT NULL
+);
@@ -3,6 +3,7 @@
 DROP INDEX IF EXISTS idx_gm_concept_id_low;
 ALTER TABLE gene_concepts DROP CONSTRAINT IF EXISTS gene_concepts_merge_ref_fkey;
 UPDATE gene_concepts SET merge_ref = NULL;
+UPDATE gene_documents SET merge_ref = NULL;
 DROP TABLE gene_merged;
 CREATE TABLE gene_merged (
     concept_id VARCHAR(127) PRIMARY KEY,
@@ -11,9 +12,9 @@ CREATE TABLE gene_merged (
     previous_symbols TEXT [],
     label TEXT,
     strand VARCHAR(1),
-    ensembl_locations JSON [],
-    hgnc_locations JSON [],
-    ncbi_locations JSON [],
+    ensembl_locations JSONB,
+    hgnc_locations JSONB,
+    ncbi_locations JSONB,
     location_annotations TEXT [],
     ensembl_biotype TEXT [],
     hgnc_locus_type TEXT [],
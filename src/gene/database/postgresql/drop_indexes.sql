@@ -5,4 +5,3 @@ DROP INDEX IF EXISTS idx_gps_symbol_low;
 DROP INDEX IF EXISTS idx_gx_xref_low;
 DROP INDEX IF EXISTS idx_ga_alias_low;
 DROP INDEX IF EXISTS idx_g_as_association_low;
-DROP INDEX IF EXISTS idx_rlv_concept_id_low;
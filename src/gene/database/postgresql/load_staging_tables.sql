@@ -0,0 +1,30 @@
+-- Move source records bulk loaded into staging tables into the main tables. See
+-- also: create_staging_tables.sql
+INSERT INTO gene_concepts (
+    concept_id, source, symbol_status, label, strand, location_annotations,
+    locations, gene_type, gene_description
+)
+SELECT
+    concept_id, source, symbol_status, label, strand, location_annotations,
+    locations, gene_type, gene_description
+FROM gene_concepts_staging;
+INSERT INTO gene_symbols (symbol, concept_id)
+SELECT symbol, concept_id FROM gene_symbols_staging;
+INSERT INTO gene_previous_symbols (prev_symbol, concept_id)
+SELECT prev_symbol, concept_id FROM gene_previous_symbols_staging;
+INSERT INTO gene_aliases (alias, concept_id)
+SELECT alias, concept_id FROM gene_aliases_staging;
+INSERT INTO gene_xrefs (xref, concept_id)
+SELECT xref, concept_id FROM gene_xrefs_staging;
+INSERT INTO gene_associations (associated_with, concept_id)
+SELECT associated_with, concept_id FROM gene_associations_staging;
+INSERT INTO gene_documents (concept_id_lowercase, source, document)
+SELECT concept_id_lowercase, source, document FROM gene_documents_staging;
+TRUNCATE
+    gene_concepts_staging,
+    gene_symbols_staging,
+    gene_previous_symbols_staging,
+    gene_aliases_staging,
+    gene_xrefs_staging,
+    gene_associations_staging,
+    gene_documents_staging;
@@ -0,0 +1,79 @@
+-- convert a database created before source records were stored as documents, in
+-- place: replace record_lookup_view with the gene_documents table (which must
+-- already exist, see create_documents_table.sql), and store locations as JSONB
+-- arrays instead of JSON[]. Reference tables are aggregated the same way that
+-- record_lookup_view aggregated them.
+DROP MATERIALIZED VIEW IF EXISTS record_lookup_view;
+
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE
+            table_schema = current_schema()
+            AND table_name = 'gene_concepts'
+            AND column_name = 'locations'
+            AND udt_name = '_json'
+    ) THEN
+        ALTER TABLE gene_concepts
+        ALTER COLUMN locations TYPE JSONB
+        USING array_to_json(locations)::JSONB;
+        ALTER TABLE gene_merged
+        ALTER COLUMN ensembl_locations TYPE JSONB
+        USING array_to_json(ensembl_locations)::JSONB,
+        ALTER COLUMN hgnc_locations TYPE JSONB
+        USING array_to_json(hgnc_locations)::JSONB,
+        ALTER COLUMN ncbi_locations TYPE JSONB
+        USING array_to_json(ncbi_locations)::JSONB;
+    END IF;
+END $$;
+
+INSERT INTO gene_documents (concept_id_lowercase, source, merge_ref, document)
+SELECT
+    lower(gc.concept_id),
+    gc.source,
+    gc.merge_ref,
+    jsonb_strip_nulls(
+        jsonb_build_object(
+            'concept_id', gc.concept_id,
+            'symbol_status', gc.symbol_status,
+            'label', gc.label,
+            'strand', gc.strand,
+            'location_annotations', gc.location_annotations,
+            'locations', gc.locations,
+            'gene_type', gc.gene_type,
+            'aliases', ga.aliases,
+            'associated_with', gas.associated_with,
+            'previous_symbols', gps.previous_symbols,
+            'symbol', gs.symbol,
+            'xrefs', gx.xrefs,
+            'gene_description', gc.gene_description,
+            'src_name', gc.source
+        )
+    )
+FROM gene_concepts AS gc
+LEFT JOIN (
+    SELECT concept_id, array_agg(alias) AS aliases
+    FROM gene_aliases
+    GROUP BY concept_id
+) AS ga ON gc.concept_id = ga.concept_id
+LEFT JOIN (
+    SELECT concept_id, array_agg(associated_with) AS associated_with
+    FROM gene_associations
+    GROUP BY concept_id
+) AS gas ON gc.concept_id = gas.concept_id
+LEFT JOIN (
+    SELECT concept_id, array_agg(prev_symbol) AS previous_symbols
+    FROM gene_previous_symbols
+    GROUP BY concept_id
+) AS gps ON gc.concept_id = gps.concept_id
+LEFT JOIN (
+    SELECT concept_id, min(symbol) AS symbol
+    FROM gene_symbols
+    GROUP BY concept_id
+) AS gs ON gc.concept_id = gs.concept_id
+LEFT JOIN (
+    SELECT concept_id, array_agg(xref) AS xrefs
+    FROM gene_xrefs
+    GROUP BY concept_id
+) AS gx ON gc.concept_id = gx.concept_id;
@@ -0,0 +1,21 @@
+-- Rebuild gene_terms from the concept and reference tables. Reference types match
+-- RefType values, plus 'concept_id' for concept ID lookups.
+INSERT INTO gene_terms (term, ref_type, concept_id, source)
+SELECT DISTINCT t.term, t.ref_type, gc.concept_id, gc.source
+FROM (
+    SELECT lower(concept_id) AS term, 'concept_id' AS ref_type, concept_id
+    FROM gene_concepts
+    UNION ALL
+    SELECT lower(symbol), 'symbol', concept_id FROM gene_symbols
+    UNION ALL
+    SELECT lower(prev_symbol), 'prev_symbol', concept_id
+    FROM gene_previous_symbols
+    UNION ALL
+    SELECT lower(alias), 'alias', concept_id FROM gene_aliases
+    UNION ALL
+    SELECT lower(xref), 'xref', concept_id FROM gene_xrefs
+    UNION ALL
+    SELECT lower(associated_with), 'associated_with', concept_id
+    FROM gene_associations
+) AS t
+INNER JOIN gene_concepts AS gc ON t.concept_id = gc.concept_id;
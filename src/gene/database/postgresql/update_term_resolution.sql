@@ -0,0 +1,86 @@
+-- Resolve every lowercased concept ID and term to the normalized concept that
+-- QueryHandler would return for it: merged concept IDs, then source concept IDs,
+-- then the first reference tier (symbol, previous symbol, alias, xref,
+-- associated_with) with any matches, with ties broken by source priority and then
+-- concept ID. Alternate concepts are the other normalized concepts that share the
+-- winning tier.
+INSERT INTO gene_term_resolution (
+    term, match_type, concept_id, merged, alt_concepts
+)
+WITH source_priority (source, priority) AS (
+    SELECT * FROM unnest(%(sources)s::TEXT [], %(priorities)s::INT [])
+),
+
+refs (term, tier_rank, tier, concept_id) AS (
+    SELECT lower(symbol), 2, 'symbol', concept_id FROM gene_symbols
+    UNION ALL
+    SELECT lower(prev_symbol), 3, 'prev_symbol', concept_id
+    FROM gene_previous_symbols
+    UNION ALL
+    SELECT lower(alias), 4, 'alias', concept_id FROM gene_aliases
+    UNION ALL
+    SELECT lower(xref), 5, 'xref', concept_id FROM gene_xrefs
+    UNION ALL
+    SELECT lower(associated_with), 6, 'associated_with', concept_id
+    FROM gene_associations
+),
+
+candidates AS (
+    SELECT
+        lower(concept_id) AS term,
+        0 AS tier_rank,
+        'concept_id' AS tier,
+        0 AS priority,
+        concept_id,
+        concept_id AS normalized_id,
+        TRUE AS merged
+    FROM gene_merged
+    UNION ALL
+    SELECT
+        lower(concept_id),
+        1,
+        'concept_id',
+        0,
+        concept_id,
+        coalesce(merge_ref, concept_id),
+        merge_ref IS NOT NULL
+    FROM gene_concepts
+    UNION ALL
+    SELECT
+        r.term,
+        r.tier_rank,
+        r.tier,
+        sp.priority,
+        gc.concept_id,
+        coalesce(gc.merge_ref, gc.concept_id),
+        gc.merge_ref IS NOT NULL
+    FROM refs AS r
+    INNER JOIN gene_concepts AS gc ON r.concept_id = gc.concept_id
+    INNER JOIN source_priority AS sp ON upper(gc.source) = sp.source
+),
+
+best AS (
+    SELECT DISTINCT ON (term)
+        term,
+        tier_rank,
+        tier,
+        normalized_id,
+        merged
+    FROM candidates
+    ORDER BY term ASC, tier_rank ASC, priority ASC, concept_id COLLATE "C" ASC
+)
+
+SELECT
+    b.term,
+    b.tier,
+    b.normalized_id,
+    b.merged,
+    coalesce(
+        array_agg(DISTINCT c.normalized_id) FILTER (
+            WHERE c.tier_rank > 1 AND c.merged AND c.normalized_id != b.normalized_id
+        ),
+        '{}'
+    )
+FROM best AS b
+INNER JOIN candidates AS c ON b.term = c.term AND b.tier_rank = c.tier_rank
+GROUP BY b.term, b.tier, b.normalized_id, b.merged;
@@ -8,12 +8,14 @@ from pathlib import Path
 import click
 import pydantic
 from biocommons.seqrepo import SeqRepo
+from ga4gh.core import ga4gh_identify
+from ga4gh.vrs.models import SequenceLocation, SequenceReference
 from gffutils.feature import Feature
 from wags_tails import EnsemblData, HgncData, NcbiGeneData
 
 from gene import ITEM_TYPES, SEQREPO_ROOT_DIR
 from gene.database import AbstractDatabase
-from gene.schemas import Gene, GeneSequenceLocation, MatchType, SourceName
+from gene.schemas import Gene, MatchType, SourceName
 
 _logger = logging.getLogger(__name__)
 
@@ -190,13 +192,14 @@ class Base(ABC):
         return aliases
 
     def _get_sequence_location(self, seq_id: str, gene: Feature, params: dict) -> dict:
-        """Get a gene's GeneSequenceLocation.
+        """Get a gene's VRS SequenceLocation. Its identifier is computed here, so that
+        it can be stored and served as-is rather than recomputed for every query.
 
         :param seq_id: The sequence ID.
         :param gene: A gene from the source file.
         :param params: The transformed gene record.
-        :return: A dictionary of a GA4GH VRS SequenceLocation, if seq_id alias found.
-            Else, empty dictionary
+        :return: A dictionary of an identified GA4GH VRS SequenceLocation, if seq_id
+            alias found. Else, empty dictionary
         """
         location = {}
         aliases = self._get_seq_id_aliases(seq_id)
@@ -207,11 +210,15 @@ class Base(ABC):
 
         if gene.start != "." and gene.end != "." and sequence:
             if 0 <= gene.start <= gene.end:
-                location = GeneSequenceLocation(
+                sequence_location = SequenceLocation(
+                    sequenceReference=SequenceReference(
+                        refgetAccession=sequence.split("ga4gh:")[-1]
+                    ),
                     start=gene.start - 1,
                     end=gene.end,
-                    sequence_id=sequence,
-                ).model_dump()
+                )
+                sequence_location.id = ga4gh_identify(sequence_location)
+                location = sequence_location.model_dump(exclude_none=True)
             else:
                 _logger.warning(
                     "%s has invalid interval: start=%i end=%i",
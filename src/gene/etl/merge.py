@@ -1,8 +1,10 @@
 """Create concept groups and merged records."""
 
+import datetime
 import logging
 from timeit import default_timer as timer
 
+from gene.bloom import BloomFilter
 from gene.database import AbstractDatabase
 from gene.database.database import DatabaseWriteException
 from gene.schemas import GeneTypeFieldName, RecordType, SourcePriority
@@ -70,6 +72,22 @@ class Merge:
         end = timer()
         _logger.debug("Generated and added concepts in %f seconds", end - start)
 
+        # changes the data version, even if no source versions have changed
+        self._database.set_merge_timestamp(
+            datetime.datetime.now(tz=datetime.UTC).isoformat()
+        )
+
+        _logger.info("Building term filter...")
+        self._database.set_term_filter(
+            BloomFilter.from_database(self._database).to_bytes()
+        )
+
+        _logger.info("Precomputing term resolutions...")
+        start = timer()
+        self._database.update_term_resolutions()
+        end = timer()
+        _logger.debug("Precomputed term resolutions in %f seconds", end - start)
+
     def _create_record_id_set(
         self, record_id: str, observed_id_set: set | None = None
     ) -> set[str]:
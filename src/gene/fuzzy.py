@@ -0,0 +1,214 @@
+"""Provide an in-memory index of gene terms for approximate (fuzzy) lookups."""
+
+import logging
+import re
+import unicodedata
+from collections.abc import Iterable
+from timeit import default_timer as timer
+
+from pydantic import BaseModel
+
+from gene.database import AbstractDatabase
+from gene.schemas import RecordType, RefType
+from gene.utils import get_term_mappings
+
+_logger = logging.getLogger(__name__)
+
+
+# term fields of term mapping objects to index, in order of match precedence
+_FUZZY_FIELDS = (
+    ("symbol", RefType.SYMBOL),
+    ("previous_symbols", RefType.PREVIOUS_SYMBOLS),
+    ("aliases", RefType.ALIASES),
+)
+
+# whitespace, underscores, and ASCII/Unicode hyphens and dashes
+_SEPARATOR_PATTERN = re.compile(r"[\s_\-\u2010-\u2015\u2212\ufe58\ufe63\uff0d]")
+
+
+def normalize_term(term: str) -> str:
+    """Reduce a term to a form that ignores case, Unicode compatibility variants, and
+    separator characters, e.g. ``"B-RAF"`` (with an ASCII or Unicode hyphen) and
+    ``"b raf"`` both become ``"braf"``.
+
+    :param term: gene symbol or alias
+    :return: normalized term
+    """
+    return _SEPARATOR_PATTERN.sub("", unicodedata.normalize("NFKC", term).lower())
+
+
+def edit_distance(a: str, b: str) -> int:
+    """Compute optimal string alignment distance, i.e. the number of insertions,
+    deletions, substitutions, and transpositions of adjacent characters needed to
+    turn one string into the other.
+
+    :param a: first string
+    :param b: second string
+    :return: edit distance
+    """
+    prev_prev: list[int] = []
+    prev = list(range(len(b) + 1))
+    for i, a_char in enumerate(a, 1):
+        current = [i] + [0] * len(b)
+        for j, b_char in enumerate(b, 1):
+            cost = 0 if a_char == b_char else 1
+            current[j] = min(prev[j] + 1, current[j - 1] + 1, prev[j - 1] + cost)
+            if i > 1 and j > 1 and a_char == b[j - 2] and a[i - 2] == b_char:
+                current[j] = min(current[j], prev_prev[j - 2] + 1)
+        prev_prev, prev = prev, current
+    return prev[-1]
+
+
+def _get_deletes(term: str, max_distance: int) -> set[str]:
+    """Get all strings produced by deleting up to ``max_distance`` characters from a
+    term.
+
+    :param term: normalized term
+    :param max_distance: maximum number of deletions
+    :return: set of deletion variants, including the term itself
+    """
+    deletes = {term}
+    edge = {term}
+    for _ in range(max_distance):
+        edge = {t[:i] + t[i + 1 :] for t in edge for i in range(len(t))} - deletes
+        deletes |= edge
+    return deletes
+
+
+class FuzzyMatch(BaseModel):
+    """Describe the closest known term to a query. The edit distance is measured
+    between the normalized forms of the query and the term.
+    """
+
+    term: str
+    ref_type: RefType
+    edit_distance: int
+    concept_ids: list[str]
+
+
+class FuzzyIndex:
+    """Symmetric-delete index of gene symbols, previous symbols, and aliases.
+
+    Every term is indexed under each string produced by deleting up to
+    ``max_distance`` of its characters, so that candidate terms for a query are found
+    by looking up the query's own deletion variants, rather than by comparing the query
+    to every term:
+
+    >>> from gene.database import create_db
+    >>> from gene.fuzzy import FuzzyIndex
+    >>> index = FuzzyIndex.from_database(create_db())
+    >>> index.lookup("BRAFF").term
+    'BRAF'
+
+    Terms are compared after :py:func:`normalize_term` is applied, so separator and
+    dash variants of a term always match it.
+    """
+
+    def __init__(
+        self,
+        mappings: Iterable[dict],
+        max_distance: int = 1,
+        min_term_length: int = 4,
+    ) -> None:
+        """Build index.
+
+        :param mappings: identity record term mapping objects, as produced by
+            :py:func:`gene.utils.get_term_mappings`
+        :param max_distance: maximum edit distance between a query and a matching term
+        :param min_term_length: minimum normalized query length for which edits are
+            allowed. Shorter queries are only matched to terms that are identical once
+            normalized, because short terms are too easily confused with each other.
+        """
+        self.max_distance = max_distance
+        self.min_term_length = min_term_length
+        self._terms: dict[str, dict[str, tuple[int, str]]] = {}
+        for mapping in mappings:
+            for rank, (field, _) in enumerate(_FUZZY_FIELDS):
+                terms = mapping.get(field) or []
+                if isinstance(terms, str):
+                    terms = [terms]
+                for term in terms:
+                    concepts = self._terms.setdefault(normalize_term(term), {})
+                    existing = concepts.get(mapping["concept_id"])
+                    if existing is None or rank < existing[0]:
+                        concepts[mapping["concept_id"]] = (rank, term)
+        self._terms.pop("", None)
+
+        self._deletes: dict[str, list[str]] = {}
+        for key in self._terms:
+            for variant in _get_deletes(key, max_distance):
+                self._deletes.setdefault(variant, []).append(key)
+
+    @classmethod
+    def from_database(
+        cls, database: AbstractDatabase, max_distance: int = 1
+    ) -> "FuzzyIndex":
+        """Build index from all identity records in a database.
+
+        :param database: database to read records from
+        :param max_distance: maximum edit distance between a query and a matching term
+        :return: constructed index
+        """
+        start = timer()
+        index = cls(
+            get_term_mappings(database, RecordType.IDENTITY), max_distance=max_distance
+        )
+        _logger.info(
+            "Built fuzzy match index of %i terms in %.2f seconds",
+            len(index),
+            timer() - start,
+        )
+        return index
+
+    def __len__(self) -> int:
+        """Get number of indexed terms.
+
+        :return: number of distinct normalized terms
+        """
+        return len(self._terms)
+
+    def lookup(self, query: str) -> FuzzyMatch | None:
+        """Find the closest term to a query.
+
+        Candidates are ranked by edit distance (between normalized forms), then by
+        term type (symbols, then previous symbols, then aliases), then
+        lexicographically.
+
+        :param query: user-provided query
+        :return: closest term, its type, and the concept IDs of all identity records
+            referring to it with that type, or None if no term is close enough
+        """
+        key = normalize_term(query)
+        if not key:
+            return None
+        max_distance = self.max_distance if len(key) >= self.min_term_length else 0
+
+        best = None
+        candidates = {
+            candidate
+            for variant in _get_deletes(key, max_distance)
+            for candidate in self._deletes.get(variant, [])
+        }
+        for candidate in candidates:
+            distance = edit_distance(key, candidate)
+            if distance > max_distance:
+                continue
+            rank = min(rank for rank, _ in self._terms[candidate].values())
+            if best is None or (distance, rank, candidate) < best:
+                best = (distance, rank, candidate)
+        if best is None:
+            return None
+
+        distance, rank, candidate = best
+        matches = sorted(
+            (term, concept_id)
+            for concept_id, (term_rank, term) in self._terms[candidate].items()
+            if term_rank == rank
+        )
+        term = matches[0][0]
+        return FuzzyMatch(
+            term=term,
+            ref_type=_FUZZY_FIELDS[rank][1],
+            edit_distance=distance,
+            concept_ids=[concept_id for _, concept_id in matches],
+        )
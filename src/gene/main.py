@@ -1,29 +1,52 @@
 """Main application for FastAPI"""
 
+import asyncio
+import codecs
+import hashlib
 import html
 import logging
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 from enum import Enum
-from typing import Annotated
+from typing import Annotated, Any
 
-from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi import Body, FastAPI, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from pydantic_core import to_json
+from starlette.requests import ClientDisconnect
+from starlette.types import Receive, Scope, Send
 
 from gene import __version__
+from gene.cache import ResponseCache, SourceMetadataSnapshot
 from gene.config import get_config
-from gene.database import create_db
-from gene.query import InvalidParameterException, QueryHandler
+from gene.database import create_async_db, create_db
+from gene.fuzzy import FuzzyIndex
+from gene.query import AsyncQueryHandler, InvalidParameterException
 from gene.schemas import (
     NormalizeService,
     SearchService,
     ServiceInfo,
     ServiceOrganization,
     ServiceType,
+    SuggestService,
     UnmergedNormalizationService,
 )
 from gene.utils import initialize_logs
 
 
+def _build_fuzzy_index() -> FuzzyIndex:
+    """Build fuzzy match index using a temporary synchronous database connection.
+
+    :return: index for fuzzy matching
+    """
+    db = create_db()
+    try:
+        return FuzzyIndex.from_database(db, get_config().fuzzy_max_distance)
+    finally:
+        db.close_connection()
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator:
     """Perform operations that interact with the lifespan of the FastAPI instance.
@@ -34,11 +57,101 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     """
     log_level = logging.DEBUG if get_config().debug else logging.INFO
     initialize_logs(log_level=log_level)
-    db = create_db()
-    app.state.query_handler = QueryHandler(db)
+    db = await create_async_db()
+    config = get_config()
+    cache = (
+        ResponseCache(config.cache_size, ttl=config.cache_ttl)
+        if config.cache_size > 0
+        else None
+    )
+    # the suggestion index is built on first use
+    fuzzy_index = (
+        await asyncio.to_thread(_build_fuzzy_index) if config.fuzzy_match else None
+    )
+    app.state.query_handler = AsyncQueryHandler(
+        db,
+        cache,
+        None,
+        fuzzy_index,
+        SourceMetadataSnapshot(config.version_check_interval),
+        index_db_factory=create_db,
+    )
+    if config.metrics:
+        from gene.metrics import (  # noqa: PLC0415
+            instrument_query_handler,
+            instrument_response_class,
+        )
+
+        instrument_query_handler(app.state.query_handler)
+        instrument_response_class(ModelJSONResponse)
 
     yield
 
+    await db.close_connection()
+
+
+class ModelJSONResponse(Response):
+    """JSON response serialized directly to bytes by pydantic-core.
+
+    When an endpoint returns a model, FastAPI dumps it to a dict, validates that dict
+    against the ``response_model``, and then encodes the result with
+    ``jsonable_encoder`` and ``json.dumps``. Query responses are models that the
+    service has just constructed and validated itself, so query endpoints return
+    this response instead to skip that work. Their ``response_model`` is still
+    declared, for the OpenAPI schema.
+    """
+
+    media_type = "application/json"
+
+    def __init__(
+        self,
+        content: BaseModel | list[BaseModel],
+        exclude_none: bool = False,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> None:
+        """Initialize response.
+
+        :param content: response model, or list of models
+        :param exclude_none: whether to omit fields whose value is None
+        :param kwargs: additional arguments for ``starlette.responses.Response``
+        """
+        self.exclude_none = exclude_none
+        super().__init__(content, **kwargs)
+
+    def render(self, content: BaseModel | list[BaseModel]) -> bytes:
+        """Serialize response content.
+
+        :param content: response model, or list of models
+        :return: JSON-encoded content
+        """
+        return to_json(content, exclude_none=self.exclude_none)
+
+
+class RequestStreamingResponse(StreamingResponse):
+    """Streaming response whose body is produced while the request body is still
+    being read.
+
+    By default, Starlette concurrently listens for client disconnects by reading
+    request messages, which would compete with the response body iterator for request
+    body chunks. Here, disconnects are instead detected by the body iterator itself,
+    when reading the request.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:  # noqa: ARG002
+        """Send streamed response.
+
+        :param scope: ASGI connection scope
+        :param receive: ASGI receive channel
+        :param send: ASGI send channel
+        :raise ClientDisconnect: if the client disconnects while the response is sent
+        """
+        try:
+            await self.stream_response(send)
+        except OSError as e:
+            raise ClientDisconnect from e
+        if self.background is not None:
+            await self.background()
+
 
 class _Tag(str, Enum):
     """Define tag names for endpoints."""
@@ -74,6 +187,56 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+if get_config().metrics:
+    from gene.metrics import setup_metrics
+
+    setup_metrics(app)
+
+
+async def _get_cache_headers(request: Request, *query: str | None) -> dict[str, str]:
+    """Get HTTP caching headers for a query endpoint response.
+
+    Query responses only change when the loaded data (or the service itself) changes,
+    so the ETag is derived from the service version, the data version, the endpoint,
+    and the query parameters.
+
+    :param request: incoming request
+    :param query: query parameters that determine the response content
+    :return: ``ETag`` header, if the data version is available, and
+        ``Cache-Control`` header, if a max age is configured
+    """
+    headers = {}
+    data_version = await request.app.state.query_handler.get_data_version()
+    if data_version is not None:
+        key = "\0".join(
+            [__version__, data_version, request.url.path]
+            + ["" if part is None else part for part in query]
+        )
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        headers["ETag"] = f'"{digest[:32]}"'
+    max_age = get_config().cache_control_max_age
+    if max_age is not None:
+        headers["Cache-Control"] = f"public, max-age={max_age}"
+    return headers
+
+
+def _is_not_modified(request: Request, headers: dict[str, str]) -> bool:
+    """Check whether a request's ``If-None-Match`` header matches the response ETag.
+
+    :param request: incoming request
+    :param headers: response caching headers
+    :return: True if the client's cached response is still current
+    """
+    if_none_match = request.headers.get("If-None-Match")
+    etag = headers.get("ETag")
+    if if_none_match is None or etag is None:
+        return False
+    for tag in if_none_match.split(","):
+        tag = tag.strip()  # noqa: PLW2901
+        if tag == "*" or tag.removeprefix("W/") == etag:
+            return True
+    return False
+
 
 read_query_summary = "Given query, provide best-matching source records."
 response_description = "A response to a validly-formed query"
@@ -93,25 +256,31 @@ search_description = (
 
 @app.get(
     "/gene/search",
+    response_model=SearchService,
     summary=read_query_summary,
     response_description=response_description,
     description=search_description,
     tags=[_Tag.QUERY],
 )
-def search(
+async def search(
     request: Request,
     q: Annotated[str, Query(..., description=q_descr)],
     incl: Annotated[str | None, Query(..., description=incl_descr)] = None,
     excl: Annotated[str | None, Query(..., description=excl_descr)] = None,
-) -> SearchService:
+) -> Response:
     """Return strongest match concepts to query string provided by user."""
+    query = html.unescape(q)
+    query_handler = request.app.state.query_handler
+    headers = await _get_cache_headers(request, query, incl, excl)
     try:
-        resp = request.app.state.query_handler.search(
-            html.unescape(q), incl=incl, excl=excl
-        )
+        if _is_not_modified(request, headers):
+            # validate parameters, so that invalid requests never get a 304
+            query_handler.get_query_sources(incl, excl)
+            return Response(status_code=304, headers=headers)
+        resp = await query_handler.search(query, incl=incl, excl=excl)
     except InvalidParameterException as e:
         raise HTTPException(status_code=422, detail=str(e)) from e
-    return resp
+    return ModelJSONResponse(resp, headers=headers)
 
 
 normalize_summary = "Given query, provide merged normalized record."
@@ -122,17 +291,143 @@ normalize_q_descr = "Gene to normalize."
 
 @app.get(
     "/gene/normalize",
+    response_model=NormalizeService,
     summary=normalize_summary,
     response_description=normalize_response_descr,
     response_model_exclude_none=True,
     description=normalize_descr,
     tags=[_Tag.QUERY],
 )
-def normalize(
+async def normalize(
     request: Request, q: Annotated[str, Query(..., description=normalize_q_descr)]
-) -> NormalizeService:
+) -> Response:
     """Return strongest match concepts to query string provided by user."""
-    return request.app.state.query_handler.normalize(html.unescape(q))
+    query = html.unescape(q)
+    headers = await _get_cache_headers(request, query)
+    if _is_not_modified(request, headers):
+        return Response(status_code=304, headers=headers)
+    return ModelJSONResponse(
+        await request.app.state.query_handler.normalize(query),
+        exclude_none=True,
+        headers=headers,
+    )
+
+
+normalize_batch_summary = "Given many queries, provide merged normalized records."
+normalize_batch_response_descr = (
+    "Normalization responses for each query, in the order provided."
+)
+normalize_batch_descr = (
+    "Return merged highest-match concept for each query in a list. Duplicate queries "
+    "are resolved only once."
+)
+normalize_batch_queries_descr = "Genes to normalize."
+
+
+@app.post(
+    "/gene/normalize/batch",
+    response_model=list[NormalizeService],
+    summary=normalize_batch_summary,
+    response_description=normalize_batch_response_descr,
+    response_model_exclude_none=True,
+    description=normalize_batch_descr,
+    tags=[_Tag.QUERY],
+)
+async def normalize_batch(
+    request: Request,
+    queries: Annotated[list[str], Body(..., description=normalize_batch_queries_descr)],
+) -> ModelJSONResponse:
+    """Return strongest match concepts for each query string provided by user."""
+    return ModelJSONResponse(
+        await request.app.state.query_handler.normalize_batch(
+            [html.unescape(q) for q in queries]
+        ),
+        exclude_none=True,
+    )
+
+
+# number of streamed queries to normalize at once
+_STREAM_BATCH_SIZE = 1000
+
+
+async def _read_lines(request: Request) -> AsyncGenerator[str, None]:
+    """Incrementally read lines of a UTF-8 request body.
+
+    :param request: incoming request
+    :return: generator yielding each line, without line terminators
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    remainder = ""
+    async for chunk in request.stream():
+        *lines, remainder = (remainder + decoder.decode(chunk)).split("\n")
+        for line in lines:
+            yield line.rstrip("\r")
+    remainder += decoder.decode(b"", final=True)
+    if remainder:
+        yield remainder.rstrip("\r")
+
+
+async def _normalize_lines(
+    query_handler: AsyncQueryHandler, lines: AsyncGenerator[str, None]
+) -> AsyncGenerator[bytes, None]:
+    """Normalize streamed queries in fixed-size batches.
+
+    Only one batch of queries and responses is held at a time, and the next batch is
+    only read once the previous one has been sent.
+
+    :param query_handler: handler to normalize queries with
+    :param lines: streamed queries. Blank lines are skipped.
+    :return: generator yielding NDJSON-encoded responses for each batch
+    """
+    batch = []
+    async for line in lines:
+        if line.strip():
+            batch.append(html.unescape(line))
+        if len(batch) >= _STREAM_BATCH_SIZE:
+            responses = await query_handler.normalize_batch(batch)
+            yield b"".join(to_json(r, exclude_none=True) + b"\n" for r in responses)
+            batch = []
+    if batch:
+        responses = await query_handler.normalize_batch(batch)
+        yield b"".join(to_json(r, exclude_none=True) + b"\n" for r in responses)
+
+
+normalize_stream_summary = (
+    "Given a stream of queries, stream merged normalized records."
+)
+normalize_stream_response_descr = (
+    "Newline-delimited JSON normalization responses for each query, in the order "
+    "provided."
+)
+normalize_stream_descr = (
+    "Return merged highest-match concept for each line of a plain-text request body, "
+    "as newline-delimited JSON (one normalize response per non-blank line). Queries "
+    "are read and normalized incrementally, so results begin streaming before the "
+    "request body has been fully sent."
+)
+
+
+@app.post(
+    "/gene/normalize/stream",
+    summary=normalize_stream_summary,
+    response_description=normalize_stream_response_descr,
+    description=normalize_stream_descr,
+    tags=[_Tag.QUERY],
+    response_class=RequestStreamingResponse,
+    responses={200: {"content": {"application/x-ndjson": {}}}},
+    openapi_extra={
+        "requestBody": {
+            "content": {"text/plain": {"schema": {"type": "string"}}},
+            "required": True,
+        }
+    },
+)
+async def normalize_stream(request: Request) -> RequestStreamingResponse:
+    """Stream strongest match concepts for each line of the request body."""
+    return RequestStreamingResponse(
+        _normalize_lines(request.app.state.query_handler, _read_lines(request)),
+        media_type="application/x-ndjson",
+    )
 
 
 unmerged_matches_summary = (
@@ -150,18 +445,56 @@ unmerged_normalize_description = (
 
 @app.get(
     "/gene/normalize_unmerged",
+    response_model=UnmergedNormalizationService,
     summary=unmerged_matches_summary,
     operation_id="getUnmergedRecords",
     response_description=unmerged_response_descr,
     description=unmerged_normalize_description,
     tags=["Query"],
 )
-def normalize_unmerged(
+async def normalize_unmerged(
     request: Request,
     q: Annotated[str, Query(..., description=normalize_q_descr)],
-) -> UnmergedNormalizationService:
+) -> Response:
     """Return all individual records associated with a normalized concept."""
-    return request.app.state.query_handler.normalize_unmerged(html.unescape(q))
+    query = html.unescape(q)
+    headers = await _get_cache_headers(request, query)
+    if _is_not_modified(request, headers):
+        return Response(status_code=304, headers=headers)
+    return ModelJSONResponse(
+        await request.app.state.query_handler.normalize_unmerged(query),
+        headers=headers,
+    )
+
+
+suggest_summary = "Given a prefix, suggest matching gene terms."
+suggest_response_descr = "Terms beginning with the prefix, in order of precedence."
+suggest_descr = (
+    "Return symbols, previous symbols, and aliases that begin with the given prefix, "
+    "with the normalized concept each refers to. Symbols are suggested before "
+    "previous symbols and aliases, and each concept is suggested at most once."
+)
+suggest_prefix_descr = "Case-insensitive beginning of a gene term."
+suggest_limit_descr = "Maximum number of suggestions to return."
+
+
+@app.get(
+    "/gene/suggest",
+    response_model=SuggestService,
+    summary=suggest_summary,
+    response_description=suggest_response_descr,
+    description=suggest_descr,
+    tags=[_Tag.QUERY],
+)
+async def suggest(
+    request: Request,
+    prefix: Annotated[str, Query(..., description=suggest_prefix_descr)],
+    limit: Annotated[int, Query(ge=1, le=100, description=suggest_limit_descr)] = 10,
+) -> ModelJSONResponse:
+    """Return gene terms beginning with a prefix provided by user."""
+    return ModelJSONResponse(
+        await request.app.state.query_handler.suggest(html.unescape(prefix), limit)
+    )
 
 
 @app.get(
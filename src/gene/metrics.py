@@ -0,0 +1,294 @@
+"""Provide Prometheus metrics for the REST service.
+
+Requires the optional ``metrics`` dependency group. Metrics are registered with the
+default ``prometheus_client`` registry, and cover:
+
+* request latency and error counts, per route
+* match types of query responses, per query method
+* latency of every database method call, per backend class
+* latency of other potentially expensive steps (conversion of stored locations to
+  VRS sequence locations, including identifier computation for locations stored
+  without one, and response serialization)
+"""
+
+import functools
+import inspect
+import logging
+import time
+from collections.abc import AsyncGenerator, Callable, Generator
+from typing import Any
+
+from fastapi import FastAPI, Request, Response
+from prometheus_client import CONTENT_TYPE_LATEST, Counter, Histogram, generate_latest
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from gene.database import AbstractAsyncDatabase, AbstractDatabase
+from gene.query import QueryHandler
+from gene.schemas import MatchType, SearchService
+
+_logger = logging.getLogger(__name__)
+
+
+REQUEST_LATENCY = Histogram(
+    "gene_norm_request_duration_seconds",
+    "HTTP request latency, from receipt to final response body message",
+    ["method", "route", "status"],
+)
+REQUEST_ERRORS = Counter(
+    "gene_norm_request_errors_total",
+    "HTTP requests that failed with a 4xx or 5xx status, or with an exception",
+    ["method", "route", "status"],
+)
+MATCH_TYPES = Counter(
+    "gene_norm_match_types_total",
+    "Match types of query responses (per source, for search)",
+    ["method", "match_type"],
+)
+DB_LATENCY = Histogram(
+    "gene_norm_db_operation_duration_seconds",
+    "Database method call latency",
+    ["backend", "operation"],
+)
+STAGE_LATENCY = Histogram(
+    "gene_norm_stage_duration_seconds",
+    "Latency of individual request processing stages",
+    ["stage"],
+)
+
+# unmatched paths are grouped together, so that arbitrary paths can't create labels
+_UNMATCHED_ROUTE = "<unmatched>"
+
+
+class MetricsMiddleware:
+    """Record latency and errors for every HTTP request, labeled by route template
+    (e.g. ``/gene/normalize``) rather than by raw path.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Wrap application.
+
+        :param app: ASGI application
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle ASGI request.
+
+        :param scope: connection scope
+        :param receive: ASGI receive channel
+        :param send: ASGI send channel
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception:
+            status = 500
+            raise
+        finally:
+            route = scope.get("route")
+            labels = (
+                scope["method"],
+                getattr(route, "path", _UNMATCHED_ROUTE),
+                str(status),
+            )
+            REQUEST_LATENCY.labels(*labels).observe(time.perf_counter() - start)
+            if status >= 400:  # noqa: PLR2004
+                REQUEST_ERRORS.labels(*labels).inc()
+
+
+def metrics_endpoint(request: Request) -> Response:  # noqa: ARG001
+    """Render all metrics in the Prometheus text exposition format.
+
+    :param request: incoming request
+    :return: metrics response
+    """
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
+
+def _time_call(fn: Callable, histogram: Histogram) -> Callable:
+    """Wrap a function so that its duration is recorded to a histogram.
+
+    Coroutine functions are timed until they complete, and generator functions are
+    timed until the generator is exhausted or closed.
+
+    :param fn: function to wrap
+    :param histogram: histogram (with labels applied) to record durations to
+    :return: wrapped function
+    """
+    if inspect.iscoroutinefunction(fn):
+
+        @functools.wraps(fn)
+        async def async_wrapper(*args, **kwargs) -> Any:  # noqa: ANN401
+            start = time.perf_counter()
+            try:
+                return await fn(*args, **kwargs)
+            finally:
+                histogram.observe(time.perf_counter() - start)
+
+        return async_wrapper
+
+    if inspect.isgeneratorfunction(fn):
+
+        @functools.wraps(fn)
+        def generator_wrapper(*args, **kwargs) -> Generator:
+            start = time.perf_counter()
+            try:
+                yield from fn(*args, **kwargs)
+            finally:
+                histogram.observe(time.perf_counter() - start)
+
+        return generator_wrapper
+
+    if inspect.isasyncgenfunction(fn):
+
+        @functools.wraps(fn)
+        async def async_generator_wrapper(*args, **kwargs) -> AsyncGenerator:
+            start = time.perf_counter()
+            try:
+                async for item in fn(*args, **kwargs):
+                    yield item
+            finally:
+                histogram.observe(time.perf_counter() - start)
+
+        return async_generator_wrapper
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs) -> Any:  # noqa: ANN401
+        start = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            histogram.observe(time.perf_counter() - start)
+
+    return wrapper
+
+
+def instrument_database(database: AbstractDatabase | AbstractAsyncDatabase) -> None:
+    """Record the latency of every public database method call on an instance.
+
+    Calls are labeled with the database class name (e.g. ``AsyncPostgresDatabase``)
+    and the method name.
+
+    :param database: database instance to instrument
+    """
+    base = (
+        AbstractAsyncDatabase
+        if isinstance(database, AbstractAsyncDatabase)
+        else AbstractDatabase
+    )
+    backend = type(database).__name__
+    for name, value in vars(base).items():
+        if name.startswith("_") or not callable(value):
+            continue
+        setattr(
+            database,
+            name,
+            _time_call(getattr(database, name), DB_LATENCY.labels(backend, name)),
+        )
+
+
+def _count_match_types(method: str, response: Any) -> None:  # noqa: ANN401
+    """Record the match types of a query response.
+
+    Match types are labeled by value, because several ``MatchType`` members share the
+    same value (e.g. ``SYMBOL`` and ``CONCEPT_ID``).
+
+    :param method: name of query method
+    :param response: query response, or list of query responses
+    """
+    if isinstance(response, list):
+        for item in response:
+            _count_match_types(method, item)
+    elif isinstance(response, SearchService):
+        for matches in response.source_matches.values():
+            match_type = max(
+                (record.match_type for record in matches.records),
+                default=MatchType.NO_MATCH,
+            )
+            MATCH_TYPES.labels(method, str(int(match_type))).inc()
+    else:
+        MATCH_TYPES.labels(method, str(int(response.match_type))).inc()
+
+
+def _count_calls(fn: Callable, method: str) -> Callable:
+    """Wrap a query method so that the match types of its responses are recorded.
+
+    :param fn: sync or async query method to wrap
+    :param method: name of query method
+    :return: wrapped method
+    """
+    if inspect.iscoroutinefunction(fn):
+
+        @functools.wraps(fn)
+        async def async_wrapper(*args, **kwargs) -> Any:  # noqa: ANN401
+            response = await fn(*args, **kwargs)
+            _count_match_types(method, response)
+            return response
+
+        return async_wrapper
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs) -> Any:  # noqa: ANN401
+        response = fn(*args, **kwargs)
+        _count_match_types(method, response)
+        return response
+
+    return wrapper
+
+
+def instrument_query_handler(query_handler: QueryHandler) -> None:
+    """Record match types and stage latencies for a query handler, and instrument
+    its database.
+
+    :param query_handler: sync or async query handler to instrument
+    """
+    instrument_database(query_handler.db)
+
+    for method in ("search", "normalize", "normalize_unmerged", "normalize_batch"):
+        setattr(
+            query_handler,
+            method,
+            _count_calls(getattr(query_handler, method), method),
+        )
+
+    query_handler._transform_location = _time_call(  # noqa: SLF001
+        query_handler._transform_location,  # noqa: SLF001
+        STAGE_LATENCY.labels("vrs_location"),
+    )
+
+
+def instrument_response_class(response_class: type[Response]) -> None:
+    """Record the latency of rendering response bodies for a response class.
+
+    Only applied once per class.
+
+    :param response_class: response class whose ``render`` method to time
+    """
+    if getattr(response_class.render, "_instrumented", False):
+        return
+    render = _time_call(response_class.render, STAGE_LATENCY.labels("serialize"))
+    render._instrumented = True  # noqa: SLF001
+    response_class.render = render
+
+
+def setup_metrics(app: FastAPI) -> None:
+    """Add request metrics middleware and a ``/metrics`` endpoint to an app. Must be
+    called before the app starts.
+
+    :param app: FastAPI application
+    """
+    app.add_middleware(MetricsMiddleware)
+    app.add_route("/metrics", metrics_endpoint, include_in_schema=False)
+    _logger.info("Enabled Prometheus metrics at /metrics")
@@ -1,9 +1,11 @@
 """Provides methods for handling queries."""
 
+import asyncio
 import datetime
 import logging
 import re
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable, Hashable
+from functools import partial
 from typing import Any, TypeVar
 
 from ga4gh.core import ga4gh_identify
@@ -18,7 +20,19 @@ from ga4gh.core.models import (
 from ga4gh.vrs.models import SequenceLocation, SequenceReference
 
 from gene import ITEM_TYPES, NAMESPACE_LOOKUP, PREFIX_LOOKUP, __version__
-from gene.database import AbstractDatabase, DatabaseReadException
+from gene.bloom import BloomFilter
+from gene.cache import (
+    AsyncSingleFlight,
+    ResponseCache,
+    SingleFlight,
+    SourceMetadataSnapshot,
+)
+from gene.database import (
+    AbstractAsyncDatabase,
+    AbstractDatabase,
+    DatabaseReadException,
+)
+from gene.fuzzy import FuzzyIndex
 from gene.schemas import (
     NAMESPACE_TO_SYSTEM_URI,
     BaseGene,
@@ -36,12 +50,18 @@ from gene.schemas import (
     SourceMeta,
     SourceName,
     SourcePriority,
+    SuggestService,
     UnmergedNormalizationService,
 )
+from gene.suggest import SuggestIndex
 
 _logger = logging.getLogger(__name__)
 
 NormService = TypeVar("NormService", bound=BaseNormalizationService)
+Response = TypeVar("Response", SearchService, BaseNormalizationService)
+Index = TypeVar("Index", SuggestIndex, FuzzyIndex)
+
+_NBSP_PATTERN = re.compile("\xa0|&nbsp;")
 
 
 class InvalidParameterException(Exception):  # noqa: N818
@@ -53,7 +73,14 @@ class QueryHandler:
     and normalizes query input.
     """
 
-    def __init__(self, database: AbstractDatabase) -> None:
+    def __init__(
+        self,
+        database: AbstractDatabase,
+        cache: ResponseCache | None = None,
+        suggest_index: SuggestIndex | None = None,
+        fuzzy_index: FuzzyIndex | None = None,
+        source_metadata: SourceMetadataSnapshot | None = None,
+    ) -> None:
         """Initialize QueryHandler instance. Requires a created database object to
         initialize. The most straightforward way to do this is via the ``create_db``
         method in the ``gene.database`` module:
@@ -66,9 +93,35 @@ class QueryHandler:
         the sake of brevity. See the `usage` page in the docs and the ``create_db`` API
         description for more details.
 
+        Responses can optionally be cached in memory. Cached responses are keyed on the
+        lowercased, stripped query (plus requested sources, for ``search``), and are
+        dropped when a periodic data version check finds a change in the loaded data:
+
+        >>> from gene.cache import ResponseCache
+        >>> q = QueryHandler(create_db(), ResponseCache(4096))
+
         :param database: storage backend to search against
+        :param cache: cache for completed query responses. If None, every query is
+            performed against the database.
+        :param suggest_index: index of terms for :py:meth:`suggest`. If None, it's
+            built from ``database`` on the first call to ``suggest``.
+        :param fuzzy_index: index of terms for approximate matching. If given,
+            normalization queries that don't match any term exactly are matched to the
+            closest known term, with a ``FUZZY_MATCH`` match type.
+        :param source_metadata: snapshot of source metadata, which also sets how
+            often to check the database for a new data version. Cached responses are
+            dropped, and term indexes rebuilt, whenever a new version is found. If
+            None, a snapshot with the default check interval is used.
         """
         self.db = database
+        self.cache = cache
+        self.suggest_index = suggest_index
+        self.fuzzy_index = fuzzy_index
+        self.source_metadata = source_metadata or SourceMetadataSnapshot()
+        self.term_filter: BloomFilter | None = None
+        self._term_filter_version: str | None = None
+        self._index_version: str | None = None
+        self._in_flight: SingleFlight[Response] = SingleFlight()
 
     @staticmethod
     def _emit_warnings(query_str: str) -> list:
@@ -78,7 +131,7 @@ class QueryHandler:
         :return: List of warnings
         """
         warnings = []
-        nbsp = re.search("\xa0|&nbsp;", query_str)
+        nbsp = _NBSP_PATTERN.search(query_str)
         if nbsp:
             warnings = [
                 {
@@ -90,6 +143,212 @@ class QueryHandler:
             )
         return warnings
 
+    @staticmethod
+    def _get_query_key(method: str, query: str, *args: Hashable) -> tuple | None:
+        """Construct a key identifying queries with equivalent responses, for caching
+        and coalescing.
+
+        Queries containing non-breaking spaces have no key, because their responses
+        include a warning that depends on the exact query string.
+
+        :param method: name of query method
+        :param query: user-provided query
+        :param args: any other parameters that affect the response
+        :return: query key, or None if the response shouldn't be shared
+        """
+        if _NBSP_PATTERN.search(query):
+            return None
+        return (method, query.lower().strip(), *args)
+
+    def _copy_response(self, response: Response, query: str) -> Response:
+        """Copy a completed response for another query with the same key.
+
+        :param response: completed response object
+        :param query: user-provided query
+        :return: copy of response with updated query and service metadata
+        """
+        return response.model_copy(
+            update={
+                "query": query,
+                "warnings": list(response.warnings),
+                "service_meta_": self._get_service_meta(),
+            }
+        )
+
+    def _get_cached_response(self, key: tuple | None, query: str) -> Response | None:
+        """Retrieve a cached response, updated for the current query.
+
+        :param key: query key from :py:meth:`_get_query_key`
+        :param query: user-provided query
+        :return: copy of cached response with updated query and service metadata, or
+            None if no response is cached
+        """
+        if self.cache is None or key is None:
+            return None
+        cached = self.cache.get(key)
+        if cached is None:
+            return None
+        return self._copy_response(cached, query)
+
+    def _set_cached_response(self, key: tuple | None, response: Response) -> None:
+        """Store a completed response in the cache.
+
+        :param key: query key from :py:meth:`_get_query_key`
+        :param response: completed response object
+        """
+        if self.cache is not None and key is not None:
+            self.cache.set(key, response)
+
+    def _get_response(
+        self, key: tuple | None, query: str, get_response: Callable[[], Response]
+    ) -> Response:
+        """Get a query response from the cache, or else compute it.
+
+        Concurrent calls with the same key (e.g. from other threads serving identical
+        requests) share a single computation, rather than each performing the same
+        database lookups.
+
+        :param key: query key from :py:meth:`_get_query_key`
+        :param query: user-provided query
+        :param get_response: function computing the response
+        :return: completed response object
+        """
+        cached = self._get_cached_response(key, query)
+        if cached:
+            return cached
+        if key is None:
+            return get_response()
+
+        def get_and_cache_response() -> Response:
+            response = get_response()
+            self._set_cached_response(key, response)
+            return response
+
+        response, shared = self._in_flight.do(key, get_and_cache_response)
+        return self._copy_response(response, query) if shared else response
+
+    def _read_source_metadata(self) -> dict[str, SourceMeta]:
+        """Read metadata for every source from the database.
+
+        :return: mapping from names of loaded sources to their metadata
+        """
+        sources = {}
+        for src_name in SourceName:
+            try:
+                metadata = self.db.get_source_metadata(src_name.value)
+            except DatabaseReadException:
+                _logger.warning("Unable to retrieve metadata for %s", src_name.value)
+                continue
+            sources[src_name.value] = SourceMeta(**metadata)
+        return sources
+
+    def _check_data_version(self) -> None:
+        """Reload source metadata, and drop cached responses, if the loaded data has
+        changed. Only checks periodically, per the source metadata snapshot's
+        configuration.
+
+        :raise DatabaseReadException: if no source metadata has been loaded yet, and
+            the data version can't be retrieved
+        """
+        if not self.source_metadata.version_check_due():
+            return
+        try:
+            version = self.db.get_data_version()
+        except DatabaseReadException:
+            if self.source_metadata.version is None:
+                raise
+            _logger.exception("Unable to check data version")
+            return
+        self._update_data_version(version)
+
+    def get_data_version(self) -> str | None:
+        """Get an identifier for the currently-loaded data, which changes whenever
+        any source is reloaded. Checked periodically, as for cached responses.
+
+        :return: data version, or None if it's unavailable
+        """
+        self._check_data_version()
+        return self.source_metadata.version
+
+    def _update_data_version(self, version: str) -> None:
+        """Record the current data version, reloading source metadata, the term
+        filter, and term indexes if needed.
+
+        :param version: identifier for the current data version
+        """
+        if not self.source_metadata.is_current(version):
+            self.source_metadata.update(version, self._read_source_metadata())
+        if self._indexes_outdated(version):
+            # the suggestion index is rebuilt on its next use
+            self.suggest_index = None
+            if self.fuzzy_index is not None:
+                self.fuzzy_index = FuzzyIndex.from_database(
+                    self.db, self.fuzzy_index.max_distance
+                )
+        if version != self._term_filter_version:
+            try:
+                data = self.db.get_term_filter()
+            except DatabaseReadException:
+                _logger.exception("Unable to retrieve term filter")
+                data = None
+            self._set_term_filter(data, version)
+        if self.cache is not None:
+            self.cache.set_version(version)
+
+    def _indexes_outdated(self, version: str) -> bool:
+        """Record the data version that term indexes reflect, and check whether they
+        were built from an earlier version. Indexes in place when the first version
+        is recorded are assumed to be current.
+
+        :param version: identifier for the current data version
+        :return: True if the indexes should be rebuilt
+        """
+        outdated = self._index_version is not None and version != self._index_version
+        self._index_version = version
+        return outdated
+
+    def _set_term_filter(self, data: bytes | None, version: str) -> None:
+        """Replace the term filter with a stored one, if it was built from the current
+        data version. Otherwise, every term is looked up in the database.
+
+        :param data: serialized filter, if one is stored
+        :param version: identifier for the current data version
+        """
+        self._term_filter_version = version
+        self.term_filter = None
+        if data is None:
+            return
+        try:
+            term_filter = BloomFilter.from_bytes(data)
+        except ValueError:
+            _logger.exception("Unable to read stored term filter")
+            return
+        if term_filter.data_version != version:
+            _logger.warning(
+                "Stored term filter was built from data version %s rather than %s; not using it",
+                term_filter.data_version,
+                version,
+            )
+            return
+        self.term_filter = term_filter
+
+    def _may_match(self, term: str) -> bool:
+        """Check whether a lowercased term could match any record.
+
+        :param term: lowercased concept ID or term
+        :return: False if the term filter rules out a match, True otherwise (including
+            when no term filter is in use)
+        """
+        return self.term_filter is None or term in self.term_filter
+
+    def _get_source_metadata(self, src_name: str) -> SourceMeta:
+        """Get metadata for a source from the current snapshot.
+
+        :param src_name: name of source
+        :return: source metadata
+        """
+        return self.source_metadata.sources[src_name]
+
     @staticmethod
     def _transform_sequence_location(loc: dict) -> SequenceLocation:
         """Transform a sequence location to VRS sequence location
@@ -108,9 +367,17 @@ class QueryHandler:
     def _transform_location(self, loc: dict) -> dict:
         """Transform a sequence location to VRS sequence location
 
+        Locations loaded by current ETL methods are already identified VRS sequence
+        locations, and are returned without recomputing the identifier. Locations
+        loaded by older releases are stored as ``GeneSequenceLocation`` objects and
+        must be converted.
+
         :param loc: Sequence location
         :return: VRS sequence location represented as a dictionary
         """
+        if "id" in loc:
+            # DynamoDB returns numbers as Decimals
+            return {**loc, "start": int(loc["start"]), "end": int(loc["end"])}
         transformed_loc = self._transform_sequence_location(loc)
         transformed_loc.id = ga4gh_identify(transformed_loc)
         return transformed_loc.model_dump(exclude_none=True)
@@ -151,35 +418,55 @@ class QueryHandler:
         elif matches[src_name] is None:
             matches[src_name] = {
                 "records": [gene],
-                "source_meta_": self.db.get_source_metadata(src_name),
+                "source_meta_": self._get_source_metadata(src_name),
             }
         else:
             matches[src_name]["records"].append(gene)
 
-    def _fetch_record(
-        self, response: dict[str, dict], concept_id: str, match_type: MatchType
+    def _fetch_records(
+        self, response: dict[str, dict], concept_ids: list[str], match_type: MatchType
     ) -> None:
-        """Add fetched record to response
+        """Add fetched records to response
 
         :param response: in-progress response object to return to client.
-        :param concept_id: Concept id to fetch record for. Should be all lower-case.
-        :param match_type: match type for record
+        :param concept_ids: Concept ids to fetch records for. Should be all lower-case.
+        :param match_type: match type for records
         """
         try:
-            match = self.db.get_record_by_id(concept_id, case_sensitive=False)
+            matches = self.db.get_records_by_ids(concept_ids, case_sensitive=False)
         except DatabaseReadException:
             _logger.exception(
-                "Encountered DatabaseReadException looking up %s", concept_id
+                "Encountered DatabaseReadException looking up %s", concept_ids
             )
-        else:
-            if match:
-                self._add_record(response, match, match_type)
-            else:
+            return
+        self._add_records(response, concept_ids, matches, match_type)
+
+    def _add_records(
+        self,
+        response: dict[str, dict],
+        concept_ids: list[str],
+        matches: list[dict],
+        match_type: MatchType,
+    ) -> None:
+        """Add retrieved records to response, and log any that couldn't be found.
+        Records are added in source priority and concept ID order, so that responses
+        don't depend on the order that the database returns them in.
+
+        :param response: in-progress response object to return to client.
+        :param concept_ids: concept IDs that records were requested for
+        :param matches: records retrieved for those concept IDs
+        :param match_type: match type for records
+        """
+        found_ids = {match["concept_id"].lower() for match in matches}
+        for concept_id in concept_ids:
+            if concept_id.lower() not in found_ids:
                 _logger.error(
                     "Unable to find expected record for %s matching as %s",
                     concept_id,
                     match_type,
                 )
+        for match in sorted(matches, key=self._record_order):
+            self._add_record(response, match, match_type)
 
     def _post_process_resp(self, resp: dict) -> dict:
         """Fill all empty source_matches slots with NO_MATCH results and
@@ -194,7 +481,7 @@ class QueryHandler:
                 resp["source_matches"][src_name] = {
                     "match_type": MatchType.NO_MATCH,
                     "records": [],
-                    "source_meta_": self.db.get_source_metadata(src_name),
+                    "source_meta_": self._get_source_metadata(src_name),
                 }
             else:
                 records = resp["source_matches"][src_name]["records"]
@@ -202,6 +489,24 @@ class QueryHandler:
                     records = sorted(records, key=lambda k: k.match_type, reverse=True)
         return resp
 
+    def _get_search_terms(self, query_l: str) -> list[tuple[str, str]]:
+        """Get terms and item types to look up for a search query, in order of match
+        precedence. Terms that the term filter rules out are omitted.
+
+        :param query_l: lowercased query
+        :return: list of (term, item type) pairs
+        """
+        terms = []
+        if [p for p in PREFIX_LOOKUP if query_l.startswith(p)]:
+            terms.append((query_l, RecordType.IDENTITY.value))
+
+        for prefix in [p for p in NAMESPACE_LOOKUP if query_l.startswith(p)]:
+            term = f"{NAMESPACE_LOOKUP[prefix].lower()}:{query_l}"
+            terms.append((term, RecordType.IDENTITY.value))
+
+        terms.extend((query_l, match) for match in ITEM_TYPES.values())
+        return [(term, item_type) for term, item_type in terms if self._may_match(term)]
+
     def _get_search_response(self, query: str, sources: set[str]) -> dict:
         """Return response as dict where key is source name and value is a list of
         records.
@@ -217,31 +522,84 @@ class QueryHandler:
         }
         if query == "":
             return self._post_process_resp(resp)
-        query_l = query.lower()
 
-        queries = []
-        if [p for p in PREFIX_LOOKUP if query_l.startswith(p)]:
-            queries.append((query_l, RecordType.IDENTITY.value))
+        terms = self._get_search_terms(query.lower())
+        if not terms:
+            return self._post_process_resp(resp)
+        try:
+            matches = self.db.get_search_matches(
+                list(dict.fromkeys(term for term, _ in terms)), sources
+            )
+        except DatabaseReadException:
+            _logger.exception("Encountered DatabaseReadException searching %s", query)
+            return self._post_process_resp(resp)
+        if matches is None:
+            self._add_search_matches_by_type(resp, terms)
+        else:
+            self._add_search_matches(resp, terms, matches)
 
-        for prefix in [p for p in NAMESPACE_LOOKUP if query_l.startswith(p)]:
-            term = f"{NAMESPACE_LOOKUP[prefix].lower()}:{query_l}"
-            queries.append((term, RecordType.IDENTITY.value))
+        # remaining sources get no match
+        return self._post_process_resp(resp)
 
-        queries.extend((query_l, match) for match in ITEM_TYPES.values())
+    def _add_search_matches(
+        self,
+        response: dict[str, dict],
+        terms: list[tuple[str, str]],
+        matches: list[tuple[str, str, dict]],
+    ) -> None:
+        """Add records retrieved for all search terms at once to response, in the same
+        order as :py:meth:`_add_records`. Records matched by an earlier reference type
+        aren't repeated for later ones.
 
+        :param response: in-progress response object to return to client
+        :param terms: (term, item type) pairs, in order of match precedence
+        :param matches: (term, match type, record) for every match
+        """
+        records = {}
+        for term, match_type, record in sorted(
+            matches, key=lambda match: self._record_order(match[2])
+        ):
+            records.setdefault((term, match_type), []).append(record)
+
+        matched_concept_ids = set()
+        for term, item_type in terms:
+            if item_type == RecordType.IDENTITY.value:
+                for record in records.get((term, "concept_id"), []):
+                    if record["concept_id"] not in matched_concept_ids:
+                        self._add_record(response, record, MatchType.CONCEPT_ID)
+                continue
+            for record in records.get((term, item_type), []):
+                if record["concept_id"] not in matched_concept_ids:
+                    self._add_record(response, record, MatchType[item_type.upper()])
+                    matched_concept_ids.add(record["concept_id"])
+
+    def _add_search_matches_by_type(
+        self, response: dict[str, dict], terms: list[tuple[str, str]]
+    ) -> None:
+        """Look up each search term and item type individually, and add matching
+        records to response. Used for backends that can't look up every term at once.
+
+        :param response: in-progress response object to return to client
+        :param terms: (term, item type) pairs, in order of match precedence
+        """
         matched_concept_ids = []
-        for term, item_type in queries:
+        for term, item_type in terms:
             try:
                 if item_type == RecordType.IDENTITY.value:
                     record = self.db.get_record_by_id(term, False)
                     if record and record["concept_id"] not in matched_concept_ids:
-                        self._add_record(resp, record, MatchType.CONCEPT_ID)
+                        self._add_record(response, record, MatchType.CONCEPT_ID)
                 else:
-                    refs = self.db.get_refs_by_type(term, RefType(item_type))
-                    for ref in refs:
-                        if ref not in matched_concept_ids:
-                            self._fetch_record(resp, ref, MatchType[item_type.upper()])
-                            matched_concept_ids.append(ref)
+                    refs = [
+                        ref
+                        for ref in self.db.get_refs_by_type(term, RefType(item_type))
+                        if ref not in matched_concept_ids
+                    ]
+                    if refs:
+                        self._fetch_records(
+                            response, refs, MatchType[item_type.upper()]
+                        )
+                        matched_concept_ids.extend(refs)
 
             except DatabaseReadException:
                 _logger.exception(
@@ -251,9 +609,6 @@ class QueryHandler:
                 )
                 continue
 
-        # remaining sources get no match
-        return self._post_process_resp(resp)
-
     @staticmethod
     def _get_service_meta() -> ServiceMeta:
         """Return metadata about gene-normalizer service.
@@ -289,11 +644,89 @@ class QueryHandler:
         :raise InvalidParameterException: if both `incl` and `excl` args are provided,
             or if invalid source names are given
         """
+        self._check_data_version()
+        query_sources = self.get_query_sources(incl, excl)
+        query_str = query_str.strip()
+        return self._get_response(
+            self._get_query_key("search", query_str, frozenset(query_sources)),
+            query_str,
+            partial(self._search, query_str, query_sources),
+        )
+
+    def _search(self, query: str, sources: set[str]) -> SearchService:
+        """Perform search.
+
+        :param query: user-provided query
+        :param sources: names of sources to search
+        :return: completed search response
+        """
+        resp = self._get_search_response(query, sources)
+        resp["service_meta_"] = self._get_service_meta()
+        return SearchService(**resp)
+
+    def _get_suggest_response(
+        self, suggest_index: SuggestIndex, prefix: str, limit: int
+    ) -> SuggestService:
+        """Look up suggestions for a prefix.
+
+        :param suggest_index: index to look up terms in
+        :param prefix: case-insensitive term prefix
+        :param limit: maximum number of suggestions to return
+        :return: SuggestService object containing matching terms
+        :raise InvalidParameterException: if ``limit`` is less than 1
+        """
+        if limit < 1:
+            detail = f"Suggestion limit must be at least 1, got {limit}"
+            raise InvalidParameterException(detail)
+        prefix = prefix.strip()
+        return SuggestService(
+            query=prefix,
+            suggestions=suggest_index.suggest(prefix, limit) if prefix else [],
+            service_meta_=self._get_service_meta(),
+        )
+
+    def suggest(self, prefix: str, limit: int = 10) -> SuggestService:
+        """Return symbols, previous symbols, and aliases that begin with a prefix,
+        along with the normalized concept each refers to.
+
+        >>> from gene.query import QueryHandler
+        >>> from gene.database import create_db
+        >>> q = QueryHandler(create_db())
+        >>> result = q.suggest("BRA")
+        >>> result.suggestions[0].term
+        'BRAF'
+
+        Suggestions are looked up in an in-memory :py:class:`SuggestIndex
+        <gene.suggest.SuggestIndex>`, which is built from the database on first use if
+        one wasn't given at initialization.
+
+        :param prefix: case-insensitive term prefix
+        :param limit: maximum number of suggestions to return
+        :return: SuggestService object containing matching terms, in order of
+            precedence
+        :raise InvalidParameterException: if ``limit`` is less than 1
+        """
+        if self.suggest_index is None:
+            self.suggest_index = SuggestIndex.from_database(self.db)
+        return self._get_suggest_response(self.suggest_index, prefix, limit)
+
+    def get_query_sources(self, incl: str | None, excl: str | None) -> set[str]:
+        """Resolve the sources to search from user-provided inclusions or exclusions.
+        Can be used to validate ``search`` parameters without performing a search.
+
+        :param incl: str containing comma-separated names of sources to use.
+        :param excl: str containing comma-separated names of source to exclude.
+        :return: names of sources to search
+        :raise InvalidParameterException: if both `incl` and `excl` args are provided,
+            or if invalid source names are given
+        """
         possible_sources = {
             name.value.lower(): name.value for name in SourceName.__members__.values()
         }
         sources = {
-            k: v for k, v in possible_sources.items() if self.db.get_source_metadata(v)
+            k: v
+            for k, v in possible_sources.items()
+            if v in self.source_metadata.sources
         }
 
         if not incl and not excl:
@@ -327,13 +760,7 @@ class QueryHandler:
             if invalid_sources:
                 detail = f"Invalid source name(s): {invalid_sources}"
                 raise InvalidParameterException(detail)
-
-        query_str = query_str.strip()
-
-        resp = self._get_search_response(query_str, query_sources)
-
-        resp["service_meta_"] = self._get_service_meta()
-        return SearchService(**resp)
+        return query_sources
 
     def _add_merged_meta(self, response: NormalizeService) -> NormalizeService:
         """Add source metadata to response object.
@@ -355,48 +782,69 @@ class QueryHandler:
 
         for src in sources:
             if src not in sources_meta:
-                _source_meta = self.db.get_source_metadata(src)
-                sources_meta[SourceName(src)] = SourceMeta(**_source_meta)
+                sources_meta[SourceName(src)] = self._get_source_metadata(src)
         response.source_meta_ = sources_meta
         return response
 
+    @staticmethod
+    def _get_alt_concepts(alt_records: list[dict]) -> list[str]:
+        """Get the normalized concepts of other possible matches.
+
+        :param alt_records: records for other possible matches
+        :return: merge refs of those records
+        """
+        return [r["merge_ref"] for r in alt_records if r.get("merge_ref")]
+
+    @staticmethod
     def _add_alt_matches(
-        self, response: NormService, record: dict, possible_concepts: list[str]
+        response: NormService, record: dict, alt_concepts: list[str]
     ) -> NormService:
         """Add alternate matches warning to response object
 
         :param response: in-progress response object
         :param record: normalized record
-        :param possible_concepts: other possible matches
+        :param alt_concepts: normalized concept IDs of other possible matches
         :return: updated response object
         """
-        norm_concepts = set()
-        for concept_id in possible_concepts:
-            r = self.db.get_record_by_id(concept_id, True)
-            if r:
-                merge_ref = r.get("merge_ref")
-                if merge_ref:
-                    norm_concepts.add(merge_ref)
-        norm_concepts = norm_concepts - {record["concept_id"]}
+        norm_concepts = set(alt_concepts) - {record["concept_id"]}
         if norm_concepts:
             response.warnings.append(
                 {"multiple_normalized_concepts_found": list(norm_concepts)}
             )
         return response
 
+    def _add_fuzzy_match_warning(self, response: NormService) -> NormService:
+        """Add warning describing the term that a query was fuzzy matched to.
+
+        :param response: in-progress response object
+        :return: updated response object
+        """
+        match = self.fuzzy_index.lookup(response.query) if self.fuzzy_index else None
+        if match:
+            response.warnings.append(
+                {
+                    "fuzzy_match": {
+                        "term": match.term,
+                        "ref_type": match.ref_type.value,
+                        "edit_distance": match.edit_distance,
+                    }
+                }
+            )
+        return response
+
     def _add_gene(
         self,
         response: NormalizeService,
         record: dict,
         match_type: MatchType,
-        possible_concepts: list[str] | None = None,
+        alt_concepts: list[str] | None = None,
     ) -> NormalizeService:
         """Add core Gene object to normalization response.
 
         :param response: Response object
         :param record: Gene record
         :param match_type: query's match type
-        :param possible_concepts: List of other normalized concepts found
+        :param alt_concepts: normalized concept IDs of other possible matches
         :raises ValueError: If source of record's concept ID or xrefs/associated with
             sources is not a valid ``NamespacePrefix``
         :return: Response with core Gene
@@ -533,8 +981,10 @@ class QueryHandler:
             gene_obj.extensions = extensions
 
         # add warnings
-        if possible_concepts:
-            response = self._add_alt_matches(response, record, possible_concepts)
+        if alt_concepts:
+            response = self._add_alt_matches(response, record, alt_concepts)
+        if match_type == MatchType.FUZZY_MATCH:
+            response = self._add_fuzzy_match_warning(response)
 
         response.gene = gene_obj
         response = self._add_merged_meta(response)
@@ -585,9 +1035,237 @@ class QueryHandler:
         :param query: String to find normalized concept for
         :return: Normalized gene concept
         """
+        self._check_data_version()
+        return self._get_response(
+            self._get_query_key("normalize", query),
+            query,
+            partial(self._normalize, query),
+        )
+
+    def _normalize(self, query: str) -> NormalizeService:
+        """Perform normalization.
+
+        :param query: user-provided query
+        :return: completed normalization response
+        """
         response = NormalizeService(**self._prepare_normalized_response(query))
         return self._perform_normalized_lookup(response, query, self._add_gene)
 
+    def normalize_batch(self, queries: list[str]) -> list[NormalizeService]:
+        """Return normalized concepts for many queries at once.
+
+        Duplicate queries are resolved only once, and each match tier is checked for
+        all outstanding queries with a single bulk lookup, rather than running the
+        full lookup sequence for each query in turn.
+
+        >>> from gene.query import QueryHandler
+        >>> from gene.database import create_db
+        >>> q = QueryHandler(create_db())
+        >>> results = q.normalize_batch(["BRAF", "braf", "ERBB2"])
+        >>> [r.gene.primaryCoding.id for r in results]
+        ['hgnc:1097', 'hgnc:1097', 'hgnc:3430']
+
+        :param queries: strings to find normalized concepts for
+        :return: normalized gene concepts, in the same order as the given queries
+        """
+        self._check_data_version()
+        responses = self._get_cached_responses("normalize", queries)
+        uncached = [query for query in dict.fromkeys(queries) if query not in responses]
+
+        matches = self._get_normalized_matches(
+            {query.lower().strip() for query in uncached if query}
+        )
+        merge_refs = {
+            r["merge_ref"] for r, _, _ in matches.values() if r.get("merge_ref")
+        }
+        alt_concepts = {c for _, _, pcs in matches.values() for c in pcs or []}
+        merged_records = self.db.get_records_by_ids(merge_refs, False, True)
+        alt_records = self.db.get_records_by_ids(alt_concepts, True)
+
+        responses.update(
+            self._build_normalized_responses(
+                uncached, matches, merged_records, alt_records
+            )
+        )
+        return [responses[query] for query in queries]
+
+    def _get_cached_responses(
+        self, method: str, queries: list[str]
+    ) -> dict[str, Response]:
+        """Retrieve any cached responses for a list of queries.
+
+        :param method: name of query method
+        :param queries: user-provided queries
+        :return: mapping from each query with a cached response to that response
+        """
+        responses = {}
+        for query in dict.fromkeys(queries):
+            cached = self._get_cached_response(
+                self._get_query_key(method, query), query
+            )
+            if cached:
+                responses[query] = cached
+        return responses
+
+    def _build_normalized_responses(
+        self,
+        queries: list[str],
+        matches: dict[str, tuple[dict, MatchType, list[str] | None]],
+        merged_records: list[dict],
+        alt_records: list[dict],
+    ) -> dict[str, NormalizeService]:
+        """Construct (and cache) normalize responses for a batch of queries.
+
+        :param queries: distinct user-provided queries
+        :param matches: output of :py:meth:`_get_normalized_matches` for the queries
+        :param merged_records: merged records for every match's merge ref
+        :param alt_records: records for every match's other possible concepts
+        :return: mapping from each query to its completed response
+        """
+        merged_records = {r["concept_id"].lower(): r for r in merged_records}
+        alt_records = {r["concept_id"]: r for r in alt_records}
+
+        responses = {}
+        for query in queries:
+            response = NormalizeService(**self._prepare_normalized_response(query))
+            match = matches.get(query.lower().strip()) if query else None
+            if match:
+                record, match_type, possible_concepts = match
+                merge_ref = record.get("merge_ref")
+                if merge_ref:
+                    record = merged_records.get(merge_ref.lower())
+                if record:
+                    response = self._add_gene(
+                        response,
+                        record,
+                        match_type,
+                        self._get_alt_concepts(
+                            [
+                                alt_records[c]
+                                for c in possible_concepts or []
+                                if c in alt_records
+                            ]
+                        ),
+                    )
+                else:
+                    _logger.error(
+                        "Merge ref lookup failed for ref %s from query `%s`",
+                        merge_ref,
+                        query,
+                    )
+            self._set_cached_response(self._get_query_key("normalize", query), response)
+            responses[query] = response
+        return responses
+
+    def _get_normalized_matches(
+        self, query_strs: set[str]
+    ) -> dict[str, tuple[dict, MatchType, list[str] | None]]:
+        """Find the best-matching record for each of a set of queries.
+
+        Follows the same match tiers as :py:meth:`_perform_normalized_lookup`, but
+        checks each tier for every query that is still unmatched before moving on to
+        the next one.
+
+        :param query_strs: lowercased, stripped queries
+        :return: mapping from each matched query to its matching record, the match
+            type, and other possible matching concept IDs (if any)
+        """
+        matches = {}
+        candidates = {q for q in query_strs if self._may_match(q)}
+
+        # concept IDs are always CURIEs, so only queries with a colon can match them
+        concept_id_queries = {q for q in candidates if ":" in q}
+        for merge in (True, False):
+            remaining = concept_id_queries - matches.keys()
+            self._add_concept_id_matches(
+                matches, self.db.get_records_by_ids(remaining, False, merge)
+            )
+
+        records = {}
+        for ref_type in RefType:
+            remaining = candidates - matches.keys()
+            if not remaining:
+                break
+            refs = self.db.get_refs_by_terms(remaining, ref_type)
+            # refs keep their case, for backends that require exact keys
+            new_refs = {
+                r for rs in refs.values() for r in rs if r.lower() not in records
+            }
+            for record in self.db.get_records_by_ids(new_refs, False):
+                records[record["concept_id"].lower()] = record
+            self._add_ref_matches(
+                matches, refs, records, MatchType[ref_type.value.upper()]
+            )
+
+        refs = self._get_fuzzy_refs(query_strs - matches.keys())
+        if refs:
+            new_refs = {
+                r for rs in refs.values() for r in rs if r.lower() not in records
+            }
+            for record in self.db.get_records_by_ids(new_refs, False):
+                records[record["concept_id"].lower()] = record
+            self._add_ref_matches(matches, refs, records, MatchType.FUZZY_MATCH)
+        return matches
+
+    def _get_fuzzy_refs(self, query_strs: set[str]) -> dict[str, list[str]]:
+        """Find concept IDs referred to by the closest known term to each query, if
+        fuzzy matching is enabled.
+
+        :param query_strs: lowercased, stripped queries
+        :return: mapping from each query with a close enough term to the concept IDs
+            of identity records referring to that term
+        """
+        if self.fuzzy_index is None:
+            return {}
+        refs = {}
+        for query_str in query_strs:
+            match = self.fuzzy_index.lookup(query_str)
+            if match:
+                refs[query_str] = match.concept_ids
+        return refs
+
+    @staticmethod
+    def _add_concept_id_matches(
+        matches: dict[str, tuple[dict, MatchType, list[str] | None]],
+        records: list[dict],
+    ) -> None:
+        """Add concept ID matches to in-progress batch matches, unless the query has
+        already been matched.
+
+        :param matches: in-progress mapping from queries to matches
+        :param records: records retrieved by concept ID
+        """
+        for record in records:
+            matches.setdefault(
+                record["concept_id"].lower(), (record, MatchType.CONCEPT_ID, None)
+            )
+
+    def _add_ref_matches(
+        self,
+        matches: dict[str, tuple[dict, MatchType, list[str] | None]],
+        refs: dict[str, list[str]],
+        records: dict[str, dict],
+        match_type: MatchType,
+    ) -> None:
+        """Add the best match at a given tier for each query to in-progress batch
+        matches. Matches are selected by :py:meth:`_get_ref_match`, the same as for
+        single queries.
+
+        :param matches: in-progress mapping from queries to matches
+        :param refs: mapping from queries to concept IDs that match them at this tier
+        :param records: retrieved records, keyed by lowercase concept ID
+        :param match_type: type of match that returned these concept IDs
+        """
+        for query_str, matching_refs in refs.items():
+            matching_records = [
+                records[ref.lower()]
+                for ref in dict.fromkeys(matching_refs)
+                if ref.lower() in records
+            ]
+            match = self._get_ref_match(matching_refs, matching_records, match_type)
+            if match is not None:
+                matches[query_str] = match
+
     def _resolve_merge(
         self,
         response: NormService,
@@ -605,6 +1283,11 @@ class QueryHandler:
         :param possible_concepts: alternate possible matches
         :return: Normalized response object
         """
+        alt_concepts = (
+            self._get_alt_concepts(self.db.get_records_by_ids(possible_concepts, True))
+            if possible_concepts
+            else None
+        )
         merge_ref = record.get("merge_ref")
         if merge_ref:
             # follow merge_ref
@@ -619,10 +1302,42 @@ class QueryHandler:
                 )
                 return response
 
-            return callback(response, merge, match_type, possible_concepts)
+            return callback(response, merge, match_type, alt_concepts)
 
         # record is sole member of concept group
-        return callback(response, record, match_type, possible_concepts)
+        return callback(response, record, match_type, alt_concepts)
+
+    def _get_ref_match(
+        self,
+        matching_refs: list[str],
+        matching_records: list[dict],
+        match_type: MatchType,
+    ) -> tuple[dict, MatchType, list[str] | None] | None:
+        """Select the best record among those matching a query at a given tier.
+
+        Concept IDs without a record (e.g. from an index built before the data was
+        reloaded) are dropped.
+
+        :param matching_refs: concept IDs matching the query
+        :param matching_records: records for those concept IDs
+        :param match_type: type of match that returned these records
+        :return: best matching record, match type, and other possible matching concept
+            IDs (if any), or None if no matching record was found
+        """
+        found = {record["concept_id"].lower() for record in matching_records}
+        missing = [ref for ref in matching_refs if ref.lower() not in found]
+        if missing:
+            _logger.error(
+                "Unable to find expected records for %s matching as %s",
+                missing,
+                match_type.name,
+            )
+            matching_refs = [ref for ref in matching_refs if ref.lower() in found]
+        if not matching_records:
+            return None
+        matching_records = sorted(matching_records, key=self._record_order)
+        possible_concepts = list(matching_refs) if len(matching_refs) > 1 else None
+        return matching_records[0], match_type, possible_concepts
 
     def _perform_normalized_lookup(
         self, response: NormService, query: str, response_builder: Callable
@@ -632,58 +1347,106 @@ class QueryHandler:
         :param response: in-progress response object
         :param query: user-provided query
         :param response_builder: response constructor callback method
-        :raises ValueError: If a matching record is null
         :return: completed service response object
         """
         if query == "":
             return response
         query_str = query.lower().strip()
 
-        # check merged concept ID match
-        record = self.db.get_record_by_id(query_str, case_sensitive=False, merge=True)
-        if record:
-            return response_builder(response, record, MatchType.CONCEPT_ID)
+        if self._may_match(query_str):
+            # look up the precomputed resolution and all tiers at once, if the backend
+            # supports it
+            tiers = self.db.get_match_tiers(query_str)
 
-        # check concept ID match
-        record = self.db.get_record_by_id(query_str, case_sensitive=False)
-        if record:
-            return self._resolve_merge(
-                response, record, MatchType.CONCEPT_ID, response_builder
+            # check precomputed resolution
+            resolution = (
+                tiers["resolution"]
+                if tiers is not None
+                else self.db.get_term_resolution(query_str)
             )
+            if resolution and resolution["record"]:
+                return response_builder(
+                    response,
+                    resolution["record"],
+                    MatchType[resolution["match_type"].upper()],
+                    resolution["alt_concepts"] or None,
+                )
 
-        for match_type in RefType:
-            # get matches list for match tier
-            matching_refs = self.db.get_refs_by_type(query_str, match_type)
-            matching_records = [
-                self.db.get_record_by_id(ref, False) for ref in matching_refs
-            ]
-            matching_records.sort(key=self._record_order)
-
-            possible_concepts = list(matching_refs) if len(matching_refs) > 1 else None
+            # check merged concept ID match
+            record = (
+                tiers["merged_record"]
+                if tiers is not None
+                else self.db.get_record_by_id(
+                    query_str, case_sensitive=False, merge=True
+                )
+            )
+            if record:
+                return response_builder(response, record, MatchType.CONCEPT_ID)
+
+            # check concept ID match
+            record = (
+                tiers["record"]
+                if tiers is not None
+                else self.db.get_record_by_id(query_str, case_sensitive=False)
+            )
+            if record:
+                return self._resolve_merge(
+                    response, record, MatchType.CONCEPT_ID, response_builder
+                )
 
-            # attempt merge ref resolution until successful
-            for match in matching_records:
-                if match is None:
-                    err_msg = "Matching record must be nonnull"
-                    raise ValueError(err_msg)
-                record = self.db.get_record_by_id(match["concept_id"], False)
-                if record:
-                    match_type_value = MatchType[match_type.value.upper()]
-                    return self._resolve_merge(
+            for ref_type in RefType:
+                # get matches list for match tier
+                matching_refs = (
+                    tiers["refs"][ref_type]
+                    if tiers is not None
+                    else self.db.get_refs_by_type(query_str, ref_type)
+                )
+                if matching_refs:
+                    return self._resolve_ref_match(
                         response,
-                        record,
-                        match_type_value,
+                        matching_refs,
+                        MatchType[ref_type.value.upper()],
                         response_builder,
-                        possible_concepts,
                     )
+
+        # fall back on closest known term
+        matching_refs = self._get_fuzzy_refs({query_str}).get(query_str)
+        if matching_refs:
+            return self._resolve_ref_match(
+                response, matching_refs, MatchType.FUZZY_MATCH, response_builder
+            )
         return response
 
+    def _resolve_ref_match(
+        self,
+        response: NormService,
+        matching_refs: list[str],
+        match_type: MatchType,
+        response_builder: Callable,
+    ) -> NormService:
+        """Complete response from the concept IDs matching a query at a given tier.
+
+        :param response: in-progress response object
+        :param matching_refs: concept IDs matching the query
+        :param match_type: type of match that returned these concept IDs
+        :param response_builder: response constructor callback method
+        :return: completed service response object
+        """
+        matching_records = self.db.get_records_by_ids(matching_refs, False)
+        match = self._get_ref_match(matching_refs, matching_records, match_type)
+        if match is None:
+            return response
+        record, match_type, possible_concepts = match
+        return self._resolve_merge(
+            response, record, match_type, response_builder, possible_concepts
+        )
+
     def _add_normalized_records(
         self,
         response: UnmergedNormalizationService,
         normalized_record: dict,
         match_type: MatchType,
-        possible_concepts: list[str] | None = None,
+        alt_concepts: list[str] | None = None,
     ) -> UnmergedNormalizationService:
         """Add individual records to unmerged normalize response.
 
@@ -691,38 +1454,62 @@ class QueryHandler:
         :param normalized_record: record associated with normalized concept, either
         merged or single identity
         :param match_type: type of match achieved
-        :param possible_concepts: other possible results
+        :param alt_concepts: normalized concept IDs of other possible results
         :return: Completed response object
         """
-        response.match_type = match_type
-        response.normalized_concept_id = normalized_record["concept_id"]
         if normalized_record["item_type"] == RecordType.IDENTITY:
-            record_source = SourceName[normalized_record["src_name"].upper()]
-            meta = self.db.get_source_metadata(record_source.value)
-            response.source_matches[record_source] = MatchesNormalized(
-                records=[BaseGene(**self._transform_locations(normalized_record))],
-                source_meta_=meta,
-            )
+            source_records = [normalized_record]
         else:
-            xrefs = normalized_record.get("xrefs") or []
-            concept_ids = [normalized_record["concept_id"], *xrefs]
-            for concept_id in concept_ids:
-                record = self.db.get_record_by_id(concept_id, case_sensitive=False)
-                if not record:
-                    continue
-                record_source = SourceName[record["src_name"].upper()]
-                gene = BaseGene(**self._transform_locations(record))
-                if record_source in response.source_matches:
-                    response.source_matches[record_source].records.append(gene)
-                else:
-                    meta = self.db.get_source_metadata(record_source.value)
-                    response.source_matches[record_source] = MatchesNormalized(
-                        records=[gene], source_meta_=meta
-                    )
-        if possible_concepts:
-            response = self._add_alt_matches(
-                response, normalized_record, possible_concepts
+            source_records = self.db.get_records_by_ids(
+                self._get_source_concept_ids(normalized_record), case_sensitive=False
             )
+        return self._add_source_records(
+            response, normalized_record, match_type, source_records, alt_concepts
+        )
+
+    @staticmethod
+    def _get_source_concept_ids(merged_record: dict) -> list[str]:
+        """Get concept IDs of all source records grouped under a merged record.
+
+        :param merged_record: normalized record
+        :return: list of concept IDs
+        """
+        return [merged_record["concept_id"], *(merged_record.get("xrefs") or [])]
+
+    def _add_source_records(
+        self,
+        response: UnmergedNormalizationService,
+        normalized_record: dict,
+        match_type: MatchType,
+        source_records: list[dict],
+        alt_concepts: list[str] | None = None,
+    ) -> UnmergedNormalizationService:
+        """Add retrieved source records to unmerged normalize response.
+
+        :param response: in-progress response
+        :param normalized_record: record associated with normalized concept, either
+        merged or single identity
+        :param match_type: type of match achieved
+        :param source_records: source records grouped under the normalized concept
+        :param alt_concepts: normalized concept IDs of other possible results
+        :return: Completed response object
+        """
+        response.match_type = match_type
+        response.normalized_concept_id = normalized_record["concept_id"]
+        for record in source_records:
+            record_source = SourceName[record["src_name"].upper()]
+            gene = BaseGene(**self._transform_locations(record))
+            if record_source in response.source_matches:
+                response.source_matches[record_source].records.append(gene)
+            else:
+                meta = self._get_source_metadata(record_source.value)
+                response.source_matches[record_source] = MatchesNormalized(
+                    records=[gene], source_meta_=meta
+                )
+        if alt_concepts:
+            response = self._add_alt_matches(response, normalized_record, alt_concepts)
+        if match_type == MatchType.FUZZY_MATCH:
+            response = self._add_fuzzy_match_warning(response)
         return response
 
     def normalize_unmerged(self, query: str) -> UnmergedNormalizationService:
@@ -742,9 +1529,628 @@ class QueryHandler:
         :param query: string to search against
         :return: Normalized response object
         """
+        self._check_data_version()
+        return self._get_response(
+            self._get_query_key("normalize_unmerged", query),
+            query,
+            partial(self._normalize_unmerged, query),
+        )
+
+    def _normalize_unmerged(self, query: str) -> UnmergedNormalizationService:
+        """Perform unmerged normalization.
+
+        :param query: user-provided query
+        :return: completed unmerged normalization response
+        """
         response = UnmergedNormalizationService(
             source_matches={}, **self._prepare_normalized_response(query)
         )
         return self._perform_normalized_lookup(
             response, query, self._add_normalized_records
         )
+
+
+class AsyncQueryHandler(QueryHandler):
+    """Class for normalizer management using an asynchronous database client.
+
+    Provides the same query methods as :py:class:`QueryHandler`, as coroutines.
+    Independent lookups (e.g. each match tier for a query) are issued concurrently
+    rather than in sequence.
+    """
+
+    def __init__(
+        self,
+        database: AbstractAsyncDatabase,
+        cache: ResponseCache | None = None,
+        suggest_index: SuggestIndex | None = None,
+        fuzzy_index: FuzzyIndex | None = None,
+        source_metadata: SourceMetadataSnapshot | None = None,
+        index_db_factory: Callable[[], AbstractDatabase] | None = None,
+    ) -> None:
+        """Initialize AsyncQueryHandler instance. Requires a created async database
+        object to initialize, which can be constructed with the ``create_async_db``
+        method in the ``gene.database`` module:
+
+        >>> from gene.query import AsyncQueryHandler
+        >>> from gene.database import create_async_db
+        >>> q = AsyncQueryHandler(await create_async_db())
+
+        :param database: async storage backend to search against
+        :param cache: cache for completed query responses. If None, every query is
+            performed against the database.
+        :param suggest_index: index of terms for :py:meth:`suggest`. Async databases
+            don't support full scans, so if None, it's built on the first call to
+            ``suggest`` over a connection from ``index_db_factory``.
+        :param fuzzy_index: index of terms for approximate matching. If given,
+            normalization queries that don't match any term exactly are matched to the
+            closest known term, with a ``FUZZY_MATCH`` match type.
+        :param source_metadata: snapshot of source metadata, which also sets how
+            often to check the database for a new data version. Cached responses are
+            dropped whenever a new version is found. If None, a snapshot with the
+            default check interval is used.
+        :param index_db_factory: function opening a synchronous connection to the
+            same data, e.g. ``create_db``. If given, term indexes are rebuilt (in a
+            worker thread) whenever a new data version is found; otherwise, they're
+            left as given.
+        """
+        self.db = database
+        self.cache = cache
+        self.suggest_index = suggest_index
+        self.fuzzy_index = fuzzy_index
+        self.source_metadata = source_metadata or SourceMetadataSnapshot()
+        self.index_db_factory = index_db_factory
+        self.term_filter: BloomFilter | None = None
+        self._term_filter_version: str | None = None
+        self._index_version: str | None = None
+        self._suggest_index_lock = asyncio.Lock()
+        self._in_flight: AsyncSingleFlight[Response] = AsyncSingleFlight()
+
+    def _build_index(self, build: Callable[[AbstractDatabase], Index]) -> Index:
+        """Build a term index over a temporary synchronous database connection.
+
+        :param build: index constructor, e.g. ``SuggestIndex.from_database``
+        :return: constructed index
+        """
+        db = self.index_db_factory()
+        try:
+            return build(db)
+        finally:
+            db.close_connection()
+
+    async def _get_response(
+        self,
+        key: tuple | None,
+        query: str,
+        get_response: Callable[[], Awaitable[Response]],
+    ) -> Response:
+        """Get a query response from the cache, or else compute it.
+
+        Concurrent calls with the same key share a single computation, rather than
+        each performing the same database lookups.
+
+        :param key: query key from :py:meth:`_get_query_key`
+        :param query: user-provided query
+        :param get_response: coroutine function computing the response
+        :return: completed response object
+        """
+        cached = self._get_cached_response(key, query)
+        if cached:
+            return cached
+        if key is None:
+            return await get_response()
+
+        async def get_and_cache_response() -> Response:
+            response = await get_response()
+            self._set_cached_response(key, response)
+            return response
+
+        response, shared = await self._in_flight.do(key, get_and_cache_response)
+        return self._copy_response(response, query) if shared else response
+
+    async def _read_source_metadata(self) -> dict[str, SourceMeta]:
+        """Read metadata for every source from the database, concurrently.
+
+        :return: mapping from names of loaded sources to their metadata
+        """
+        names = [name.value for name in SourceName]
+        results = await asyncio.gather(
+            *(self.db.get_source_metadata(name) for name in names),
+            return_exceptions=True,
+        )
+        sources = {}
+        for name, result in zip(names, results, strict=True):
+            if isinstance(result, DatabaseReadException):
+                _logger.warning("Unable to retrieve metadata for %s", name)
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                sources[name] = SourceMeta(**result)
+        return sources
+
+    async def _check_data_version(self) -> None:
+        """Reload source metadata, and drop cached responses, if the loaded data has
+        changed. Only checks periodically, per the source metadata snapshot's
+        configuration.
+
+        :raise DatabaseReadException: if no source metadata has been loaded yet, and
+            the data version can't be retrieved
+        """
+        if not self.source_metadata.version_check_due():
+            return
+        try:
+            version = await self.db.get_data_version()
+        except DatabaseReadException:
+            if self.source_metadata.version is None:
+                raise
+            _logger.exception("Unable to check data version")
+            return
+        if not self.source_metadata.is_current(version):
+            self.source_metadata.update(version, await self._read_source_metadata())
+        if version != self._term_filter_version:
+            try:
+                data = await self.db.get_term_filter()
+            except DatabaseReadException:
+                _logger.exception("Unable to retrieve term filter")
+                data = None
+            self._set_term_filter(data, version)
+        if self._indexes_outdated(version):
+            if self.index_db_factory is None:
+                _logger.warning(
+                    "Data version changed to %s, but term indexes can't be rebuilt",
+                    version,
+                )
+            else:
+                # the suggestion index is rebuilt on its next use
+                self.suggest_index = None
+                if self.fuzzy_index is not None:
+                    self.fuzzy_index = await asyncio.to_thread(
+                        self._build_index,
+                        partial(
+                            FuzzyIndex.from_database,
+                            max_distance=self.fuzzy_index.max_distance,
+                        ),
+                    )
+        if self.cache is not None:
+            self.cache.set_version(version)
+
+    async def get_data_version(self) -> str | None:
+        """Get an identifier for the currently-loaded data, which changes whenever
+        any source is reloaded. Checked periodically, as for cached responses.
+
+        :return: data version, or None if it's unavailable
+        """
+        await self._check_data_version()
+        return self.source_metadata.version
+
+    async def _get_search_response(self, query: str, sources: set[str]) -> dict:
+        """Return response as dict where key is source name and value is a list of
+        records.
+
+        :param query: string to match against
+        :param sources: sources to match from
+        :return: completed response object to return to client
+        """
+        resp = {
+            "query": query,
+            "warnings": self._emit_warnings(query),
+            "source_matches": dict.fromkeys(sources),
+        }
+        if query == "":
+            return self._post_process_resp(resp)
+
+        terms = self._get_search_terms(query.lower())
+        if not terms:
+            return self._post_process_resp(resp)
+        try:
+            matches = await self.db.get_search_matches(
+                list(dict.fromkeys(term for term, _ in terms)), sources
+            )
+        except DatabaseReadException:
+            _logger.exception("Encountered DatabaseReadException searching %s", query)
+            return self._post_process_resp(resp)
+        if matches is None:
+            await self._add_search_matches_by_type(resp, terms)
+        else:
+            self._add_search_matches(resp, terms, matches)
+
+        # remaining sources get no match
+        return self._post_process_resp(resp)
+
+    async def _add_search_matches_by_type(
+        self, response: dict[str, dict], terms: list[tuple[str, str]]
+    ) -> None:
+        """Look up each search term and item type concurrently, and add matching
+        records to response. Used for backends that can't look up every term at once.
+
+        :param response: in-progress response object to return to client
+        :param terms: (term, item type) pairs, in order of match precedence
+        """
+        results = await asyncio.gather(
+            *(
+                self.db.get_record_by_id(term, False)
+                if item_type == RecordType.IDENTITY.value
+                else self.db.get_refs_by_type(term, RefType(item_type))
+                for term, item_type in terms
+            ),
+            return_exceptions=True,
+        )
+
+        matched_concept_ids = []
+        tier_refs = []
+        for (term, item_type), result in zip(terms, results, strict=True):
+            if isinstance(result, DatabaseReadException):
+                _logger.error(
+                    "Encountered DatabaseReadException looking up %s %s: %s",
+                    item_type,
+                    term,
+                    result,
+                )
+                continue
+            if isinstance(result, BaseException):
+                raise result
+            if item_type == RecordType.IDENTITY.value:
+                if result and result["concept_id"] not in matched_concept_ids:
+                    self._add_record(response, result, MatchType.CONCEPT_ID)
+            else:
+                refs = [ref for ref in result if ref not in matched_concept_ids]
+                if refs:
+                    tier_refs.append((refs, MatchType[item_type.upper()]))
+                    matched_concept_ids.extend(refs)
+
+        if tier_refs:
+            try:
+                records = await self.db.get_records_by_ids(
+                    matched_concept_ids, case_sensitive=False
+                )
+            except DatabaseReadException:
+                _logger.exception(
+                    "Encountered DatabaseReadException looking up %s",
+                    matched_concept_ids,
+                )
+                records = []
+            records = {r["concept_id"].lower(): r for r in records}
+            for refs, match_type in tier_refs:
+                matches = [records[r.lower()] for r in refs if r.lower() in records]
+                self._add_records(response, refs, matches, match_type)
+
+    async def search(
+        self,
+        query_str: str,
+        incl: str = "",
+        excl: str = "",
+    ) -> SearchService:
+        """Return highest match for each source.
+
+        >>> from gene.query import AsyncQueryHandler
+        >>> from gene.database import create_async_db
+        >>> q = AsyncQueryHandler(await create_async_db())
+        >>> result = await q.search("BRAF")
+
+        :param query_str: query, a string, to search for
+        :param incl: str containing comma-separated names of sources to use. Will
+            exclude all other sources. Case-insensitive.
+        :param excl: str containing comma-separated names of source to exclude. Will
+            include all other source. Case-insensitive.
+        :return: SearchService class containing all matches found in sources.
+        :raise InvalidParameterException: if both `incl` and `excl` args are provided,
+            or if invalid source names are given
+        """
+        await self._check_data_version()
+        query_sources = self.get_query_sources(incl, excl)
+        query_str = query_str.strip()
+        return await self._get_response(
+            self._get_query_key("search", query_str, frozenset(query_sources)),
+            query_str,
+            partial(self._search, query_str, query_sources),
+        )
+
+    async def _search(self, query: str, sources: set[str]) -> SearchService:
+        """Perform search.
+
+        :param query: user-provided query
+        :param sources: names of sources to search
+        :return: completed search response
+        """
+        resp = await self._get_search_response(query, sources)
+        resp["service_meta_"] = self._get_service_meta()
+        return SearchService(**resp)
+
+    async def _get_normalized_match(
+        self, query: str
+    ) -> tuple[dict, MatchType, list[str] | None] | None:
+        """Find the normalized record for a query. All match tiers are looked up
+        at once (in a single exchange, if the backend supports it, or otherwise
+        concurrently), and the best one is used.
+
+        :param query: user-provided query
+        :return: normalized record, match type, and normalized concept IDs of other
+            possible matches (if any), or None if no match is found
+        """
+        query_str = query.lower().strip()
+        ref_types = list(RefType)
+        if self._may_match(query_str):
+            tiers = await self.db.get_match_tiers(query_str)
+            resolution = (
+                tiers["resolution"]
+                if tiers is not None
+                else await self.db.get_term_resolution(query_str)
+            )
+            if resolution and resolution["record"]:
+                return (
+                    resolution["record"],
+                    MatchType[resolution["match_type"].upper()],
+                    resolution["alt_concepts"] or None,
+                )
+
+            if tiers is not None:
+                results = [tiers["refs"][rt] for rt in ref_types]
+                results += [tiers["merged_record"], tiers["record"]]
+            else:
+                lookups = [self.db.get_refs_by_type(query_str, rt) for rt in ref_types]
+                # concept IDs are always CURIEs, so only queries with a colon can match
+                if ":" in query_str:
+                    lookups += [
+                        self.db.get_record_by_id(query_str, False, True),
+                        self.db.get_record_by_id(query_str, False),
+                    ]
+                results = await asyncio.gather(*lookups)
+        else:
+            results = [[] for _ in ref_types]
+        refs_by_type = results[: len(ref_types)]
+        merged_record, identity_record = results[len(ref_types) :] or (None, None)
+
+        if merged_record:
+            return merged_record, MatchType.CONCEPT_ID, None
+
+        possible_concepts = None
+        if identity_record:
+            record, match_type = identity_record, MatchType.CONCEPT_ID
+        else:
+            tier = next(
+                (
+                    (MatchType[ref_type.value.upper()], refs)
+                    for ref_type, refs in zip(ref_types, refs_by_type, strict=True)
+                    if refs
+                ),
+                None,
+            )
+            if tier is None:
+                fuzzy_refs = self._get_fuzzy_refs({query_str}).get(query_str)
+                if not fuzzy_refs:
+                    return None
+                tier = (MatchType.FUZZY_MATCH, fuzzy_refs)
+            match_type, matching_refs = tier
+            matching_records = await self.db.get_records_by_ids(matching_refs, False)
+            match = self._get_ref_match(matching_refs, matching_records, match_type)
+            if match is None:
+                return None
+            record, match_type, possible_concepts = match
+
+        alt_lookup = self.db.get_records_by_ids(possible_concepts or [], True)
+        merge_ref = record.get("merge_ref")
+        if merge_ref:
+            merged_record, alt_records = await asyncio.gather(
+                self.db.get_record_by_id(merge_ref, False, True), alt_lookup
+            )
+            if merged_record is None:
+                _logger.error(
+                    "Merge ref lookup failed for ref %s in record %s from query `%s`",
+                    merge_ref,
+                    record["concept_id"],
+                    query,
+                )
+                return None
+            record = merged_record
+        else:
+            alt_records = await alt_lookup
+        return record, match_type, self._get_alt_concepts(alt_records) or None
+
+    async def suggest(self, prefix: str, limit: int = 10) -> SuggestService:
+        """Return symbols, previous symbols, and aliases that begin with a prefix,
+        along with the normalized concept each refers to.
+
+        >>> from gene.query import AsyncQueryHandler
+        >>> from gene.database import create_async_db
+        >>> from gene.database import create_db
+        >>> q = AsyncQueryHandler(await create_async_db(), index_db_factory=create_db)
+        >>> result = await q.suggest("BRA")
+
+        If no suggestion index was given at initialization, it's built (in a worker
+        thread) on first use.
+
+        :param prefix: case-insensitive term prefix
+        :param limit: maximum number of suggestions to return
+        :return: SuggestService object containing matching terms, in order of
+            precedence
+        :raise InvalidParameterException: if ``limit`` is less than 1
+        :raise RuntimeError: if there's no suggestion index, and no
+            ``index_db_factory`` to build one with
+        """
+        suggest_index = self.suggest_index
+        if suggest_index is None:
+            if self.index_db_factory is None:
+                err_msg = "No suggestion index or index_db_factory was provided"
+                raise RuntimeError(err_msg)
+            async with self._suggest_index_lock:
+                if self.suggest_index is None:
+                    self.suggest_index = await asyncio.to_thread(
+                        self._build_index, SuggestIndex.from_database
+                    )
+                suggest_index = self.suggest_index
+        return self._get_suggest_response(suggest_index, prefix, limit)
+
+    async def normalize(self, query: str) -> NormalizeService:
+        """Return normalized concept for query.
+
+        >>> from gene.query import AsyncQueryHandler
+        >>> from gene.database import create_async_db
+        >>> q = AsyncQueryHandler(await create_async_db())
+        >>> result = await q.normalize("BRAF")
+        >>> result.gene.primaryCoding.id
+        'hgnc:1097'
+
+        :param query: String to find normalized concept for
+        :return: Normalized gene concept
+        """
+        await self._check_data_version()
+        return await self._get_response(
+            self._get_query_key("normalize", query),
+            query,
+            partial(self._normalize, query),
+        )
+
+    async def _normalize(self, query: str) -> NormalizeService:
+        """Perform normalization.
+
+        :param query: user-provided query
+        :return: completed normalization response
+        """
+        response = NormalizeService(**self._prepare_normalized_response(query))
+        if query:
+            match = await self._get_normalized_match(query)
+            if match:
+                response = self._add_gene(response, *match)
+        return response
+
+    async def normalize_unmerged(self, query: str) -> UnmergedNormalizationService:
+        """Return all source records under the normalized concept for the
+        provided query string.
+
+        >>> from gene.query import AsyncQueryHandler
+        >>> from gene.database import create_async_db
+        >>> q = AsyncQueryHandler(await create_async_db())
+        >>> response = await q.normalize_unmerged("BRAF")
+        >>> response.normalized_concept_id
+        'hgnc:1097'
+
+        :param query: string to search against
+        :return: Normalized response object
+        """
+        await self._check_data_version()
+        return await self._get_response(
+            self._get_query_key("normalize_unmerged", query),
+            query,
+            partial(self._normalize_unmerged, query),
+        )
+
+    async def _normalize_unmerged(self, query: str) -> UnmergedNormalizationService:
+        """Perform unmerged normalization.
+
+        :param query: user-provided query
+        :return: completed unmerged normalization response
+        """
+        response = UnmergedNormalizationService(
+            source_matches={}, **self._prepare_normalized_response(query)
+        )
+        if query:
+            match = await self._get_normalized_match(query)
+            if match:
+                record, match_type, alt_concepts = match
+                if record["item_type"] == RecordType.IDENTITY:
+                    source_records = [record]
+                else:
+                    source_records = await self.db.get_records_by_ids(
+                        self._get_source_concept_ids(record), case_sensitive=False
+                    )
+                response = self._add_source_records(
+                    response, record, match_type, source_records, alt_concepts
+                )
+        return response
+
+    async def normalize_batch(self, queries: list[str]) -> list[NormalizeService]:
+        """Return normalized concepts for many queries at once.
+
+        Duplicate queries are resolved only once, and every match tier is checked
+        concurrently for all queries with bulk lookups.
+
+        >>> from gene.query import AsyncQueryHandler
+        >>> from gene.database import create_async_db
+        >>> q = AsyncQueryHandler(await create_async_db())
+        >>> results = await q.normalize_batch(["BRAF", "braf", "ERBB2"])
+        >>> [r.gene.primaryCoding.id for r in results]
+        ['hgnc:1097', 'hgnc:1097', 'hgnc:3430']
+
+        :param queries: strings to find normalized concepts for
+        :return: normalized gene concepts, in the same order as the given queries
+        """
+        await self._check_data_version()
+        responses = self._get_cached_responses("normalize", queries)
+        uncached = [query for query in dict.fromkeys(queries) if query not in responses]
+
+        matches = await self._get_normalized_matches(
+            {query.lower().strip() for query in uncached if query}
+        )
+        merge_refs = {
+            r["merge_ref"] for r, _, _ in matches.values() if r.get("merge_ref")
+        }
+        alt_concepts = {c for _, _, pcs in matches.values() for c in pcs or []}
+        merged_records, alt_records = await asyncio.gather(
+            self.db.get_records_by_ids(merge_refs, False, True),
+            self.db.get_records_by_ids(alt_concepts, True),
+        )
+
+        responses.update(
+            self._build_normalized_responses(
+                uncached, matches, merged_records, alt_records
+            )
+        )
+        return [responses[query] for query in queries]
+
+    async def _get_normalized_matches(
+        self, query_strs: set[str]
+    ) -> dict[str, tuple[dict, MatchType, list[str] | None]]:
+        """Find the best-matching record for each of a set of queries.
+
+        Every match tier is looked up concurrently for all queries, and then the best
+        tier for each query is used.
+
+        :param query_strs: lowercased, stripped queries
+        :return: mapping from each matched query to its matching record, the match
+            type, and other possible matching concept IDs (if any)
+        """
+        if not query_strs:
+            return {}
+        candidates = {q for q in query_strs if self._may_match(q)}
+        # concept IDs are always CURIEs, so only queries with a colon can match them
+        concept_id_queries = {q for q in candidates if ":" in q}
+        ref_types = list(RefType)
+        if candidates:
+            merged_records, identity_records, *refs_by_type = await asyncio.gather(
+                self.db.get_records_by_ids(concept_id_queries, False, True),
+                self.db.get_records_by_ids(concept_id_queries, False),
+                *(self.db.get_refs_by_terms(candidates, rt) for rt in ref_types),
+            )
+        else:
+            merged_records, identity_records = [], []
+            refs_by_type = [{} for _ in ref_types]
+
+        matches = {}
+        self._add_concept_id_matches(matches, merged_records)
+        self._add_concept_id_matches(matches, identity_records)
+
+        # use the first tier with any matches for each query
+        tier_refs = {ref_type: {} for ref_type in ref_types}
+        matched = set(matches)
+        for ref_type, refs in zip(ref_types, refs_by_type, strict=True):
+            for query_str, matching_refs in refs.items():
+                if query_str not in matched:
+                    tier_refs[ref_type][query_str] = matching_refs
+                    matched.add(query_str)
+        fuzzy_refs = self._get_fuzzy_refs(query_strs - matched)
+
+        concept_ids = {
+            r
+            for refs in (*tier_refs.values(), fuzzy_refs)
+            for rs in refs.values()
+            for r in rs
+        }
+        records = {
+            r["concept_id"].lower(): r
+            for r in await self.db.get_records_by_ids(concept_ids, False)
+        }
+        for ref_type, refs in tier_refs.items():
+            self._add_ref_matches(
+                matches, refs, records, MatchType[ref_type.value.upper()]
+            )
+        self._add_ref_matches(matches, fuzzy_refs, records, MatchType.FUZZY_MATCH)
+        return matches
@@ -63,11 +63,14 @@ class MatchType(IntEnum):
     ALIAS = 60
     XREF = 60
     ASSOCIATED_WITH = 60
+    FUZZY_MATCH = 20
     NO_MATCH = 0
 
 
 class GeneSequenceLocation(BaseModel):
-    """Sequence Location model when storing in DynamoDB."""
+    """Sequence Location model used for storage by older releases. Current releases
+    store identified VRS ``SequenceLocation`` objects instead.
+    """
 
     type: Literal["SequenceLocation"] = "SequenceLocation"
     start: StrictInt
@@ -313,6 +316,45 @@ class SearchService(BaseModel):
     model_config = ConfigDict(json_schema_extra={})  # TODO
 
 
+class Suggestion(BaseModel):
+    """Define model for a term suggested for a prefix query."""
+
+    term: StrictStr
+    ref_type: RefType
+    concept_id: StrictStr
+    symbol: StrictStr
+
+
+class SuggestService(BaseModel):
+    """Define model for returning terms that begin with a prefix."""
+
+    query: StrictStr
+    suggestions: list[Suggestion] = []
+    service_meta_: ServiceMeta
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "query": "braf",
+                "suggestions": [
+                    {
+                        "term": "BRAF",
+                        "ref_type": "symbol",
+                        "concept_id": "hgnc:1097",
+                        "symbol": "BRAF",
+                    }
+                ],
+                "service_meta_": {
+                    "name": "gene-normalizer",
+                    "version": __version__,
+                    "response_datetime": "2022-03-23 15:57:14.180908",
+                    "url": "https://github.com/cancervariants/gene-normalization",
+                },
+            }
+        }
+    )
+
+
 class GeneTypeFieldName(str, Enum):
     """Designate source-specific gene type field names for Extensions and
     internal records.
@@ -0,0 +1,117 @@
+"""Provide an in-memory index of gene terms for prefix (autocomplete) lookups."""
+
+import logging
+from bisect import bisect_left
+from collections.abc import Iterable
+from timeit import default_timer as timer
+
+from gene.database import AbstractDatabase
+from gene.schemas import RecordType, RefType, Suggestion
+from gene.utils import get_term_mappings
+
+_logger = logging.getLogger(__name__)
+
+
+# term fields of term mapping objects to index, in order of suggestion precedence
+_SUGGEST_FIELDS = (
+    ("symbol", RefType.SYMBOL),
+    ("previous_symbols", RefType.PREVIOUS_SYMBOLS),
+    ("aliases", RefType.ALIASES),
+)
+
+
+class SuggestIndex:
+    """Sorted arrays of gene terms, one per term type, supporting top-k prefix
+    lookups in logarithmic time:
+
+    >>> from gene.database import create_db
+    >>> from gene.suggest import SuggestIndex
+    >>> index = SuggestIndex.from_database(create_db())
+    >>> suggestions = index.suggest("bra", 10)
+
+    Suggestions are ordered first by term type (symbols, then previous symbols, then
+    aliases), and then lexicographically, so that exact and shorter matches precede
+    longer ones. Each normalized concept is suggested at most once.
+    """
+
+    def __init__(self, mappings: Iterable[dict]) -> None:
+        """Build index.
+
+        :param mappings: term mapping objects, as produced by
+            :py:func:`gene.utils.get_term_mappings`
+        """
+        entries: dict[RefType, set[tuple[str, str, str, str]]] = {
+            ref_type: set() for _, ref_type in _SUGGEST_FIELDS
+        }
+        for mapping in mappings:
+            concept_id = mapping["concept_id"]
+            symbol = mapping["symbol"]
+            for field, ref_type in _SUGGEST_FIELDS:
+                terms = mapping.get(field) or []
+                if isinstance(terms, str):
+                    terms = [terms]
+                entries[ref_type].update(
+                    (term.lower(), term, concept_id, symbol) for term in terms
+                )
+        self._entries = {
+            ref_type: sorted(ref_entries) for ref_type, ref_entries in entries.items()
+        }
+        self._keys = {
+            ref_type: [entry[0] for entry in ref_entries]
+            for ref_type, ref_entries in self._entries.items()
+        }
+
+    @classmethod
+    def from_database(cls, database: AbstractDatabase) -> "SuggestIndex":
+        """Build index from all normalized concepts in a database.
+
+        :param database: database to read records from
+        :return: constructed index
+        """
+        start = timer()
+        index = cls(get_term_mappings(database, RecordType.MERGER))
+        _logger.info(
+            "Built suggestion index of %i terms in %.2f seconds",
+            len(index),
+            timer() - start,
+        )
+        return index
+
+    def __len__(self) -> int:
+        """Get number of indexed terms.
+
+        :return: total number of (term, concept) pairs across all term types
+        """
+        return sum(len(keys) for keys in self._keys.values())
+
+    def suggest(self, prefix: str, limit: int) -> list[Suggestion]:
+        """Get terms beginning with a prefix.
+
+        :param prefix: case-insensitive term prefix
+        :param limit: maximum number of suggestions to return
+        :return: up to ``limit`` suggestions, in order of precedence
+        """
+        prefix = prefix.lower()
+        suggestions = []
+        seen_concepts = set()
+        for ref_type, keys in self._keys.items():
+            entries = self._entries[ref_type]
+            i = bisect_left(keys, prefix)
+            while (
+                i < len(keys)
+                and keys[i].startswith(prefix)
+                and len(suggestions) < limit
+            ):
+                _, term, concept_id, symbol = entries[i]
+                if concept_id not in seen_concepts:
+                    seen_concepts.add(concept_id)
+                    suggestions.append(
+                        Suggestion(
+                            term=term,
+                            ref_type=ref_type,
+                            concept_id=concept_id,
+                            symbol=symbol,
+                        )
+                    )
+                i += 1
+        return suggestions
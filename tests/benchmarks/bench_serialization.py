@@ -0,0 +1,104 @@
+"""Compare API response serialization paths.
+
+Measures latency and throughput of encoding query responses with
+:py:class:`gene.main.ModelJSONResponse` against FastAPI's default handling of
+endpoints with a ``response_model``, which dumps the returned model to a dict,
+revalidates it, serializes it again, and encodes it with ``jsonable_encoder`` and
+``json.dumps``. Requires a populated database:
+
+    $ python tests/benchmarks/bench_serialization.py --db_url postgresql://postgres@localhost:5432/gene_normalizer
+"""
+
+import statistics
+from collections.abc import Callable
+from timeit import default_timer as timer
+
+import click
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, TypeAdapter
+
+from gene.database import create_db
+from gene.main import ModelJSONResponse
+from gene.query import QueryHandler
+from gene.schemas import NormalizeService, SearchService, UnmergedNormalizationService
+
+QUERIES = ["BRAF", "ABL1", "ACHE", "TP53", "KRAS", "ERBB2", "EGFR", "CDKN2A"]
+
+
+def default_path(
+    response: BaseModel, adapter: TypeAdapter, exclude_none: bool
+) -> bytes:
+    """Encode response the way FastAPI does for a returned ``response_model``."""
+    content = response.model_dump(by_alias=True, exclude_none=exclude_none)
+    value = adapter.validate_python(content)
+    data = adapter.dump_python(
+        value, mode="json", by_alias=True, exclude_none=exclude_none
+    )
+    return JSONResponse(jsonable_encoder(data)).body
+
+
+def fast_path(response: BaseModel, exclude_none: bool) -> bytes:
+    """Encode response with ModelJSONResponse."""
+    return ModelJSONResponse(response, exclude_none=exclude_none).body
+
+
+def measure(encode: Callable[[], bytes], iterations: int) -> tuple[float, float, float]:
+    """Time repeated calls to an encoding function.
+
+    :return: mean and median latency in microseconds, and throughput in MB/s
+    """
+    timings = []
+    size = 0
+    for _ in range(iterations):
+        start = timer()
+        body = encode()
+        timings.append(timer() - start)
+        size += len(body)
+    total = sum(timings)
+    return (
+        statistics.mean(timings) * 1e6,
+        statistics.median(timings) * 1e6,
+        size / total / 1e6,
+    )
+
+
+@click.command()
+@click.option("--db_url", help="URL endpoint for the application database.")
+@click.option("--iterations", default=200, help="Encodings per response.")
+def main(db_url: str | None, iterations: int) -> None:
+    """Print serialization latency and throughput for each query method."""
+    handler = QueryHandler(create_db(db_url))
+    methods = [
+        ("search", SearchService, False),
+        ("normalize", NormalizeService, True),
+        ("normalize_unmerged", UnmergedNormalizationService, False),
+    ]
+    click.echo(
+        f"{'method':<20}{'path':<10}{'mean (us)':>12}{'median (us)':>14}{'MB/s':>10}"
+    )
+    for method, model_type, exclude_none in methods:
+        responses = [getattr(handler, method)(q) for q in QUERIES]
+        adapter = TypeAdapter(model_type)
+        for response in responses:
+            assert default_path(response, adapter, exclude_none) == fast_path(
+                response, exclude_none
+            )
+        paths = {
+            "default": lambda r, a=adapter, e=exclude_none: default_path(r, a, e),
+            "fast": lambda r, e=exclude_none: fast_path(r, e),
+        }
+        for name, encode in paths.items():
+            results = [
+                measure(lambda r=r, f=encode: f(r), iterations) for r in responses
+            ]
+            mean, median, throughput = (
+                statistics.mean(values) for values in zip(*results, strict=True)
+            )
+            click.echo(
+                f"{method:<20}{name:<10}{mean:>12.1f}{median:>14.1f}{throughput:>10.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,7 @@
 """Provide utilities for test cases."""
 
 import logging
-from collections.abc import Generator
+from collections.abc import Generator, Iterable
 from pathlib import Path
 from typing import Any
 
@@ -114,14 +114,38 @@ def null_database_class():
         def get_source_metadata(self, src_name: str | SourceName) -> dict:
             raise NotImplementedError
 
+        def get_data_version(self) -> str:
+            raise NotImplementedError
+
         def get_record_by_id(
             self, concept_id: str, case_sensitive: bool = True, merge: bool = False
         ) -> dict | None:
             raise NotImplementedError
 
+        def get_records_by_ids(
+            self,
+            concept_ids: Iterable[str],
+            case_sensitive: bool = True,
+            merge: bool = False,
+        ) -> list[dict]:
+            raise NotImplementedError
+
         def get_refs_by_type(self, search_term: str, ref_type: RefType) -> list[str]:
             raise NotImplementedError
 
+        def get_refs_by_terms(
+            self, search_terms: Iterable[str], ref_type: RefType
+        ) -> dict[str, list[str]]:
+            raise NotImplementedError
+
+        def get_match_tiers(self, search_term: str) -> dict | None:
+            raise NotImplementedError
+
+        def get_search_matches(
+            self, search_terms: Iterable[str], sources: Iterable[str]
+        ) -> list[tuple[str, str, dict]] | None:
+            raise NotImplementedError
+
         def get_all_concept_ids(self, source: SourceName | None = None) -> set[str]:
             raise NotImplementedError
 
@@ -130,6 +154,21 @@ def null_database_class():
         ) -> Generator[dict, None, None]:
             yield from self._get_all_records_values[record_type]
 
+        def get_term_filter(self) -> bytes | None:
+            raise NotImplementedError
+
+        def set_term_filter(self, data: bytes) -> None:
+            raise NotImplementedError
+
+        def set_merge_timestamp(self, timestamp: str) -> None:
+            raise NotImplementedError
+
+        def get_term_resolution(self, term: str) -> dict | None:
+            raise NotImplementedError
+
+        def update_term_resolutions(self) -> None:
+            raise NotImplementedError
+
         def add_source_metadata(self, src_name: SourceName, data: SourceMeta) -> None:
             raise NotImplementedError
 
@@ -154,6 +193,9 @@ def null_database_class():
         def close_connection(self) -> None:
             raise NotImplementedError
 
+        def staged_update(self, sources: Iterable[SourceName]) -> None:
+            raise NotImplementedError
+
         def load_from_remote(self, url: str | None = None) -> None:
             raise NotImplementedError
 
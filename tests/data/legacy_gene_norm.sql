@@ -0,0 +1,149 @@
+-- schema and records in the format of pg_dump archives of databases created before
+-- source records were stored as documents, with a single HGNC record
+CREATE TABLE gene_sources (
+    name VARCHAR(127) PRIMARY KEY,
+    data_license TEXT NOT NULL,
+    data_license_url TEXT NOT NULL,
+    version TEXT NOT NULL,
+    data_url JSON NOT NULL,
+    rdp_url TEXT,
+    data_license_nc BOOLEAN NOT NULL,
+    data_license_attr BOOLEAN NOT NULL,
+    data_license_sa BOOLEAN NOT NULL,
+    genome_assemblies TEXT [] NOT NULL
+);
+CREATE TABLE gene_merged (
+    concept_id VARCHAR(127) PRIMARY KEY,
+    symbol TEXT,
+    symbol_status VARCHAR(127),
+    previous_symbols TEXT [],
+    label TEXT,
+    strand VARCHAR(1),
+    ensembl_locations JSON [],
+    hgnc_locations JSON [],
+    ncbi_locations JSON [],
+    location_annotations TEXT [],
+    ensembl_biotype TEXT [],
+    hgnc_locus_type TEXT [],
+    ncbi_gene_type TEXT [],
+    aliases TEXT [],
+    associated_with TEXT [],
+    xrefs TEXT [],
+    gene_description JSON
+);
+CREATE TABLE gene_concepts (
+    concept_id VARCHAR(127) PRIMARY KEY,
+    source VARCHAR(127) NOT NULL REFERENCES gene_sources (name),
+    symbol_status VARCHAR(127),
+    label TEXT,
+    strand VARCHAR(1),
+    location_annotations TEXT [],
+    locations JSON [],
+    gene_type TEXT,
+    gene_description TEXT,
+    merge_ref VARCHAR(127) REFERENCES gene_merged (concept_id)
+);
+CREATE TABLE gene_symbols (
+    id SERIAL PRIMARY KEY,
+    symbol TEXT NOT NULL,
+    concept_id VARCHAR(127) REFERENCES gene_concepts (concept_id)
+);
+CREATE TABLE gene_previous_symbols (
+    id SERIAL PRIMARY KEY,
+    prev_symbol TEXT NOT NULL,
+    concept_id VARCHAR(127) NOT NULL REFERENCES gene_concepts (concept_id)
+);
+CREATE TABLE gene_aliases (
+    id SERIAL PRIMARY KEY,
+    alias TEXT NOT NULL,
+    concept_id VARCHAR(127) NOT NULL REFERENCES gene_concepts (concept_id)
+);
+CREATE TABLE gene_xrefs (
+    id SERIAL PRIMARY KEY,
+    xref TEXT NOT NULL,
+    concept_id VARCHAR(127) NOT NULL REFERENCES gene_concepts (concept_id)
+);
+CREATE TABLE gene_associations (
+    id SERIAL PRIMARY KEY,
+    associated_with TEXT NOT NULL,
+    concept_ID VARCHAR(127) NOT NULL REFERENCES gene_concepts (concept_id)
+);
+
+INSERT INTO gene_sources VALUES (
+    'HGNC', 'CC0', 'https://www.genenames.org/about/license/', '20210810',
+    '{"complete_set_archive": "ftp://ftp.ebi.ac.uk/pub/databases/genenames/hgnc/json/hgnc_complete_set.json"}',
+    NULL, FALSE, FALSE, FALSE, '{}'
+);
+INSERT INTO gene_merged (
+    concept_id, symbol, symbol_status, label, hgnc_locations, aliases, xrefs,
+    hgnc_locus_type
+) VALUES (
+    'hgnc:1097', 'BRAF', 'approved', 'B-Raf proto-oncogene, serine/threonine kinase',
+    ARRAY['{"type": "SequenceLocation", "start": 140719326, "end": 140924929}']::JSON [],
+    '{BRAF1,B-RAF1}', '{ncbigene:673}', '{gene with protein product}'
+);
+INSERT INTO gene_concepts VALUES (
+    'hgnc:1097', 'HGNC', 'approved', 'B-Raf proto-oncogene, serine/threonine kinase',
+    NULL, '{}',
+    ARRAY['{"type": "SequenceLocation", "start": 140719326, "end": 140924929}']::JSON [],
+    'gene with protein product', NULL, 'hgnc:1097'
+);
+INSERT INTO gene_symbols (symbol, concept_id) VALUES ('BRAF', 'hgnc:1097');
+INSERT INTO gene_aliases (alias, concept_id) VALUES
+    ('BRAF1', 'hgnc:1097'), ('B-RAF1', 'hgnc:1097');
+INSERT INTO gene_xrefs (xref, concept_id) VALUES ('ncbigene:673', 'hgnc:1097');
+INSERT INTO gene_associations (associated_with, concept_id) VALUES
+    ('omim:164757', 'hgnc:1097');
+
+CREATE MATERIALIZED VIEW record_lookup_view AS
+SELECT gc.concept_id,
+       gc.symbol_status,
+       gc.label,
+       gc.strand,
+       gc.location_annotations,
+       gc.locations,
+       gc.gene_type,
+       ga.aliases,
+       gas.associated_with,
+       gps.previous_symbols,
+       gs.symbol,
+       gx.xrefs,
+       gc.gene_description,
+       gc.source,
+       gc.merge_ref,
+       lower(gc.concept_id) AS concept_id_lowercase
+FROM gene_concepts gc
+FULL JOIN (
+    SELECT ga_1.concept_id, array_agg(ga_1.alias) AS aliases
+    FROM gene_aliases ga_1
+    GROUP BY ga_1.concept_id
+) ga ON gc.concept_id::text = ga.concept_id::text
+FULL JOIN (
+    SELECT gas_1.concept_id, array_agg(gas_1.associated_with) AS associated_with
+    FROM gene_associations gas_1
+    GROUP BY gas_1.concept_id
+) gas ON gc.concept_id::text = gas.concept_id::text
+FULL JOIN (
+    SELECT gps_1.concept_id, array_agg(gps_1.prev_symbol) AS previous_symbols
+    FROM gene_previous_symbols gps_1
+    GROUP BY gps_1.concept_id
+) gps ON gc.concept_id::text = gps.concept_id::text
+FULL JOIN gene_symbols gs ON gc.concept_id::text = gs.concept_id::text
+FULL JOIN (
+    SELECT gx_1.concept_id, array_agg(gx_1.xref) AS xrefs
+    FROM gene_xrefs gx_1
+    GROUP BY gx_1.concept_id
+) gx ON gc.concept_id::text = gx.concept_id::text;
+
+CREATE INDEX idx_g_concept_id_low
+    ON gene_concepts (lower(concept_id));
+CREATE INDEX idx_gm_concept_id_low ON gene_merged (lower(concept_id));
+CREATE INDEX idx_gs_symbol_low ON gene_symbols (lower(symbol));
+CREATE INDEX idx_gps_symbol_low
+    ON gene_previous_symbols (lower(prev_symbol));
+CREATE INDEX idx_ga_alias_low ON gene_aliases (lower(alias));
+CREATE INDEX idx_gx_xref_low ON gene_xrefs (lower(xref));
+CREATE INDEX idx_g_as_association_low
+    ON gene_associations (lower(associated_with));
+CREATE INDEX idx_rlv_concept_id_low
+    ON record_lookup_view (lower(concept_id));
@@ -0,0 +1,131 @@
+"""Test bulk file annotation."""
+
+import gzip
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from gene.annotate import FileFormat, annotate_file, infer_format
+from gene.cli import cli
+from gene.schemas import RecordType, SourceName
+
+
+@pytest.fixture(scope="module")
+def db_url(tmp_path_factory):
+    """Provide URL of an in-memory database with stubbed HGNC records, so that these
+    tests don't depend on data loaded by other test modules. It's loaded from a dump
+    file so that it's available to worker processes, too.
+    """
+    items = [
+        {
+            "item_type": "source",
+            "src_name": SourceName.HGNC.value,
+            "data_license": "CC0",
+            "data_license_url": "https://www.genenames.org/about/license/",
+            "version": "20210810",
+            "data_url": {
+                "complete_set_archive": "ftp://ftp.ebi.ac.uk/pub/databases/genenames/hgnc/json/hgnc_complete_set.json"
+            },
+            "data_license_attributes": {
+                "non_commercial": False,
+                "share_alike": False,
+                "attribution": False,
+            },
+        },
+        {
+            "concept_id": "hgnc:1097",
+            "symbol": "BRAF",
+            "src_name": SourceName.HGNC.value,
+            "item_type": RecordType.IDENTITY.value,
+        },
+        {
+            "concept_id": "hgnc:108",
+            "symbol": "ACHE",
+            "src_name": SourceName.HGNC.value,
+            "item_type": RecordType.IDENTITY.value,
+        },
+    ]
+    dump = tmp_path_factory.mktemp("annotate_db") / "gene_norm.ndjson.gz"
+    with gzip.open(dump, "wt", encoding="utf-8") as f:
+        f.writelines(json.dumps(item) + "\n" for item in items)
+    return f"memory://{dump}"
+
+
+def test_infer_format(tmp_path):
+    """Test file format inference from file names."""
+    assert infer_format(tmp_path / "genes.tsv") == FileFormat.TSV
+    assert infer_format(tmp_path / "genes.CSV") == FileFormat.CSV
+    assert infer_format(tmp_path / "calls.vcf.gz") == FileFormat.VCF
+    assert infer_format(tmp_path / "calls.vcf.bgz") == FileFormat.VCF
+    with pytest.raises(ValueError, match="Unable to infer"):
+        infer_format(tmp_path / "genes.json")
+
+
+def test_annotate_delimited(tmp_path, db_url):
+    """Test annotation of TSV and CSV files."""
+    infile = tmp_path / "in.csv"
+    infile.write_text(
+        'id,gene,note\n1,BRAF,"a, b"\n2,braf,\n3,not_a_gene,\n4,,\n5,ACHE,\n'
+    )
+    outfile = tmp_path / "out.csv"
+    assert annotate_file(infile, outfile, "gene", db_url=db_url) == 4
+    assert outfile.read_text().splitlines() == [
+        "id,gene,note,gene_normalized_id,gene_symbol,gene_match_type",
+        '1,BRAF,"a, b",hgnc:1097,BRAF,100',
+        "2,braf,,hgnc:1097,BRAF,100",
+        "3,not_a_gene,,,,0",
+        "4,,,,,",
+        "5,ACHE,,hgnc:108,ACHE,100",
+    ]
+
+    with pytest.raises(ValueError, match="Column 'symbol' not found"):
+        annotate_file(infile, outfile, "symbol", db_url=db_url)
+
+
+def test_normalize_file_vcf(tmp_path, db_url):
+    """Test normalize-file command with gzipped VCF input and a process pool."""
+    infile = tmp_path / "in.vcf.gz"
+    with gzip.open(infile, "wt") as f:
+        f.write(
+            "##fileformat=VCFv4.2\n"
+            "#CHROM\tPOS\tID\tREF\tALT\tQUAL\tFILTER\tINFO\n"
+            "1\t10\t.\tA\tT\t.\t.\tDP=3;GENE=BRAF,.,not_a_gene\n"
+            "1\t11\t.\tA\tT\t.\t.\tDP=3\n"
+            "1\t12\t.\tA\tT\t.\t.\tGENE=ache\n"
+        )
+    outfile = tmp_path / "out.vcf"
+    result = CliRunner().invoke(
+        cli,
+        [
+            "normalize-file",
+            str(infile),
+            str(outfile),
+            "--column",
+            "GENE",
+            "--db_url",
+            db_url,
+            "--processes",
+            "2",
+            "--chunk_size",
+            "1",
+        ],
+    )
+    assert result.exit_code == 0, result.output
+    assert "Normalized 3 distinct terms" in result.output
+    lines = outfile.read_text().splitlines()
+    assert lines[0] == "##fileformat=VCFv4.2"
+    assert [line.split(",")[0] for line in lines[1:4]] == [
+        "##INFO=<ID=GENE_NORM_ID",
+        "##INFO=<ID=GENE_NORM_SYMBOL",
+        "##INFO=<ID=GENE_NORM_MATCH",
+    ]
+    assert lines[4].startswith("#CHROM")
+    assert lines[5].split("\t")[7] == (
+        "DP=3;GENE=BRAF,.,not_a_gene;GENE_NORM_ID=hgnc:1097,.,.;"
+        "GENE_NORM_SYMBOL=BRAF,.,.;GENE_NORM_MATCH=100,.,0"
+    )
+    assert lines[6].split("\t")[7] == "DP=3"
+    assert lines[7].split("\t")[7] == (
+        "GENE=ache;GENE_NORM_ID=hgnc:108;GENE_NORM_SYMBOL=ACHE;GENE_NORM_MATCH=100"
+    )
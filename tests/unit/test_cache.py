@@ -0,0 +1,150 @@
+"""Test the response cache and source metadata snapshot."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from gene.cache import (
+    AsyncSingleFlight,
+    ResponseCache,
+    SingleFlight,
+    SourceMetadataSnapshot,
+)
+
+
+def test_lru_eviction():
+    """Test that least recently used entries are evicted first."""
+    cache = ResponseCache(2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+    stats = cache.stats
+    assert stats.hits == 3
+    assert stats.misses == 1
+    assert stats.evictions == 1
+    assert stats.size == 2
+    assert stats.max_size == 2
+
+    cache.clear()
+    assert cache.get("a") is None
+    assert cache.stats.size == 0
+
+    with pytest.raises(ValueError, match="Cache size must be at least 1"):
+        ResponseCache(0)
+
+
+def test_ttl(monkeypatch):
+    """Test that entries expire after TTL."""
+    now = [1000.0]
+    monkeypatch.setattr("gene.cache.time.monotonic", lambda: now[0])
+    cache = ResponseCache(10, ttl=5)
+    cache.set("a", 1)
+    now[0] += 4
+    assert cache.get("a") == 1
+    now[0] += 2
+    assert cache.get("a") is None
+    assert cache.stats.size == 0
+
+
+def test_version_invalidation():
+    """Test that entries are dropped when the data version changes."""
+    cache = ResponseCache(10)
+    cache.set_version("HGNC:1")
+    cache.set("a", 1)
+    cache.set_version("HGNC:1")
+    assert cache.get("a") == 1
+    assert cache.stats.invalidations == 0
+
+    cache.set_version("HGNC:2")
+    assert cache.get("a") is None
+    assert cache.stats.invalidations == 1
+
+
+def test_source_metadata_snapshot(monkeypatch):
+    """Test that the snapshot asks for version checks only once the interval has
+    elapsed, and tracks the version it was loaded at.
+    """
+    now = [1000.0]
+    monkeypatch.setattr("gene.cache.time.monotonic", lambda: now[0])
+    snapshot = SourceMetadataSnapshot(version_check_interval=10)
+    assert snapshot.version_check_due()
+    assert not snapshot.is_current("HGNC:1")
+    assert snapshot.version_check_due()  # nothing loaded yet
+
+    snapshot.update("HGNC:1", {})
+    assert not snapshot.version_check_due()
+    now[0] += 11
+    assert snapshot.version_check_due()
+    assert snapshot.is_current("HGNC:1")
+    assert not snapshot.version_check_due()
+
+
+def test_single_flight():
+    """Test that concurrent calls with the same key share one execution."""
+    flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def slow_call(key):
+        calls.append(key)
+        release.wait()
+        if key == "error":
+            raise ValueError(key)
+        return key.upper()
+
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        futures = [
+            executor.submit(flight.do, key, lambda k=key: slow_call(k))
+            for key in ["a", "a", "a", "b", "error", "error"]
+        ]
+        time.sleep(0.2)
+        release.set()
+        results = [f.result() for f in futures[:4]]
+        errors = [f.exception() for f in futures[4:]]
+
+    assert sorted(calls) == ["a", "b", "error"]
+    assert sorted(results) == [("A", False), ("A", True), ("A", True), ("B", False)]
+    assert all(isinstance(e, ValueError) for e in errors)
+
+    # completed calls aren't retained
+    assert flight.do("a", lambda: "new") == ("new", False)
+
+
+def test_async_single_flight():
+    """Test that concurrent coroutine calls with the same key share one execution,
+    and that cancelling one caller doesn't cancel the shared call.
+    """
+    flight = AsyncSingleFlight()
+    calls = []
+
+    async def slow_call(key):
+        calls.append(key)
+        await asyncio.sleep(0.05)
+        if key == "error":
+            raise ValueError(key)
+        return key.upper()
+
+    async def run():
+        tasks = [
+            asyncio.create_task(flight.do(key, lambda k=key: slow_call(k)))
+            for key in ["a", "a", "a", "b", "error", "error"]
+        ]
+        await asyncio.sleep(0)
+        tasks[0].cancel()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        return results, await flight.do("a", lambda: slow_call("new"))
+
+    results, after = asyncio.run(run())
+    assert calls == ["a", "b", "error", "new"]
+    assert isinstance(results[0], asyncio.CancelledError)
+    assert results[1:4] == [("A", True), ("A", True), ("B", False)]
+    assert all(isinstance(e, ValueError) for e in results[4:])
+    assert after == ("NEW", False)
@@ -1,17 +1,25 @@
 """Test DynamoDB and ETL methods."""
 
+import json
+import tarfile
+from concurrent.futures import ThreadPoolExecutor
 from os import environ
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
+import psycopg
 import pytest
 from boto3.dynamodb.conditions import Key
+from psycopg import sql
+from psycopg.errors import UndefinedTable
 
+from gene.bloom import BloomFilter
 from gene.config import get_config
-from gene.database import AWS_ENV_VAR_NAME
+from gene.database import AWS_ENV_VAR_NAME, DatabaseException
+from gene.database.postgresql import PostgresDatabase
 from gene.etl import HGNC, NCBI, Ensembl
 from gene.etl.merge import Merge
-from gene.schemas import RecordType
+from gene.schemas import RecordType, RefType, SourceMeta, SourceName
 
 IS_DDB_TEST = not get_config().db_url.startswith("postgres")
 ALIASES = {
@@ -84,6 +92,9 @@ def test_tables_created(db_fixture):
             "gene_concepts",
             "gene_merged",
             "gene_sources",
+            "gene_documents",
+            "gene_term_resolution",
+            "gene_metadata",
         }
     else:
         assert db_fixture.db.gene_table in existing_tables
@@ -127,6 +138,22 @@ def test_merged_concepts(processed_ids, db_fixture):
     db_fixture.merge.create_merged_concepts(processed_ids)
 
 
+@pytest.mark.skipif(not get_config().test, reason="not in test environment")
+def test_term_filter(db_fixture):
+    """Test term filter stored during merged concept generation."""
+    term_filter = BloomFilter.from_bytes(db_fixture.db.get_term_filter())
+    assert term_filter.data_version == db_fixture.db.get_data_version()
+    for term in ("hgnc:1097", "ncbigene:673", "braf", "b-raf1", "omim:164757"):
+        assert term in term_filter
+    assert "not_a_gene" not in term_filter
+
+    restored = BloomFilter.from_bytes(term_filter.to_bytes())
+    assert restored.data_version == term_filter.data_version
+    assert "braf" in restored
+    with pytest.raises(ValueError, match="Expected"):
+        BloomFilter.from_bytes(term_filter.to_bytes()[:-1])
+
+
 @pytest.mark.skipif(not IS_DDB_TEST, reason="only applies to DynamoDB in test env")
 def test_item_type(db_fixture):
     """Check that items are tagged with item_type attribute."""
@@ -178,3 +205,416 @@ def test_get_all_records(db_fixture):
     assert len(normalized_records) == 46
     normalized_ids = {r["concept_id"] for r in normalized_records}
     assert len(normalized_ids) == 46
+
+
+@pytest.mark.skipif(IS_DDB_TEST, reason="only applies to PostgreSQL")
+def test_get_all_records_itersize(db_fixture, monkeypatch):
+    """Test that records are streamed in configurable batches, and that other
+    lookups can run while a stream is open, even with a single pooled connection.
+    """
+    expected = list(db_fixture.db.get_all_records(RecordType.MERGER))
+    monkeypatch.setenv("GENE_NORM_DB_CURSOR_ITERSIZE", "7")
+    get_config.cache_clear()
+    single_db = PostgresDatabase(db_fixture.db.conninfo, min_size=1, max_size=1)
+    try:
+        records = single_db.get_all_records(RecordType.MERGER)
+        first = next(records)
+        assert single_db.get_record_by_id(first["concept_id"], merge=True)
+        assert [first, *records] == expected
+    finally:
+        single_db.close_connection()
+        monkeypatch.delenv("GENE_NORM_DB_CURSOR_ITERSIZE")
+        get_config.cache_clear()
+
+
+@pytest.mark.skipif(not get_config().test, reason="not in test environment")
+def test_get_records_by_ids(db_fixture):
+    """Test that bulk record lookup agrees with individual lookups."""
+    concept_ids = ["hgnc:1097", "ncbigene:673", "hgnc:1097", "hgnc:99999999"]
+    records = db_fixture.db.get_records_by_ids(concept_ids)
+    assert [r["concept_id"] for r in records] == ["hgnc:1097", "ncbigene:673"]
+    assert records[0]["symbol"] == "BRAF"
+
+    records = db_fixture.db.get_records_by_ids(
+        ["ensembl:ensg00000157764", "HGNC:1097"], case_sensitive=False
+    )
+    assert [r["concept_id"] for r in records] == [
+        "ensembl:ENSG00000157764",
+        "hgnc:1097",
+    ]
+
+    records = db_fixture.db.get_records_by_ids(["hgnc:1097"], merge=True)
+    assert len(records) == 1
+    assert records[0]["item_type"] == RecordType.MERGER.value
+
+    assert db_fixture.db.get_records_by_ids([]) == []
+
+
+@pytest.mark.skipif(not get_config().test, reason="not in test environment")
+def test_get_refs_by_terms(db_fixture):
+    """Test that bulk ref lookup agrees with individual lookups."""
+    terms = ["braf", "p150", "not-a-gene"]
+    refs = db_fixture.db.get_refs_by_terms(terms, RefType.ALIASES)
+    assert "not-a-gene" not in refs
+    for term in ["braf", "p150"]:
+        assert set(refs.get(term, [])) == set(
+            db_fixture.db.get_refs_by_type(term, RefType.ALIASES)
+        )
+    assert len(refs["p150"]) > 1
+
+
+def test_search_matches(db_fixture):
+    """Test looking up records for several search terms at once."""
+    sources = ["HGNC", "Ensembl", "NCBI"]
+    matches = db_fixture.db.get_search_matches(["braf", "hgnc:1097", "z"], sources)
+    if IS_DDB_TEST:
+        assert matches is None
+        return
+    assert sorted(
+        (term, match_type, r["concept_id"]) for term, match_type, r in matches
+    ) == [
+        ("braf", "symbol", "ensembl:ENSG00000157764"),
+        ("braf", "symbol", "hgnc:1097"),
+        ("braf", "symbol", "ncbigene:673"),
+        ("hgnc:1097", "concept_id", "hgnc:1097"),
+        ("hgnc:1097", "xref", "ensembl:ENSG00000157764"),
+        ("hgnc:1097", "xref", "ncbigene:673"),
+    ]
+    record = next(r for _, _, r in matches if r["concept_id"] == "hgnc:1097")
+    assert record == db_fixture.db.get_record_by_id("hgnc:1097")
+
+    matches = db_fixture.db.get_search_matches(["braf"], ["HGNC"])
+    assert [r["concept_id"] for _, _, r in matches] == ["hgnc:1097"]
+
+
+def test_match_tiers(db_fixture):
+    """Test looking up every normalization match tier for a term at once."""
+    tiers = db_fixture.db.get_match_tiers("BRAF")
+    if IS_DDB_TEST:
+        assert tiers is None
+        return
+    assert tiers["merged_record"] is None
+    assert tiers["record"] is None
+    assert sorted(tiers["refs"][RefType.SYMBOL]) == [
+        "ensembl:ENSG00000157764",
+        "hgnc:1097",
+        "ncbigene:673",
+    ]
+    assert tiers["refs"][RefType.ALIASES] == []
+
+    tiers = db_fixture.db.get_match_tiers("hgnc:1097")
+    assert tiers["resolution"] == db_fixture.db.get_term_resolution("hgnc:1097")
+    assert tiers["merged_record"]["concept_id"] == "hgnc:1097"
+    assert tiers["record"] == db_fixture.db.get_record_by_id("hgnc:1097")
+    assert sorted(tiers["refs"][RefType.XREFS]) == [
+        "ensembl:ENSG00000157764",
+        "ncbigene:673",
+    ]
+
+
+@pytest.mark.skipif(IS_DDB_TEST, reason="only applies to PostgreSQL")
+def test_match_tiers_without_resolutions(db_fixture):
+    """Test that a missing term resolution table is only queried once."""
+    db = PostgresDatabase(db_fixture.db.conninfo)
+    fetch_match_tiers = db._fetch_match_tiers
+    calls = []
+
+    def fetch_without_resolutions(search_term, queries):
+        calls.append(queries is db._resolved_match_tier_queries)
+        if calls[-1]:
+            msg = 'relation "gene_term_resolution" does not exist'
+            raise UndefinedTable(msg)
+        return fetch_match_tiers(search_term, queries)
+
+    db._fetch_match_tiers = fetch_without_resolutions
+    try:
+        for _ in range(2):
+            tiers = db.get_match_tiers("hgnc:1097")
+            assert tiers["resolution"] is None
+            assert tiers["merged_record"]["concept_id"] == "hgnc:1097"
+        assert calls == [True, False, False]
+    finally:
+        db.close_connection()
+
+
+@pytest.mark.skipif(IS_DDB_TEST, reason="only applies to PostgreSQL")
+def test_term_resolution(db_fixture):
+    """Test term resolutions precomputed during merged concept generation."""
+    assert db_fixture.db.get_term_resolution("braf") == {
+        "match_type": "symbol",
+        "concept_id": "hgnc:1097",
+        "merged": True,
+        "alt_concepts": [],
+        "record": db_fixture.db.get_record_by_id("hgnc:1097", False, True),
+    }
+    resolution = db_fixture.db.get_term_resolution("ncbigene:673")
+    assert resolution["match_type"] == "concept_id"
+    assert resolution["concept_id"] == "hgnc:1097"
+    resolution = db_fixture.db.get_term_resolution("ncbigene:653303")
+    assert resolution["merged"] is False
+    assert resolution["record"] == db_fixture.db.get_record_by_id("ncbigene:653303")
+    resolution = db_fixture.db.get_term_resolution("p150")
+    assert resolution["match_type"] == "alias"
+    assert resolution["concept_id"] == "hgnc:1910"
+    assert set(resolution["alt_concepts"]) == {
+        "ensembl:ENSG00000118873",
+        "ensembl:ENSG00000198730",
+        "hgnc:500",
+        "hgnc:76",
+        "hgnc:8982",
+    }
+    assert db_fixture.db.get_term_resolution("not_a_gene") is None
+
+
+@pytest.mark.skipif(IS_DDB_TEST, reason="only applies to PostgreSQL")
+def test_connection_pool(db_fixture):
+    """Test that PostgreSQL lookups can share an instance across threads, and that a
+    failed statement doesn't affect later lookups.
+    """
+    db = db_fixture.db
+    concept_ids = ["hgnc:1097", "ncbigene:673", "ensembl:ENSG00000157764"] * 10
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        records = list(executor.map(db.get_record_by_id, concept_ids))
+    assert [r["concept_id"] for r in records] == concept_ids
+
+    with pytest.raises(UndefinedTable), db.pool.connection() as conn:
+        conn.execute("SELECT * FROM not_a_table;")
+    assert db.get_record_by_id("hgnc:1097")["concept_id"] == "hgnc:1097"
+
+    sized_db = PostgresDatabase(db.conninfo, min_size=2, max_size=3)
+    try:
+        assert (sized_db.pool.min_size, sized_db.pool.max_size) == (2, 3)
+        assert sized_db.get_data_version() == db.get_data_version()
+    finally:
+        sized_db.close_connection()
+
+
+@pytest.mark.skipif(IS_DDB_TEST, reason="only applies to PostgreSQL")
+@pytest.mark.parametrize("staging", [False, True])
+def test_bulk_load(db_fixture, monkeypatch, caplog, staging):
+    """Test that buffered source records are written with COPY, optionally through
+    UNLOGGED staging tables, and that existing records are skipped.
+    """
+    if staging:
+        monkeypatch.setenv("GENE_NORM_DB_UNLOGGED_STAGING", "true")
+    get_config.cache_clear()
+    db = db_fixture.db
+    record = {
+        "concept_id": "hgnc:0",
+        "src_name": "HGNC",
+        "symbol": "TESTGENE",
+        "aliases": ["TESTALIAS1", "TESTALIAS2"],
+        "xrefs": ["ncbigene:0"],
+        "locations": [{"type": "SequenceLocation", "start": 1, "end": 2}],
+    }
+    try:
+        db.add_record(record, SourceName.HGNC)
+        db.add_record({**record, "symbol": "OTHERGENE"}, SourceName.HGNC)
+        db.add_record(db.get_record_by_id("hgnc:1097"), SourceName.HGNC)
+        assert db.get_record_by_id("hgnc:0") is None
+        db.complete_write_transaction()
+
+        loaded = db.get_record_by_id("hgnc:0")
+        assert loaded["symbol"] == "TESTGENE"
+        assert set(loaded["aliases"]) == {"TESTALIAS1", "TESTALIAS2"}
+        assert loaded["locations"] == record["locations"]
+        assert db.get_refs_by_type("testalias2", RefType.ALIASES) == ["hgnc:0"]
+        assert "Record with ID hgnc:0 already exists" in caplog.text
+        assert "Record with ID hgnc:1097 already exists" in caplog.text
+    finally:
+        with db.pool.connection() as conn:
+            for table in ("gene_symbols", "gene_aliases", "gene_xrefs"):
+                conn.execute(
+                    f"DELETE FROM {table} WHERE concept_id = 'hgnc:0';"  # noqa: S608
+                )
+            conn.execute("DELETE FROM gene_concepts WHERE concept_id = 'hgnc:0';")
+            conn.execute(
+                "DELETE FROM gene_documents WHERE concept_id_lowercase = 'hgnc:0';"
+            )
+        db.complete_write_transaction()
+        monkeypatch.delenv("GENE_NORM_DB_UNLOGGED_STAGING", raising=False)
+        get_config.cache_clear()
+    assert db.get_record_by_id("hgnc:0") is None
+
+
+@pytest.mark.skipif(IS_DDB_TEST, reason="only applies to PostgreSQL")
+def test_staged_update(db_fixture):
+    """Test that staged updates are invisible to other readers until complete, and
+    that failed updates leave existing data in place.
+    """
+    db = db_fixture.db
+    reader = PostgresDatabase(db.conninfo)
+    expected = db.get_record_by_id("hgnc:1097")
+    expected_matches = db.get_search_matches(["braf"], ["HGNC", "NCBI"])
+    meta = SourceMeta(**db.get_source_metadata(SourceName.HGNC))
+    records = [
+        r
+        for r in db.get_all_records(RecordType.IDENTITY)
+        if r["src_name"] == SourceName.HGNC.value
+    ]
+
+    with pytest.raises(ValueError, match="failed"), db.staged_update([SourceName.HGNC]):  # noqa: PT012
+        db.delete_source(SourceName.HGNC)
+        assert db.get_record_by_id("hgnc:1097") is None
+        assert db.get_record_by_id("ncbigene:673")["merge_ref"] == "hgnc:1097"
+        assert reader.get_record_by_id("hgnc:1097") == expected
+        raise ValueError("failed")  # noqa: EM101
+    assert db.get_record_by_id("hgnc:1097") == expected
+
+    with db.staged_update([SourceName.HGNC]):
+        db.delete_source(SourceName.HGNC)
+        db.add_source_metadata(SourceName.HGNC, meta)
+        for record in records:
+            db.add_record(record, SourceName.HGNC)
+        db.complete_write_transaction()
+        for record in records:
+            if record.get("merge_ref"):
+                db.update_merge_ref(record["concept_id"], record["merge_ref"])
+        assert db.get_record_by_id("hgnc:1097") == expected
+        assert reader.get_search_matches(["braf"], ["HGNC"]) is not None
+    assert db.get_record_by_id("hgnc:1097") == expected
+    assert reader.get_record_by_id("hgnc:1097") == expected
+    assert reader.get_search_matches(["braf"], ["HGNC", "NCBI"]) == expected_matches
+    assert "gene_documents" in reader.list_tables()
+    reader.close_connection()
+
+    # term resolutions are cleared when sources are reloaded
+    assert db.get_term_resolution("braf") is None
+    db.update_term_resolutions()
+
+
+@pytest.mark.skipif(IS_DDB_TEST, reason="only applies to PostgreSQL")
+def test_snapshot(db_fixture, tmp_path):
+    """Test exporting a native snapshot, and loading it back in."""
+    db = db_fixture.db
+    source_records = list(db.get_all_records(RecordType.IDENTITY))
+    normalized_records = list(db.get_all_records(RecordType.MERGER))
+    search_matches = db.get_search_matches(["braf", "p150"], ["HGNC", "NCBI"])
+    term_filter = db.get_term_filter()
+    term_resolution = db.get_term_resolution("braf")
+
+    db.export_db(tmp_path)
+    archive = next(tmp_path.glob("gene_norm_*.tar"))
+    with tarfile.open(archive) as tar:
+        names = set(tar.getnames())
+    assert "manifest.json" in names
+    assert "gene_documents.copy.gz" in names
+
+    response = MagicMock()
+    response.iter_content.return_value = [archive.read_bytes()]
+    with patch("gene.database.postgresql.requests.get") as mock_get:
+        mock_get.return_value.__enter__.return_value = response
+        db.load_from_remote("https://example.com/gene_norm.tar")
+
+    def sort_key(record: dict) -> str:
+        return record["concept_id"]
+
+    assert sorted(db.get_all_records(RecordType.IDENTITY), key=sort_key) == sorted(
+        source_records, key=sort_key
+    )
+    assert sorted(db.get_all_records(RecordType.MERGER), key=sort_key) == sorted(
+        normalized_records, key=sort_key
+    )
+    assert sorted(
+        db.get_search_matches(["braf", "p150"], ["HGNC", "NCBI"]),
+        key=lambda m: (m[0], m[1], m[2]["concept_id"]),
+    ) == sorted(search_matches, key=lambda m: (m[0], m[1], m[2]["concept_id"]))
+    assert db.get_term_filter() == term_filter
+    assert db.get_term_resolution("braf") == term_resolution
+    assert db.check_schema_initialized()
+
+    # reference table IDs continue from the loaded rows
+    with db.pool.connection() as conn:
+        max_id = conn.execute("SELECT max(id) FROM gene_aliases;").fetchone()[0]
+        next_id = conn.execute(
+            "SELECT nextval(pg_get_serial_sequence('gene_aliases', 'id'));"
+        ).fetchone()[0]
+    assert next_id == max_id + 1
+
+    # manifests can't name files outside of the snapshot directory
+    snapshot_dir = tmp_path / "bad_snapshot"
+    snapshot_dir.mkdir()
+    (snapshot_dir / "manifest.json").write_text(
+        json.dumps(
+            {
+                "format_version": 1,
+                "tables": [
+                    {"name": "gene_sources", "columns": [], "file": "../secret.gz"}
+                ],
+            }
+        )
+    )
+    with pytest.raises(DatabaseException, match="Invalid snapshot file name"):
+        db._load_snapshot(snapshot_dir)
+
+
+@pytest.fixture
+def legacy_db_url(db_fixture):
+    """Provide URL of a separate, empty database, for records in the format of
+    earlier versions.
+    """
+    conninfo = db_fixture.db.conninfo
+    db_name = sql.Identifier("gene_normalizer_legacy_test")
+    with psycopg.connect(conninfo, autocommit=True) as conn:
+        conn.execute(sql.SQL("DROP DATABASE IF EXISTS {};").format(db_name))
+        conn.execute(sql.SQL("CREATE DATABASE {};").format(db_name))
+    yield f"{conninfo.rsplit('/', 1)[0]}/gene_normalizer_legacy_test"
+    with psycopg.connect(conninfo, autocommit=True) as conn:
+        conn.execute(sql.SQL("DROP DATABASE {} WITH (FORCE);").format(db_name))
+
+
+@pytest.mark.skipif(IS_DDB_TEST, reason="only applies to PostgreSQL")
+def test_legacy_schema_migration(legacy_db_url, test_data_dir):
+    """Test that records stored by earlier versions are migrated, not dropped."""
+    with psycopg.connect(legacy_db_url) as conn:
+        conn.execute((test_data_dir / "legacy_gene_norm.sql").read_bytes())
+
+    db = PostgresDatabase(legacy_db_url)
+    try:
+        assert db.check_schema_initialized()
+        assert "record_lookup_view" not in db.list_tables()
+        record = db.get_record_by_id("HGNC:1097")
+        assert record["symbol"] == "BRAF"
+        assert sorted(record["aliases"]) == ["B-RAF1", "BRAF1"]
+        assert record["xrefs"] == ["ncbigene:673"]
+        assert record["associated_with"] == ["omim:164757"]
+        assert record["src_name"] == "HGNC"
+        assert record["merge_ref"] == "hgnc:1097"
+        assert record["locations"] == [
+            {"type": "SequenceLocation", "start": 140719326, "end": 140924929}
+        ]
+        merged = db.get_record_by_id("hgnc:1097", merge=True)
+        assert merged["hgnc_locations"] == record["locations"]
+        assert db.get_search_matches(["braf1"], ["HGNC"])[0][2] == record
+        assert db.get_term_resolution("braf1")["record"] == merged
+    finally:
+        db.close_connection()
+
+    # migrated databases are left in place
+    db = PostgresDatabase(legacy_db_url)
+    try:
+        assert db.get_record_by_id("hgnc:1097") == record
+    finally:
+        db.close_connection()
+
+
+@pytest.mark.skipif(IS_DDB_TEST, reason="only applies to PostgreSQL")
+def test_load_legacy_dump(legacy_db_url, test_data_dir, tmp_path):
+    """Test loading a pg_dump archive written by an earlier version."""
+    archive = tmp_path / "gene_norm_legacy.sql.tar.gz"
+    with tarfile.open(archive, "w:gz") as tar:
+        tar.add(test_data_dir / "legacy_gene_norm.sql", arcname="gene_norm_legacy.sql")
+
+    db = PostgresDatabase(legacy_db_url)
+    try:
+        response = MagicMock()
+        response.iter_content.return_value = [archive.read_bytes()]
+        with patch("gene.database.postgresql.requests.get") as mock_get:
+            mock_get.return_value.__enter__.return_value = response
+            db.load_from_remote("https://example.com/gene_norm_legacy.sql.tar.gz")
+        assert db.check_schema_initialized()
+        assert db.get_record_by_id("hgnc:1097")["symbol"] == "BRAF"
+        assert db.get_term_resolution("braf")["concept_id"] == "hgnc:1097"
+        assert db.get_match_tiers("braf")["resolution"]["merged"]
+    finally:
+        db.close_connection()
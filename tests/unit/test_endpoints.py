@@ -5,22 +5,30 @@ response objects -- here, we're checking for bad branch logic and for basic assu
 that routes integrate correctly with query methods.
 """
 
+import importlib
+import json
 from pathlib import Path
 
 import jsonschema
 import pytest
 import yaml
 from fastapi.testclient import TestClient
+from prometheus_client.parser import text_string_to_metric_families
 
+import gene.main
+from gene.config import get_config
+from gene.etl.update import update_normalized
 from gene.main import app
-from gene.query import QueryHandler
+from gene.schemas import NormalizeService, UnmergedNormalizationService
 
 
 @pytest.fixture(scope="module")
-def api_client(database):
-    """Provide test client fixture."""
-    app.state.query_handler = QueryHandler(database)
-    return TestClient(app)
+def api_client():
+    """Provide test client fixture. Entering the client runs the app lifespan, which
+    constructs the async query handler.
+    """
+    with TestClient(app) as client:
+        yield client
 
 
 def test_search(api_client):
@@ -47,6 +55,42 @@ def test_normalize(api_client):
     }
 
 
+def test_normalize_batch(api_client):
+    """Test /normalize/batch endpoint."""
+    response = api_client.post(
+        "/gene/normalize/batch", json=["braf", "BRAF", "B R A F"]
+    )
+    assert response.status_code == 200
+    results = response.json()
+    assert [r["query"] for r in results] == ["braf", "BRAF", "B R A F"]
+    assert results[0]["gene"]["primaryCoding"]["id"] == "hgnc:1097"
+    assert results[1]["gene"]["primaryCoding"]["id"] == "hgnc:1097"
+    assert "gene" not in results[2]
+
+    response = api_client.post("/gene/normalize/batch", json={"q": "braf"})
+    assert response.status_code == 422
+
+
+def test_normalize_stream(api_client):
+    """Test /normalize/stream endpoint."""
+    body = "braf\r\nB R A F\n\nACHE\n" + "BRAF\n" * 2500 + "\u00e9"
+    response = api_client.post(
+        "/gene/normalize/stream",
+        content=(body[i : i + 7].encode() for i in range(0, len(body), 7)),
+        headers={"Content-Type": "text/plain"},
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    results = [json.loads(line) for line in response.text.splitlines()]
+    assert len(results) == 2504
+    assert [r["query"] for r in results[:3]] == ["braf", "B R A F", "ACHE"]
+    assert results[0]["gene"]["primaryCoding"]["id"] == "hgnc:1097"
+    assert "gene" not in results[1]
+    assert results[2]["gene"]["primaryCoding"]["id"] == "hgnc:108"
+    assert all(r["gene"]["primaryCoding"]["id"] == "hgnc:1097" for r in results[3:-1])
+    assert results[-1]["query"] == "\u00e9"
+
+
 def test_normalize_unmerged(api_client):
     """Test /normalize_unmerged endpoint."""
     response = api_client.get("/gene/normalize_unmerged?q=braf")
@@ -54,6 +98,182 @@ def test_normalize_unmerged(api_client):
     assert response.json()["normalized_concept_id"] == "hgnc:1097"
 
 
+def test_response_serialization(api_client):
+    """Test that query responses are encoded the same as their response models."""
+    response = api_client.get("/gene/normalize?q=braf")
+    assert response.headers["content-type"] == "application/json"
+    expected = NormalizeService(**response.json()).model_dump(
+        mode="json", exclude_none=True
+    )
+    assert response.json() == expected
+
+    response = api_client.get("/gene/normalize_unmerged?q=braf")
+    expected = UnmergedNormalizationService(**response.json()).model_dump(mode="json")
+    assert response.json() == expected
+
+
+def test_conditional_requests(api_client, monkeypatch):
+    """Test ETag and Cache-Control headers on query endpoints."""
+    response = api_client.get("/gene/normalize?q=braf")
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    assert "cache-control" not in response.headers
+
+    response = api_client.get("/gene/normalize?q=braf", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+    assert response.content == b""
+
+    response = api_client.get(
+        "/gene/normalize?q=braf", headers={"If-None-Match": f'"other", W/{etag}'}
+    )
+    assert response.status_code == 304
+
+    # differing queries and endpoints get differing tags
+    response = api_client.get("/gene/normalize?q=BRAF", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    response = api_client.get(
+        "/gene/normalize_unmerged?q=braf", headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    response = api_client.get("/gene/search?q=braf")
+    search_etag = response.headers["etag"]
+    response = api_client.get("/gene/search?q=braf&incl=hgnc")
+    assert response.headers["etag"] != search_etag
+    response = api_client.get(
+        "/gene/search?q=braf&incl=hgnc&excl=ncbi", headers={"If-None-Match": "*"}
+    )
+    assert response.status_code == 422
+
+    monkeypatch.setenv("GENE_NORM_CACHE_CONTROL_MAX_AGE", "3600")
+    get_config.cache_clear()
+    try:
+        response = api_client.get(
+            "/gene/search?q=braf", headers={"If-None-Match": search_etag}
+        )
+        assert response.status_code == 304
+        assert response.headers["cache-control"] == "public, max-age=3600"
+    finally:
+        monkeypatch.delenv("GENE_NORM_CACHE_CONTROL_MAX_AGE")
+        get_config.cache_clear()
+
+
+@pytest.mark.skipif(not get_config().test, reason="not in test environment")
+def test_etag_after_merge(database, monkeypatch):
+    """Test that regenerating normalized records changes ETags, even if no source
+    versions change.
+    """
+    monkeypatch.setenv("GENE_NORM_VERSION_CHECK_INTERVAL", "0")
+    get_config.cache_clear()
+    try:
+        with TestClient(app) as client:
+            etag = client.get("/gene/normalize?q=braf").headers["etag"]
+            update_normalized(database, None)
+            response = client.get(
+                "/gene/normalize?q=braf", headers={"If-None-Match": etag}
+            )
+            assert response.status_code == 200
+            assert response.headers["etag"] != etag
+            assert response.json()["gene"]["primaryCoding"]["id"] == "hgnc:1097"
+    finally:
+        monkeypatch.delenv("GENE_NORM_VERSION_CHECK_INTERVAL")
+        get_config.cache_clear()
+
+
+def test_suggest(api_client):
+    """Test /suggest endpoint."""
+    response = api_client.get("/gene/suggest?prefix=bra")
+    assert response.status_code == 200
+    assert response.json()["suggestions"] == [
+        {
+            "term": "BRAF",
+            "ref_type": "symbol",
+            "concept_id": "hgnc:1097",
+            "symbol": "BRAF",
+        }
+    ]
+
+    response = api_client.get("/gene/suggest?prefix=bra&limit=0")
+    assert response.status_code == 422
+
+
+@pytest.fixture
+def metrics_client(monkeypatch):
+    """Provide test client for an app instance with metrics enabled."""
+    monkeypatch.setenv("GENE_NORM_METRICS", "true")
+    get_config.cache_clear()
+    try:
+        with TestClient(importlib.reload(gene.main).app) as client:
+            yield client
+    finally:
+        monkeypatch.delenv("GENE_NORM_METRICS")
+        get_config.cache_clear()
+        importlib.reload(gene.main)
+
+
+def test_metrics(metrics_client):
+    """Test /metrics endpoint."""
+    assert metrics_client.get("/gene/normalize?q=braf").status_code == 200
+    assert metrics_client.get("/gene/normalize?q=not_a_gene").status_code == 200
+    assert metrics_client.get("/gene/search?q=braf&incl=sdkl").status_code == 422
+    assert metrics_client.get("/gene/search?q=braf&incl=hgnc").status_code == 200
+    assert (
+        metrics_client.post("/gene/normalize/batch", json=["BRAF", "ACHE"]).status_code
+        == 200
+    )
+
+    response = metrics_client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    samples = {
+        (sample.name, tuple(sorted(sample.labels.items()))): sample.value
+        for family in text_string_to_metric_families(response.text)
+        for sample in family.samples
+    }
+
+    def get_samples(name, **labels):
+        return [
+            value
+            for (sample_name, sample_labels), value in samples.items()
+            if sample_name == name and labels.items() <= dict(sample_labels).items()
+        ]
+
+    assert get_samples(
+        "gene_norm_request_duration_seconds_count",
+        method="GET",
+        route="/gene/normalize",
+        status="200",
+    ) == [2.0]
+    assert get_samples(
+        "gene_norm_request_errors_total", route="/gene/search", status="422"
+    ) == [1.0]
+    assert not get_samples("gene_norm_request_errors_total", route="/gene/normalize")
+    assert get_samples(
+        "gene_norm_match_types_total", method="normalize", match_type="100"
+    ) == [1.0]
+    assert get_samples(
+        "gene_norm_match_types_total", method="normalize", match_type="0"
+    ) == [1.0]
+    assert get_samples(
+        "gene_norm_match_types_total", method="normalize_batch", match_type="100"
+    ) == [2.0]
+    assert get_samples(
+        "gene_norm_match_types_total", method="search", match_type="100"
+    ) == [1.0]
+    # which operations serve a request depends on the backend and loaded tables
+    assert get_samples(
+        "gene_norm_db_operation_duration_seconds_count", operation="get_record_by_id"
+    )
+    assert any(
+        value > 0
+        for value in get_samples("gene_norm_db_operation_duration_seconds_count")
+    )
+    assert get_samples("gene_norm_stage_duration_seconds_count", stage="serialize")
+    assert get_samples("gene_norm_stage_duration_seconds_count", stage="vrs_location")
+
+
 def test_service_info(api_client: TestClient, test_data_dir: Path):
     response = api_client.get("/gene/service-info")
     response.raise_for_status()
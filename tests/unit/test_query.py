@@ -1,11 +1,21 @@
 """Module to test the query module."""
 
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+
 import pytest
 from deepdiff import DeepDiff
 from ga4gh.core.models import MappableConcept
 
-from gene.query import InvalidParameterException, QueryHandler
-from gene.schemas import BaseGene, MatchType, SourceName
+from gene.bloom import BloomFilter
+from gene.cache import ResponseCache, SourceMetadataSnapshot
+from gene.database import create_async_db
+from gene.database.memory import AsyncMemoryDatabase, MemoryDatabase
+from gene.fuzzy import FuzzyIndex
+from gene.query import AsyncQueryHandler, InvalidParameterException, QueryHandler
+from gene.schemas import BaseGene, MatchType, RecordType, RefType, SourceName
 
 
 @pytest.fixture(scope="module")
@@ -25,6 +35,9 @@ def query_handler(database):
         def normalize_unmerged(self, query_str):
             return self.query_handler.normalize_unmerged(query_str)
 
+        def normalize_batch(self, queries):
+            return self.query_handler.normalize_batch(queries)
+
     return QueryGetter()
 
 
@@ -1672,6 +1685,86 @@ def test_normalize_unmerged(
     )
 
 
+def test_normalize_batch(query_handler):
+    """Test that batch normalization agrees with individual normalization."""
+    queries = [
+        "BRAF",
+        "hgnc:108",
+        "HGNC:108",
+        "ACEE",
+        "P150",
+        "ARACHE",
+        "omim:100740",
+        "LOC653303",
+        "braf",
+        "B R A F",
+        "",
+        "BRAF",
+    ]
+    resps = query_handler.normalize_batch(queries)
+    assert len(resps) == len(queries)
+    for q, resp in zip(queries, resps, strict=True):
+        expected = query_handler.normalize(q)
+        assert resp.query == q
+        assert resp.model_dump(exclude={"service_meta_"}) == expected.model_dump(
+            exclude={"service_meta_"}
+        )
+
+    assert query_handler.normalize_batch([]) == []
+
+
+def test_normalize_batch_ref_case(database, monkeypatch):
+    """Test that batch normalization looks up records by concept IDs with their
+    original case, which some backends require for bulk lookups.
+    """
+    requested = []
+    get_records_by_ids = database.get_records_by_ids
+
+    def recording_get_records_by_ids(concept_ids, *args, **kwargs):
+        concept_ids = list(concept_ids)
+        requested.extend(concept_ids)
+        return get_records_by_ids(concept_ids, *args, **kwargs)
+
+    monkeypatch.setattr(database, "get_records_by_ids", recording_get_records_by_ids)
+    resp = QueryHandler(database).normalize_batch(["BRAF"])[0]
+    assert resp.gene.primaryCoding.id == "hgnc:1097"
+    assert "ensembl:ENSG00000157764" in requested
+    assert "ensembl:ensg00000157764" not in requested
+
+
+def test_normalize_batch_missing_refs(database):
+    """Test that batch normalization drops concept IDs without a record from possible
+    matches, the same as individual normalization.
+    """
+    async_db = AsyncMemoryDatabase(database=database)
+    memory_db = async_db.db
+    xrefs = memory_db._refs[RefType.XREFS]
+    xrefs["test:shared"] = ["hgnc:1097", "hgnc:108"]
+    xrefs["test:missing"] = ["hgnc:108"]
+    del memory_db._records["hgnc:108"]
+    queries = ["test:shared", "test:missing"]
+
+    handler = QueryHandler(memory_db)
+    matches = handler._get_normalized_matches(set(queries))
+    assert matches["test:shared"][0]["concept_id"] == "hgnc:1097"
+    assert matches["test:shared"][1:] == (MatchType.XREF, None)
+    assert "test:missing" not in matches
+
+    async_handler = AsyncQueryHandler(async_db)
+    for resps in (
+        handler.normalize_batch(queries),
+        asyncio.run(async_handler.normalize_batch(queries)),
+    ):
+        for query, resp in zip(queries, resps, strict=True):
+            expected = handler.normalize(query)
+            assert resp.model_dump(exclude={"service_meta_"}) == expected.model_dump(
+                exclude={"service_meta_"}
+            ), query
+    assert resps[0].gene.primaryCoding.id == "hgnc:1097"
+    assert resps[0].warnings == []
+    assert resps[1].match_type == MatchType.NO_MATCH
+
+
 def test_invalid_queries(query_handler):
     """Test invalid queries"""
     resp = query_handler.normalize("B R A F")
@@ -1689,3 +1782,410 @@ def test_service_meta(query_handler):
     """Test service meta info in response."""
     resp = query_handler.search("pheno")
     compare_service_meta(resp.service_meta_)
+
+
+def test_cache(database):
+    """Test that cached responses match uncached responses."""
+    cache = ResponseCache(100)
+    cached_handler = QueryHandler(database, cache)
+    handler = QueryHandler(database)
+
+    for method in ("normalize", "normalize_unmerged", "search"):
+        for query in ("BRAF", "braf ", "ncbigene:673", "B R A F", "sp\xa0ry3"):
+            expected = getattr(handler, method)(query)
+            for _ in range(2):
+                resp = getattr(cached_handler, method)(query)
+                assert resp.query == expected.query
+                assert resp.model_dump(
+                    exclude={"service_meta_"}
+                ) == expected.model_dump(exclude={"service_meta_"})
+    stats = cache.stats
+    # queries with non-breaking spaces bypass the cache
+    assert stats.size == 3 * 3
+    assert stats.misses == 3 * 3
+    assert stats.hits == 3 * 5
+
+    resp = cached_handler.search("BRAF", incl="hgnc")
+    assert set(resp.source_matches) == {SourceName.HGNC}
+    resp = cached_handler.search("BRAF")
+    assert len(resp.source_matches) == 3
+
+    batch = cached_handler.normalize_batch(["BRAF", "ACHE", "ache"])
+    assert [r.query for r in batch] == ["BRAF", "ACHE", "ache"]
+    assert batch[1].model_dump(exclude={"service_meta_", "query"}) == (
+        handler.normalize("ACHE").model_dump(exclude={"service_meta_", "query"})
+    )
+    assert cached_handler.normalize("Ache").gene.primaryCoding.id == "hgnc:108"
+
+
+def test_async_query_handler(database):
+    """Test that async query responses match sync query responses."""
+    queries = [
+        "BRAF",
+        "hgnc:108",
+        "HGNC:108",
+        "ensembl:ENSG00000157764",
+        "ACEE",
+        "P150",
+        "ARACHE",
+        "omim:100740",
+        "LOC653303",
+        "ENSG00000278704",
+        "B R A F",
+        "",
+    ]
+    methods = ("search", "normalize", "normalize_unmerged")
+
+    async def _run_queries():
+        db = await create_async_db()
+        try:
+            cache = ResponseCache(100)
+            handler = AsyncQueryHandler(db, cache)
+            results = {
+                method: [await getattr(handler, method)(q) for q in queries]
+                for method in methods
+            }
+            results["normalize_batch"] = await handler.normalize_batch(queries)
+            results["cached"] = await handler.normalize("braf")
+            results["incl"] = await handler.search("BRAF", incl="hgnc")
+            with pytest.raises(InvalidParameterException):
+                await handler.search("BRAF", incl="hgnc", excl="ncbi")
+            return results, cache.stats
+        finally:
+            await db.close_connection()
+
+    results, stats = asyncio.run(_run_queries())
+    handler = QueryHandler(database)
+    for method in methods:
+        for query, resp in zip(queries, results[method], strict=True):
+            expected = getattr(handler, method)(query)
+            assert resp.model_dump(exclude={"service_meta_"}) == expected.model_dump(
+                exclude={"service_meta_"}
+            ), (method, query)
+    for query, resp in zip(queries, results["normalize_batch"], strict=True):
+        expected = results["normalize"][queries.index(query)]
+        assert resp.model_dump(exclude={"service_meta_"}) == expected.model_dump(
+            exclude={"service_meta_"}
+        )
+    assert results["cached"].gene.primaryCoding.id == "hgnc:1097"
+    assert set(results["incl"].source_matches) == {SourceName.HGNC}
+    # one repeated query per method, every batch query, and the final normalize call
+    assert stats.hits == 3 + len(queries) + 1
+
+
+def test_suggest(query_handler):
+    """Test that suggestions are ranked by term type, then lexicographically."""
+    handler = query_handler.query_handler
+    resp = handler.suggest(" Bra")
+    assert resp.query == "Bra"
+    assert [(s.term, s.ref_type, s.concept_id) for s in resp.suggestions] == [
+        ("BRAF", RefType.SYMBOL, "hgnc:1097")
+    ]
+
+    resp = handler.suggest("loc", limit=3)
+    assert [(s.term, s.ref_type) for s in resp.suggestions] == [
+        ("LOC106783576", RefType.SYMBOL),
+        ("LOC653303", RefType.SYMBOL),
+        ("LOC100287429", RefType.PREVIOUS_SYMBOLS),
+    ]
+
+    # each concept is suggested once, by its highest-precedence matching term
+    resp = handler.suggest("p150", limit=100)
+    concept_ids = [s.concept_id for s in resp.suggestions]
+    assert len(concept_ids) == len(set(concept_ids))
+    assert all(s.ref_type == RefType.ALIASES for s in resp.suggestions)
+
+    assert handler.suggest("").suggestions == []
+    assert handler.suggest("zzzz").suggestions == []
+    with pytest.raises(InvalidParameterException):
+        handler.suggest("bra", limit=0)
+
+
+def test_async_suggest(database):
+    """Test that the async handler builds its suggestion index on first use."""
+    handler = AsyncQueryHandler(AsyncMemoryDatabase(database=database))
+    with pytest.raises(RuntimeError):
+        asyncio.run(handler.suggest("bra"))
+
+    handler = AsyncQueryHandler(
+        AsyncMemoryDatabase(database=database),
+        index_db_factory=lambda: MemoryDatabase(database=database),
+    )
+    assert handler.suggest_index is None
+    resp = asyncio.run(handler.suggest("bra"))
+    assert handler.suggest_index is not None
+    assert resp.suggestions == QueryHandler(database).suggest("bra").suggestions
+
+
+def test_fuzzy_match(database):
+    """Test that unmatched queries fall back on the closest known term, when enabled."""
+    handler = QueryHandler(database, fuzzy_index=FuzzyIndex.from_database(database))
+    queries = [
+        "BRAFF",
+        "b raf",
+        "B\u2010RAF",
+        "b-raff",
+        "ARAHCE",
+        "ACH",
+        "XYZQ",
+        "BRAF",
+    ]
+    expected = [
+        ("hgnc:1097", "BRAF", "symbol", 1),
+        ("hgnc:1097", "BRAF", "symbol", 0),
+        ("hgnc:1097", "BRAF", "symbol", 0),
+        ("hgnc:1097", "BRAF", "symbol", 1),
+        ("hgnc:108", "ARACHE", "alias", 1),
+        None,
+        None,
+        None,
+    ]
+    batch = handler.normalize_batch(queries)
+    async_handler = AsyncQueryHandler(
+        AsyncMemoryDatabase(database=database), fuzzy_index=handler.fuzzy_index
+    )
+    async_batch = asyncio.run(async_handler.normalize_batch(queries))
+    for query, expected_match, batch_resp, async_batch_resp in zip(
+        queries, expected, batch, async_batch, strict=True
+    ):
+        resp = handler.normalize(query)
+        if expected_match is None:
+            assert resp.match_type != MatchType.FUZZY_MATCH, query
+            assert resp.warnings == [], query
+        else:
+            concept_id, term, ref_type, distance = expected_match
+            assert resp.match_type == MatchType.FUZZY_MATCH, query
+            assert resp.gene.primaryCoding.id == concept_id
+            assert resp.warnings == [
+                {
+                    "fuzzy_match": {
+                        "term": term,
+                        "ref_type": ref_type,
+                        "edit_distance": distance,
+                    }
+                }
+            ]
+        for other in (batch_resp, async_batch_resp):
+            assert other.model_dump(exclude={"service_meta_"}) == resp.model_dump(
+                exclude={"service_meta_"}
+            ), query
+
+    resp = handler.normalize_unmerged("BRAFF")
+    assert resp.match_type == MatchType.FUZZY_MATCH
+    assert resp.normalized_concept_id == "hgnc:1097"
+
+    # disabled by default
+    assert QueryHandler(database).normalize("BRAFF").match_type == MatchType.NO_MATCH
+
+
+def test_source_metadata_refresh(database):
+    """Test that source metadata and cached responses are reloaded once the data
+    version changes.
+    """
+    memory_db = MemoryDatabase(database=database)
+    cache = ResponseCache(10)
+    handler = QueryHandler(memory_db, cache, source_metadata=SourceMetadataSnapshot(0))
+    resp = handler.normalize("BRAF")
+    version = resp.source_meta_[SourceName.HGNC].version
+    assert handler.normalize("BRAF").source_meta_ is not None
+    assert cache.stats.hits == 1
+
+    memory_db._sources["HGNC"] = {**memory_db._sources["HGNC"], "version": "updated"}
+    resp = handler.normalize("BRAF")
+    assert resp.source_meta_[SourceName.HGNC].version == "updated" != version
+    assert cache.stats.invalidations == 1
+    assert (
+        handler.search("BRAF").source_matches[SourceName.HGNC].source_meta_
+        == (resp.source_meta_[SourceName.HGNC])
+    )
+
+
+def test_term_index_refresh(database):
+    """Test that term indexes are rebuilt once the data version changes, and that
+    concept IDs from an outdated index are ignored.
+    """
+    memory_db = MemoryDatabase(database=database)
+    fuzzy_index = FuzzyIndex.from_database(memory_db)
+    handler = QueryHandler(
+        memory_db, fuzzy_index=fuzzy_index, source_metadata=SourceMetadataSnapshot(0)
+    )
+    assert handler.normalize("BRAFF").gene.primaryCoding.id == "hgnc:1097"
+    assert handler.suggest("BRAF").suggestions
+    suggest_index = handler.suggest_index
+
+    for concept_id, record in list(memory_db._records.items()):
+        if record["symbol"] == "BRAF":
+            del memory_db._records[concept_id]
+    assert handler.normalize("BRAFF").match_type == MatchType.NO_MATCH
+    assert handler.normalize_batch(["BRAFF"])[0].match_type == MatchType.NO_MATCH
+    assert handler.fuzzy_index is fuzzy_index
+
+    memory_db._sources["HGNC"] = {**memory_db._sources["HGNC"], "version": "updated"}
+    resp = handler.normalize("BRAFF")
+    assert resp.gene is None or resp.gene.primaryCoding.id != "hgnc:1097"
+    assert handler.fuzzy_index is not fuzzy_index
+    assert len(handler.fuzzy_index) < len(fuzzy_index)
+    assert handler.suggest_index is None
+    handler.suggest("BRAF")
+    assert handler.suggest_index is not suggest_index
+
+
+def test_request_coalescing(database):
+    """Test that concurrent identical queries share a single lookup."""
+    handler = AsyncQueryHandler(AsyncMemoryDatabase(database=database))
+    lookups = []
+    get_normalized_match = handler._get_normalized_match
+
+    async def counting_get_normalized_match(query):
+        lookups.append(query)
+        await asyncio.sleep(0.01)
+        return await get_normalized_match(query)
+
+    handler._get_normalized_match = counting_get_normalized_match
+    queries = ["ACHE", "ache", " ACHE ", "ACHE", "BRAF", "ACHE\u00a0"]
+
+    async def run():
+        return await asyncio.gather(*(handler.normalize(q) for q in queries))
+
+    responses = asyncio.run(run())
+    assert sorted(lookups) == ["ACHE", "ACHE\u00a0", "BRAF"]
+    assert [r.query for r in responses] == queries
+    assert all(r.gene.primaryCoding.id == "hgnc:108" for r in responses[:4])
+    assert responses[4].gene.primaryCoding.id == "hgnc:1097"
+    assert responses[0].gene is responses[1].gene
+
+    # sync handler
+    sync_handler = QueryHandler(database)
+    normalize = sync_handler._normalize
+    calls = []
+
+    def slow_normalize(query):
+        calls.append(query)
+        time.sleep(0.2)
+        return normalize(query)
+
+    sync_handler._normalize = slow_normalize
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        sync_responses = list(executor.map(sync_handler.normalize, queries[:4]))
+    assert len(calls) == 1
+    assert [r.query for r in sync_responses] == queries[:4]
+    assert all(r.gene.primaryCoding.id == "hgnc:108" for r in sync_responses)
+
+
+def test_memory_database(database, tmp_path):
+    """Test that the in-memory database returns the same responses as the database it
+    was copied from, including after an export and reload.
+    """
+    queries = [
+        "BRAF",
+        "hgnc:108",
+        "ensembl:ENSG00000157764",
+        "ACEE",
+        "P150",
+        "ARACHE",
+        "omim:100740",
+        "LOC653303",
+        "B R A F",
+    ]
+    memory_db = MemoryDatabase(database=database)
+    assert memory_db.check_tables_populated()
+    assert memory_db.get_data_version() == database.get_data_version()
+    assert memory_db.get_all_concept_ids() == {
+        r["concept_id"] for r in database.get_all_records(RecordType.IDENTITY)
+    }
+
+    memory_db.export_db(tmp_path)
+    reloaded_db = MemoryDatabase(f"memory://{next(tmp_path.glob('*.ndjson.gz'))}")
+
+    handler = QueryHandler(database)
+    for db in (memory_db, reloaded_db):
+        memory_handler = QueryHandler(db)
+        for method in ("search", "normalize", "normalize_unmerged"):
+            for query in queries:
+                expected = getattr(handler, method)(query)
+                resp = getattr(memory_handler, method)(query)
+                assert resp.model_dump(
+                    exclude={"service_meta_"}
+                ) == expected.model_dump(exclude={"service_meta_"}), (method, query)
+
+    async_handler = AsyncQueryHandler(AsyncMemoryDatabase(database=memory_db))
+    resp = asyncio.run(async_handler.normalize("BRAF"))
+    assert resp.model_dump(exclude={"service_meta_"}) == handler.normalize(
+        "BRAF"
+    ).model_dump(exclude={"service_meta_"})
+
+    with pytest.raises(NotImplementedError):
+        memory_db.delete_source(SourceName.HGNC)
+
+
+def test_transform_location(database):
+    """Test that precomputed locations are served as-is, and that locations stored in
+    the older format are still converted.
+    """
+    handler = QueryHandler(database)
+    legacy_location = {
+        "type": "SequenceLocation",
+        "start": 140719326,
+        "end": 140924976,
+        "sequence_id": "ga4gh:SQ.F-LrLMe1SRpfUZHkQmvkVKFEGaoDeHul",
+    }
+    expected = {
+        "id": "ga4gh:SL.RP5AA2xw_g5TqFJ8ytz8hKef7jUbzJYX",
+        "type": "SequenceLocation",
+        "digest": "RP5AA2xw_g5TqFJ8ytz8hKef7jUbzJYX",
+        "sequenceReference": {
+            "type": "SequenceReference",
+            "refgetAccession": "SQ.F-LrLMe1SRpfUZHkQmvkVKFEGaoDeHul",
+        },
+        "start": 140719326,
+        "end": 140924976,
+    }
+    assert handler._transform_location(legacy_location) == expected
+
+    stored_location = {
+        **expected,
+        "start": Decimal(140719326),
+        "end": Decimal(140924976),
+    }
+    transformed = handler._transform_location(stored_location)
+    assert transformed == expected
+    assert type(transformed["start"]) is int
+
+    record = database.get_record_by_id("ensembl:ENSG00000157764")
+    assert record["locations"][0]["id"] == expected["id"]
+
+
+def test_term_filter(database):
+    """Test that queries ruled out by the term filter skip the database."""
+    q = QueryHandler(database)
+    assert q.normalize("BRAF").match_type == MatchType.SYMBOL
+    assert q.term_filter is not None
+    assert q.term_filter.data_version == database.get_data_version()
+
+    def fail(terms, *args, **kwargs):
+        assert not terms
+        return []
+
+    lookups = (
+        "get_record_by_id",
+        "get_records_by_ids",
+        "get_refs_by_type",
+        "get_refs_by_terms",
+    )
+    originals = {name: getattr(database, name) for name in lookups}
+    try:
+        for name in lookups:
+            setattr(database, name, fail)
+        assert q.normalize("not_a_gene").match_type == MatchType.NO_MATCH
+        assert [r.match_type for r in q.normalize_batch(["not_a_gene"])] == [
+            MatchType.NO_MATCH
+        ]
+        resp = q.search("not_a_gene")
+        assert all(not m.records for m in resp.source_matches.values())
+    finally:
+        for name, method in originals.items():
+            setattr(database, name, method)
+
+    # filters built from other data versions are ignored
+    q._set_term_filter(BloomFilter.from_items([], "old").to_bytes(), "new")
+    assert q.term_filter is None